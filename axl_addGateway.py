@@ -256,13 +256,22 @@ input("Press Enter to continue...")
 
 # There is currently not a good way to retrieve the endpoints associated
 # a MGCP gateway using regular AXL requests - <executeSQLQuery> will be used.
+# Rather than retrieving each endpoint via <getGatewayEndpointAnalogAccess>,
+# a single query joins the gateway's ports (mgcpdevicemember) to the endpoint
+# devices and their DNs (device -> devicenumplanmap -> numplan).
 
 # Raw UUID values in the CUCM database are stored without braces ("{}")
 # and in lower case - regular AXL requests normalize these by uppercasing
 # and surrouding with braces.  This must be undone to use the uuid in
 # an <executeSQLQuery> request.
 raw_uuid = gateway["uuid"].lower()[1:-1]
-sql = f"SELECT * FROM mgcpdevicemember WHERE fkmgcp='{raw_uuid}'"
+sql = f"""SELECT d.name, n.dnorpattern
+            FROM mgcpdevicemember AS m
+            JOIN device AS d ON m.fkdevice = d.pkid
+            LEFT OUTER JOIN devicenumplanmap AS dnm ON dnm.fkdevice = d.pkid
+            LEFT OUTER JOIN numplan AS n ON dnm.fknumplan = n.pkid
+            WHERE m.fkmgcp = '{raw_uuid}'
+            ORDER BY m.slot, m.subunit, m.port, dnm.numplanindex"""
 try:
     resp = service.executeSQLQuery(sql=sql)
 
@@ -270,10 +279,10 @@ except Fault as err:
     print(f"Zeep error: executeSQLQuery: { err }")
     sys.exit(1)
 
-ports = resp["return"]["row"]
+ports = resp["return"]["row"] if resp["return"] else []
 
 print("\nexecuteSQLQuery: Success")
-print(f"\n==> Port count: { len(ports) }\n")
+print(f"\n==> Port/line count: { len(ports) }\n")
 
 input("Press Enter to continue...")
 
@@ -284,8 +293,6 @@ print(f"Domain: { gateway['domainName']}\n")
 print("End-Point Name          Port DN     ")
 print("----------------------- ------------")
 
-# Get details for each port and print the details
-
 
 # <executeSQLQuery> return is an "xsd:any" type, which Zeep models
 # as a array of rows, with database column name as the tag property.
@@ -295,16 +302,10 @@ def get_column(tag, row):
     return element[0].text if len(element) > 0 else None
 
 
+# Print the details for each port/line
 for port in ports:
-    try:
-        resp = service.getGatewayEndpointAnalogAccess(uuid=get_column("fkdevice", port))
-    except Fault as err:
-        print(f"Zeep error: getGatewayEndpointAnalogAccess: { err }")
-        sys.exit(1)
-    name = resp["return"]["gatewayEndpointAnalogAccess"]["endpoint"]["name"]
-    dn = resp["return"]["gatewayEndpointAnalogAccess"]["endpoint"]["port"]["lines"][
-        "line"
-    ]["dirn"]["pattern"]
+    name = get_column("name", port)
+    dn = get_column("dnorpattern", port) or ""
     print(f"{name.rjust(23)} {dn.rjust(12)}")
 
 input("\nPress Enter to continue...")
@@ -0,0 +1,310 @@
+"""AXL bulk provisioning sample script, using the Zeep SOAP library
+
+Provisions a batch of users/lines/phones by building a dependency graph of
+AXL requests (partitions before CSSs, lines before phones, phones before
+user association) and executing each request as soon as its dependencies
+have completed, running independent requests concurrently over a bounded
+thread pool.  If a request fails, only the requests depending on it are
+skipped.  Finally all created objects are removed, using the same scheduler
+with the dependencies reversed.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from graphlib import TopologicalSorter
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Number of test seats (user + line + phone) to provision
+SEAT_COUNT = 25
+
+# Maximum number of concurrent AXL requests
+MAX_WORKERS = 8
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+
+class Node:
+    """A single AXL request in the provisioning graph
+
+    key uniquely identifies the node, e.g. ( 'line', '9876500001' ), and
+    requires lists the keys of the nodes which must complete first.  remove
+    is the ( operation, kwargs ) request that reverses this one, if any.
+    """
+
+    def __init__( self, key, operation, payload, requires = ( ), remove = None ):
+
+        self.key = key
+        self.operation = operation
+        self.payload = payload
+        self.requires = list( requires )
+        self.remove = remove
+
+class DagScheduler:
+    """Executes a graph of Nodes, running independent requests concurrently"""
+
+    def __init__( self, service, max_workers ):
+
+        self.service = service
+        self.max_workers = max_workers
+
+    def _execute( self, operation, payload ):
+
+        return getattr( self.service, operation )( **payload )
+
+    def run( self, nodes, reverse = False ):
+        """Execute the nodes in dependency order, or in reverse order via each
+        node's remove request.  Returns a dict of key: ( status, detail )"""
+
+        by_key = { node.key: node for node in nodes }
+        graph = { node.key: set( ) for node in nodes }
+
+        for node in nodes:
+            for required in node.requires:
+                if required not in by_key:
+                    raise ValueError( f'{ node.key } requires unknown node { required }' )
+                if reverse:
+                    graph[ required ].add( node.key )
+                else:
+                    graph[ node.key ].add( required )
+
+        # Raises graphlib.CycleError if the graph has circular dependencies
+        sorter = TopologicalSorter( graph )
+        sorter.prepare()
+
+        results = { }
+        running = { }
+
+        with ThreadPoolExecutor( max_workers = self.max_workers ) as executor:
+
+            while sorter.is_active():
+
+                ready = sorter.get_ready()
+
+                for key in ready:
+                    node = by_key[ key ]
+                    request = node.remove if reverse else ( node.operation, node.payload )
+                    if request is None:
+                        # Nothing to execute (e.g. no remove for an update), but
+                        # nodes depending on this one can proceed
+                        results[ key ] = ( 'noop', None )
+                        sorter.done( key )
+                        continue
+                    running[ executor.submit( self._execute, *request ) ] = key
+
+                if not running:
+                    # If only no-op nodes were ready, check for newly ready nodes,
+                    # otherwise the remaining nodes are blocked by failures
+                    if ready:
+                        continue
+                    break
+
+                done, _ = wait( running, return_when = FIRST_COMPLETED )
+
+                for future in done:
+                    key = running.pop( future )
+                    try:
+                        results[ key ] = ( 'ok', future.result() )
+                    except Exception as err:
+                        # Faults, transport errors and timeouts all fail the node;
+                        # not marking it done leaves its dependents blocked
+                        results[ key ] = ( 'failed', err )
+                        continue
+                    sorter.done( key )
+
+        # Anything left never became ready due to an upstream failure
+        for key in by_key:
+            results.setdefault( key, ( 'skipped', None ) )
+
+        return results
+
+def summarize( results ):
+
+    counts = { }
+    for status, detail in results.values():
+        counts[ status ] = counts.get( status, 0 ) + 1
+    for key, ( status, detail ) in results.items():
+        if status == 'failed':
+            print( f'    { key }: { detail }' )
+    print( '    ' + ', '.join( f'{ status }: { count }' for status, count in sorted( counts.items() ) ) )
+
+# Build the provisioning graph
+
+partitions = [ 'testBulkPT1', 'testBulkPT2' ]
+css = 'testBulkCSS'
+
+nodes = [ ]
+
+for partition in partitions:
+    nodes.append( Node( ( 'partition', partition ), 'addRoutePartition',
+        { 'routePartition': { 'name': partition, 'description': 'Bulk provisioning test' } },
+        remove = ( 'removeRoutePartition', { 'name': partition } ) ) )
+
+nodes.append( Node( ( 'css', css ), 'addCss',
+    { 'css': { 'name': css, 'description': 'Bulk provisioning test',
+        'members': { 'member': [ { 'routePartitionName': partition, 'index': index + 1 }
+            for index, partition in enumerate( partitions ) ] } } },
+    requires = [ ( 'partition', partition ) for partition in partitions ],
+    remove = ( 'removeCss', { 'name': css } ) ) )
+
+for seat in range( 1, SEAT_COUNT + 1 ):
+
+    pattern = f'98765{ seat:05}'
+    phone_name = f'CSFBULK{ seat:04}'
+    userid = f'testBulkUser{ seat:04}'
+
+    nodes.append( Node( ( 'line', pattern ), 'addLine',
+        { 'line': { 'pattern': pattern, 'description': f'Bulk line { seat }', 'usage': 'Device',
+            'routePartitionName': partitions[ 0 ] } },
+        requires = [ ( 'partition', partitions[ 0 ] ) ],
+        remove = ( 'removeLine', { 'pattern': pattern, 'routePartitionName': partitions[ 0 ] } ) ) )
+
+    nodes.append( Node( ( 'phone', phone_name ), 'addPhone',
+        { 'phone': {
+            'name': phone_name,
+            'product': 'Cisco Unified Client Services Framework',
+            'class': 'Phone',
+            'protocol': 'SIP',
+            'protocolSide': 'User',
+            'devicePoolName': 'Default',
+            'callingSearchSpaceName': css,
+            'commonPhoneConfigName': 'Standard Common Phone Profile',
+            'locationName': 'Hub_None',
+            'useTrustedRelayPoint': 'Default',
+            'builtInBridgeStatus': 'Default',
+            'sipProfileName': 'Standard SIP Profile',
+            'packetCaptureMode': 'None',
+            'certificateOperation': 'No Pending Operation',
+            'deviceMobilityMode': 'Default',
+            'lines': { 'line': [ { 'index': 1,
+                'dirn': { 'pattern': pattern, 'routePartitionName': partitions[ 0 ] } } ] } } },
+        requires = [ ( 'line', pattern ), ( 'css', css ) ],
+        remove = ( 'removePhone', { 'name': phone_name } ) ) )
+
+    nodes.append( Node( ( 'user', userid ), 'addUser',
+        { 'user': {
+            'firstName': 'testBulk',
+            'lastName': f'User{ seat:04}',
+            'userid': userid,
+            'password': 'C1sco12345',
+            'pin': '123456',
+            'userLocale': 'English United States',
+            'associatedGroups': { 'userGroup': [ { 'name': 'Standard CCM End Users' } ] },
+            'associatedDevices': { 'device': [ phone_name ] },
+            'presenceGroupName': 'Standard Presence group' } },
+        requires = [ ( 'phone', phone_name ) ],
+        remove = ( 'removeUser', { 'userid': userid } ) ) )
+
+    # Set the phone owner and line/user association once the user exists
+    nodes.append( Node( ( 'association', phone_name ), 'updatePhone',
+        { 'name': phone_name, 'ownerUserName': userid,
+            'lines': { 'line': [ { 'index': 1,
+                'dirn': { 'pattern': pattern, 'routePartitionName': partitions[ 0 ] },
+                'associatedEndusers': { 'enduser': [ { 'userId': userid } ] } } ] } },
+        requires = [ ( 'user', userid ), ( 'phone', phone_name ) ] ) )
+
+scheduler = DagScheduler( service, MAX_WORKERS )
+
+print( f'\nProvisioning { SEAT_COUNT } seats ({ len( nodes ) } requests)...' )
+
+start = time.perf_counter()
+results = scheduler.run( nodes )
+
+print( f'\nProvisioning complete ({ time.perf_counter() - start:.1f} sec):' )
+summarize( results )
+
+input( '\nPress Enter to continue...' )
+
+# Cleanup the objects we just created, only for nodes which succeeded
+created = [ node for node in nodes if results[ node.key ][ 0 ] == 'ok' ]
+for node in created:
+    node.requires = [ key for key in node.requires if results[ key ][ 0 ] == 'ok' ]
+
+start = time.perf_counter()
+results = scheduler.run( created, reverse = True )
+
+print( f'\nCleanup complete ({ time.perf_counter() - start:.1f} sec):' )
+summarize( results )
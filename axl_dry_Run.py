@@ -0,0 +1,227 @@
+"""AXL dry-run compile sample script, using the Zeep SOAP library
+
+Validates and serializes a change set of AXL requests offline, without
+contacting CUCM, so broken records are found before the maintenance window
+rather than halfway through it.  For every request, Zeep serializes the
+envelope via client.create_message() (checking structure, required
+elements and element names), and the request body is validated against
+schema/AXLSoap.xsd with strict enumerations from AXLEnums.xsd.  Errors and
+envelope sizes are reported.  Records are checked in parallel across all CPU
+cores using a process pool.
+
+The change set is a JSONL file with one request per line, e.g.:
+
+    {"operation": "addLine", "kwargs": {"line": {"pattern": "1000", "usage": "Device"}}}
+
+Usage: python axl_dry_Run.py [changeset.jsonl]
+
+If no file is given, a sample change set is generated, including a few
+deliberately broken records.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import json
+import sys
+import time
+
+from zeep import Client, Settings
+from zeep.exceptions import Error
+from zeep.wsdl.utils import etree_to_string
+
+# The WSDL and XSD files are local files in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+SOAP_XSD_FILE = 'schema/AXLSoap.xsd'
+ENUMS_XSD_FILE = 'schema/AXLEnums.xsd'
+
+# Number of seats in the generated sample change set (4 requests per seat)
+SAMPLE_SEATS = 2500
+
+# Number of records sent to a worker process at a time
+CHUNK_SIZE = 250
+
+# Maximum number of errors to print
+MAX_ERRORS_SHOWN = 20
+
+XSD = '{http://www.w3.org/2001/XMLSchema}'
+SOAP_ENV = '{http://schemas.xmlsoap.org/soap/envelope/}'
+
+def load_strict_schema():
+    """Load AXLSoap.xsd as an lxml XMLSchema, with strict enumerations
+
+    Enumerated AXLSoap.xsd types are defined as a union of the enumeration and
+    any string, so any value validates.  Replace each such union with the
+    enumeration from AXLEnums.xsd (or AXLSoap.xsd if not found there).
+    """
+
+    parser = etree.XMLParser( huge_tree = True )
+    soap = etree.parse( SOAP_XSD_FILE, parser )
+    enums = etree.parse( ENUMS_XSD_FILE, parser )
+
+    enum_restrictions = { simple.get( 'name' ): simple.find( f'{ XSD }restriction' )
+        for simple in enums.getroot().iterfind( f'{ XSD }simpleType' ) }
+
+    for simple in soap.getroot().iterfind( f'{ XSD }simpleType' ):
+        union = simple.find( f'{ XSD }union' )
+        if union is None or union.get( 'memberTypes' ):
+            continue
+        members = [ member.find( f'{ XSD }restriction' ) for member in union ]
+        # Only unions with an unrestricted xsd:string member are relaxed
+        if not any( member is not None and len( member ) == 0 for member in members ):
+            continue
+        restriction = enum_restrictions.get( simple.get( 'name' ) )
+        if restriction is None:
+            restriction = next( ( member for member in members if member is not None and len( member ) ), None )
+        if restriction is not None:
+            simple.replace( union, copy.deepcopy( restriction ) )
+
+    return etree.XMLSchema( soap )
+
+# Per-process Zeep client/service and schema, created by init_worker()
+client = service = schema = None
+
+def init_worker():
+
+    global client, service, schema
+
+    # strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+    settings = Settings( strict = False, xml_huge_tree = True )
+
+    # No requests are sent, so the service address is just a placeholder
+    client = Client( WSDL_FILE, settings = settings )
+    service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                    'https://dry-run:8443/axl/' )
+    schema = load_strict_schema()
+
+def check_record( record ):
+    """Serialize/validate one ( number, line ) record: returns ( number, size, error )"""
+
+    number, line = record
+
+    try:
+        request = json.loads( line )
+        envelope = client.create_message( service, request[ 'operation' ], **request.get( 'kwargs', { } ) )
+    except ( Error, TypeError, ValueError, KeyError ) as err:
+        # Zeep appends the full type signature to unexpected-argument errors
+        message = str( err ).split( '. Signature:' )[ 0 ]
+        return number, 0, f'{ type( err ).__name__ }: { message }'
+
+    body = envelope.find( f'{ SOAP_ENV }Body' )[ 0 ]
+
+    if not schema.validate( body ):
+        error = schema.error_log.last_error
+        return number, 0, f'XSD: { error.message }'
+
+    return number, len( etree_to_string( envelope ) ), None
+
+def sample_changeset():
+    """Generate a sample change set (as JSONL lines), with a few broken records"""
+
+    for seat in range( SAMPLE_SEATS ):
+
+        pattern = f'98765{ seat:05}'
+        phone_name = f'CSFDRY{ seat:05}'
+        userid = f'testDryRun{ seat:05}'
+
+        yield json.dumps( { 'operation': 'addLine', 'kwargs': { 'line': {
+            'pattern': pattern, 'description': f'Dry run line { seat }',
+            # Deliberately broken: invalid enumeration value
+            'usage': 'Devise' if seat == 17 else 'Device',
+            'routePartitionName': None } } } )
+
+        phone = {
+            'name': phone_name,
+            'product': 'Cisco Unified Client Services Framework',
+            'class': 'Phone',
+            'protocol': 'SIP',
+            'protocolSide': 'User',
+            'devicePoolName': 'Default',
+            'commonPhoneConfigName': 'Standard Common Phone Profile',
+            'locationName': 'Hub_None',
+            'useTrustedRelayPoint': 'Default',
+            'builtInBridgeStatus': 'Default',
+            'sipProfileName': 'Standard SIP Profile',
+            'packetCaptureMode': 'None',
+            'certificateOperation': 'No Pending Operation',
+            'deviceMobilityMode': 'Default',
+            'lines': { 'line': [ { 'index': 1, 'dirn': { 'pattern': pattern, 'routePartitionName': None } } ] }
+        }
+
+        # Deliberately broken: element not in the schema
+        if seat == 1234:
+            phone[ 'model' ] = 'Cisco Unified Client Services Framework'
+
+        yield json.dumps( { 'operation': 'addPhone', 'kwargs': { 'phone': phone } } )
+
+        user = { 'userid': userid, 'firstName': 'Dry', 'lastName': f'Run { seat }',
+            'presenceGroupName': 'Standard Presence group',
+            'associatedDevices': { 'device': [ phone_name ] } }
+
+        # Deliberately broken: missing required element
+        if seat == 2000:
+            del user[ 'lastName' ]
+
+        yield json.dumps( { 'operation': 'addUser', 'kwargs': { 'user': user } } )
+
+        yield json.dumps( { 'operation': 'updatePhone', 'kwargs': {
+            'name': phone_name, 'ownerUserName': userid } } )
+
+def read_changeset( filename ):
+
+    with open( filename ) as changeset:
+        for line in changeset:
+            if line.strip():
+                yield line
+
+if __name__ == '__main__':
+
+    lines = read_changeset( sys.argv[ 1 ] ) if len( sys.argv ) > 1 else sample_changeset()
+
+    print( '\nChecking change set...' )
+
+    start = time.perf_counter()
+
+    count = total_bytes = largest = 0
+    errors = [ ]
+
+    # Each worker process loads the WSDL/XSDs once, then checks records in chunks
+    with ProcessPoolExecutor( initializer = init_worker ) as executor:
+        for number, size, error in executor.map( check_record, enumerate( lines, start = 1 ),
+                chunksize = CHUNK_SIZE ):
+            count += 1
+            if error:
+                errors.append( ( number, error ) )
+            total_bytes += size
+            largest = max( largest, size )
+
+    elapsed = time.perf_counter() - start
+
+    for number, error in errors[ :MAX_ERRORS_SHOWN ]:
+        print( f'    Record { number }: { error }' )
+
+    if len( errors ) > MAX_ERRORS_SHOWN:
+        print( f'    ...and { len( errors ) - MAX_ERRORS_SHOWN } more errors' )
+
+    print( f'\nChecked { count } records in { elapsed:.1f} sec: { len( errors ) } errors' )
+    print( f'Envelope sizes: { total_bytes } bytes total, { largest } bytes largest, '
+        f'{ total_bytes // max( count - len( errors ), 1 ) } bytes average' )
+
+    sys.exit( 1 if errors else 0 )
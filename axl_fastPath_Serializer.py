@@ -0,0 +1,314 @@
+"""AXL fast-path envelope serializer sample script, using the Zeep SOAP library
+
+For high-volume operations (<addLine>, <updatePhone>, <executeSQLQuery>,
+<listChange>) Zeep walks the full XSD type tree for every request it
+serializes.  This sample 'precompiles' an operation once: Zeep serializes a
+sample payload in which the per-request fields are replaced by unique
+placeholder tokens, and the resulting envelope bytes are split into a list of
+constant fragments.  Each later request is rendered by simply joining the
+fragments with the XML-escaped field values, producing output byte-identical
+to Zeep's, and is posted via the Zeep transport.  Responses are still parsed
+by Zeep.
+
+The script first benchmarks/verifies the fast path against Zeep offline, then
+adds and removes a few test lines via the fast path.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+import copy
+import re
+import sys
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+from zeep.wsdl.utils import etree_to_string
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Number of envelopes to render for the offline benchmark
+BENCHMARK_COUNT = 2000
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+# Matches the placeholder tokens substituted into the sample payload
+TOKEN = re.compile( rb'@@FASTPATH(\d+)@@' )
+
+# lxml escapes element text and attribute values differently, so keep
+# a translation table for each
+TEXT_ESCAPES = str.maketrans( { '&': '&amp;', '<': '&lt;', '>': '&gt;', '\r': '&#13;' } )
+ATTR_ESCAPES = str.maketrans( { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;',
+    '\n': '&#10;', '\t': '&#9;', '\r': '&#13;' } )
+
+def set_path( payload, path, value ):
+    """Set the value at a dotted path (list indexes allowed) in a nested payload"""
+
+    keys = path.split( '.' )
+    for key in keys[ :-1 ]:
+        payload = payload[ int( key ) ] if isinstance( payload, list ) else payload[ key ]
+    last = keys[ -1 ]
+    if isinstance( payload, list ):
+        payload[ int( last ) ] = value
+    else:
+        payload[ last ] = value
+
+class FastPathSerializer:
+    """Precompiled envelope for one AXL operation
+
+    sample is a complete example payload (the keyword arguments for the
+    operation), fields is the list of dotted paths to the string values that
+    vary per request.  Every other value in the sample is baked into the
+    precompiled envelope, and the variable fields must always be present and
+    string-valued, so the envelope structure never changes.
+    """
+
+    def __init__( self, client, service, operation, sample, fields ):
+
+        self.client = client
+        self.service = service
+        self.address = service._binding_options[ 'address' ]
+        self.binding = service._binding
+        self.operation = self.binding.get( operation )
+        self.fields = list( fields )
+
+        # Let Zeep serialize the sample once, with placeholder tokens for the
+        # variable fields.  Zeep validates the sample against the schema here
+        templated = copy.deepcopy( sample )
+        for index, path in enumerate( self.fields ):
+            set_path( templated, path, f'@@FASTPATH{ index }@@' )
+        envelope = client.create_message( service, operation, **templated )
+        template = etree_to_string( envelope )
+
+        self.headers = self.operation.create( **templated ).headers
+        self.headers[ 'Content-Type' ] = 'text/xml; charset=utf-8'
+
+        # Split the serialized envelope into constant fragments, recording which
+        # field (and which escaping) belongs in each gap
+        self.fragments = [ ]
+        self.slots = [ ]
+        position = 0
+        for match in TOKEN.finditer( template ):
+            fragment = template[ position:match.start() ]
+            self.fragments.append( fragment )
+            escapes = ATTR_ESCAPES if fragment.endswith( b'="' ) else TEXT_ESCAPES
+            self.slots.append( ( int( match.group( 1 ) ), escapes ) )
+            position = match.end()
+        self.fragments.append( template[ position: ] )
+
+        if len( self.slots ) != len( self.fields ):
+            raise ValueError( f'{ operation }: each field must appear exactly once in the envelope' )
+
+    def render( self, values ):
+        """Render the envelope bytes for a list of field values (in fields order)"""
+
+        parts = [ self.fragments[ 0 ] ]
+        for ( index, escapes ), fragment in zip( self.slots, self.fragments[ 1: ] ):
+            parts.append( values[ index ].translate( escapes ).encode( 'utf-8' ) )
+            parts.append( fragment )
+        return b''.join( parts )
+
+    def verify( self, sample, values ):
+        """Confirm the fast path output is byte-identical to Zeep's serialization"""
+
+        payload = copy.deepcopy( sample )
+        for path, value in zip( self.fields, values ):
+            set_path( payload, path, value )
+        envelope = self.client.create_message( self.service, self.operation.name, **payload )
+        return etree_to_string( envelope ) == self.render( values )
+
+    def __call__( self, *values ):
+        """Send the request and let Zeep parse the reply as usual"""
+
+        response = self.client.transport.post( self.address, self.render( values ), self.headers )
+        return self.binding.process_reply( self.client, self.operation, response )
+
+# Sample payloads and variable fields for the hot operations
+
+add_line_sample = {
+    'line': {
+        'pattern': '0000',
+        'description': 'Fast path line',
+        'usage': 'Device',
+        'alertingName': 'Fast path line',
+        'asciiAlertingName': 'Fast path line'
+    }
+}
+
+update_phone_sample = {
+    'name': 'SEP000000000000',
+    'description': 'Fast path phone',
+    'ownerUserName': 'nobody'
+}
+
+sql_query_sample = {
+    'sql': 'SELECT 1 FROM systables WHERE tabid = 1'
+}
+
+list_change_sample = {
+    'startChangeId': {
+        'queueId': 'queue',
+        '_value_1': '0'
+    }
+}
+
+serializers = {
+    'addLine': FastPathSerializer( client, service, 'addLine', add_line_sample,
+        [ 'line.pattern', 'line.description', 'line.alertingName', 'line.asciiAlertingName' ] ),
+    'updatePhone': FastPathSerializer( client, service, 'updatePhone', update_phone_sample,
+        [ 'name', 'description', 'ownerUserName' ] ),
+    'executeSQLQuery': FastPathSerializer( client, service, 'executeSQLQuery', sql_query_sample,
+        [ 'sql' ] ),
+    'listChange': FastPathSerializer( client, service, 'listChange', list_change_sample,
+        [ 'startChangeId.queueId', 'startChangeId._value_1' ] )
+}
+
+# Values exercising the escaping rules for each operation
+check_values = {
+    'addLine': [ '\\+14085551234', 'R&D <lab> "line"', 'Zoë\'s line', 'Zoe\'s line' ],
+    'updatePhone': [ 'SEP0011AABBCCDD', 'Tab\tand\r\nnewline', 'jdoe' ],
+    'executeSQLQuery': [ 'SELECT name FROM device WHERE name LIKE "SEP%" AND tkclass < 3' ],
+    'listChange': [ 'a"b&c\n', '12345' ]
+}
+
+print( '\nVerifying fast path output against Zeep:\n' )
+
+samples = {
+    'addLine': add_line_sample,
+    'updatePhone': update_phone_sample,
+    'executeSQLQuery': sql_query_sample,
+    'listChange': list_change_sample
+}
+
+for name, serializer in serializers.items():
+    identical = serializer.verify( samples[ name ], check_values[ name ] )
+    print( f'{ name.ljust( 16 ) } byte-identical: { identical }' )
+    if not identical:
+        sys.exit( 1 )
+
+# Compare the cost of rendering many addLine envelopes each way
+serializer = serializers[ 'addLine' ]
+
+start = time.perf_counter()
+for x in range( BENCHMARK_COUNT ):
+    payload = copy.deepcopy( add_line_sample )
+    payload[ 'line' ][ 'pattern' ] = str( 100000 + x )
+    etree_to_string( client.create_message( service, 'addLine', **payload ) )
+zeep_time = time.perf_counter() - start
+
+start = time.perf_counter()
+for x in range( BENCHMARK_COUNT ):
+    serializer.render( [ str( 100000 + x ), 'Fast path line', 'Fast path line', 'Fast path line' ] )
+fast_time = time.perf_counter() - start
+
+print( f'\nRendered { BENCHMARK_COUNT } addLine envelopes:' )
+print( f'    Zeep:      { zeep_time:.3f} sec' )
+print( f'    Fast path: { fast_time:.3f} sec ({ zeep_time / fast_time:.0f}x)' )
+
+input( '\nPress Enter to continue...' )
+
+# Add a few test lines via the fast path
+patterns = [ '9876543220', '9876543221', '9876543222' ]
+
+for pattern in patterns:
+    try:
+        resp = serializer( pattern, f'Fast path line { pattern }', 'Fast path line', 'Fast path line' )
+    except Fault as err:
+        print( f'Zeep error: addLine (fast path): { err }' )
+        sys.exit( 1 )
+
+    print( f'\naddLine (fast path) response for { pattern }:' )
+    print( resp )
+
+input( '\nPress Enter to continue...' )
+
+# Cleanup the objects we just created
+
+for pattern in patterns:
+    try:
+        resp = service.removeLine( pattern = pattern, routePartitionName = None )
+    except Fault as err:
+        print( f'Zeep error: removeLine: { err }' )
+        sys.exit( 1 )
+
+    print( f'\nremoveLine response for { pattern }:' )
+    print( resp )
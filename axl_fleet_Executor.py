@@ -0,0 +1,220 @@
+"""AXL multi-cluster fleet executor sample script, using the Zeep SOAP library
+
+The other samples target a single CUCM cluster, specified in .env.  This
+sample runs the same AXL request or SQL query across a fleet of clusters
+concurrently, streaming back results tagged with the cluster name as each
+cluster responds.
+
+The fleet is described by an inventory JSON file (see
+fleet_inventory.json.example): a list of clusters, each with a name,
+address, AXL username, the name of the environment variable holding the
+AXL password (e.g. in .env), and AXL schema version.
+
+Parsing the AXL WSDL/XSDs takes several seconds and a lot of memory, so it
+is done once per schema version (from schema/<version>/ if present,
+otherwise schema/) and the parsed WSDL document is shared by all clusters'
+Zeep clients.  Each cluster gets its own warm session/transport, kept open
+for all requests to that cluster.
+
+Usage: python axl_fleet_Executor.py [inventory.json]
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import json
+import sys
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault, TransportError
+from requests.exceptions import RequestException
+
+# Edit .env file to specify the AXL passwords referenced by the inventory
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The inventory of clusters
+INVENTORY_FILE = sys.argv[ 1 ] if len( sys.argv ) > 1 else 'fleet_inventory.json'
+
+# Schema directory; version specific schemas can be placed in schema/<version>/
+SCHEMA_DIR = 'schema'
+
+# Maximum number of clusters handled concurrently
+MAX_WORKERS = 16
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# <executeSQLQuery> return is an "xsd:any" type, which Zeep models
+# as a array of rows, with database column name as the tag property.
+def get_column( tag, row ):
+    element = list( filter( lambda x: x.tag == tag, row ) )
+    return element[ 0 ].text if len( element ) > 0 else None
+
+class FleetExecutor:
+    """Runs AXL requests across many clusters, with one warm Zeep client per
+    cluster sharing a parsed WSDL per schema version"""
+
+    def __init__( self, inventory, max_workers = MAX_WORKERS ):
+        self.max_workers = max_workers
+        self.documents = { }
+        self.services = { }
+
+        for cluster in inventory:
+            self.services[ cluster[ 'name' ] ] = self._create_service( cluster )
+
+    def _wsdl( self, version ):
+        """Returns the parsed WSDL document for a schema version, parsing it once"""
+
+        directory = os.path.join( SCHEMA_DIR, version or '' )
+        if not os.path.exists( os.path.join( directory, 'AXLAPI.wsdl' ) ):
+            directory = SCHEMA_DIR
+
+        if directory not in self.documents:
+            self.documents[ directory ] = Client( os.path.join( directory, 'AXLAPI.wsdl' ),
+                settings = settings ).wsdl
+
+        return self.documents[ directory ]
+
+    def _create_service( self, cluster ):
+
+        session = Session()
+
+        # To enable SSL cert checking (recommended for production)
+        # set verify to the CUCM Tomcat cert .pem file for each cluster
+        session.verify = cluster.get( 'verify', False )
+
+        session.auth = HTTPBasicAuth( cluster[ 'username' ],
+            os.getenv( cluster.get( 'passwordEnv', 'AXL_PASSWORD' ) ) )
+
+        # One pooled connection per concurrent request to this cluster
+        session.mount( 'https://', HTTPAdapter( pool_maxsize = self.max_workers ) )
+
+        transport = Transport( session = session, timeout = 10, operation_timeout = 60 )
+
+        # Passing the parsed WSDL document shares it between clients
+        client = Client( self._wsdl( cluster.get( 'version' ) ), settings = settings,
+            transport = transport, plugins = plugin )
+
+        return client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                    f'https://{ cluster[ "address" ] }:8443/axl/' )
+
+    def run( self, operation, *args, clusters = None, **kwargs ):
+        """Executes the request on each cluster (default all) concurrently.
+
+        Yields ( cluster name, response, error ) as each cluster completes;
+        error is None on success.
+        """
+
+        def call( name ):
+            try:
+                return name, getattr( self.services[ name ], operation )( *args, **kwargs ), None
+            except ( Fault, TransportError, RequestException ) as err:
+                return name, None, err
+
+        with ThreadPoolExecutor( max_workers = self.max_workers ) as executor:
+            futures = [ executor.submit( call, name ) for name in clusters or self.services ]
+            for future in as_completed( futures ):
+                yield future.result()
+
+    def sql( self, query, clusters = None ):
+        """Executes an <executeSQLQuery> on each cluster concurrently.
+
+        Yields ( cluster name, rows, error ) as each cluster completes.
+        """
+
+        for name, resp, err in self.run( 'executeSQLQuery', query, clusters = clusters ):
+            rows = resp[ 'return' ][ 'row' ] if resp and resp[ 'return' ] else [ ]
+            yield name, rows, err
+
+try:
+    with open( INVENTORY_FILE ) as inventory_file:
+        inventory = json.load( inventory_file )
+except FileNotFoundError:
+    print( f'Inventory file { INVENTORY_FILE } not found: copy fleet_inventory.json.example '
+        'to fleet_inventory.json and edit it to describe your clusters' )
+    sys.exit( 1 )
+
+print( f'\nLoading schemas and creating clients for { len( inventory ) } cluster(s)...' )
+
+fleet = FleetExecutor( inventory )
+
+print( f'\nSchemas parsed: { len( fleet.documents ) }' )
+
+# Retrieve the CUCM version of every cluster
+
+print( '\n<getCCMVersion> results:\n' )
+
+for name, resp, err in fleet.run( 'getCCMVersion' ):
+    if err:
+        print( f'    { name:20} ERROR: { err }' )
+    else:
+        print( f'    { name:20} { resp[ "return" ][ "componentVersion" ][ "version" ] }' )
+
+input( '\nPress Enter to continue...' )
+
+# Count phones per device pool on every cluster
+
+query = '''SELECT dp.name AS devicepool, COUNT(*) AS phones
+    FROM device AS d INNER JOIN devicepool AS dp ON dp.pkid = d.fkdevicepool
+    WHERE d.tkclass = 1
+    GROUP BY dp.name ORDER BY dp.name'''
+
+print( '\nPhones per device pool:\n' )
+
+for name, rows, err in fleet.sql( query ):
+    if err:
+        print( f'    { name:20} ERROR: { err }' )
+        continue
+    for row in rows:
+        print( f'    { name:20} { get_column( "devicepool", row ):32} { get_column( "phones", row ):>8}' )
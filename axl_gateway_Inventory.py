@@ -0,0 +1,186 @@
+"""AXL MGCP gateway inventory sample script, using the Zeep SOAP library
+
+Produces an inventory of all MGCP gateway endpoints and their DNs.  Rather
+than one <getGatewayEndpointAnalogAccess> request per port, endpoints and DNs
+are resolved with a single <executeSQLQuery> joining mgcpdevicemember ->
+device -> devicenumplanmap -> numplan for a batch of gateways, and batches
+are queried concurrently.  Results are written to a CSV file as each batch
+completes.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import csv
+import sys
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Number of gateways covered by each <executeSQLQuery>, keeping responses
+# well under the AXL SQL query size limits
+GATEWAYS_PER_QUERY = 50
+
+# Maximum number of concurrent <executeSQLQuery> requests
+MAX_WORKERS = 4
+
+# Output file for the inventory
+OUTPUT_FILE = 'gateway_inventory.csv'
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+
+# <executeSQLQuery> return is an "xsd:any" type, which Zeep models
+# as a array of rows, with database column name as the tag property.
+# We'll create a function to access this data in a more intuitive way
+def get_column( tag, row ):
+    element = list( filter( lambda x: x.tag == tag, row ) )
+    return element[ 0 ].text if len( element ) > 0 else None
+
+def sql_rows( sql ):
+    """Execute an <executeSQLQuery>, returning the (possibly empty) list of rows"""
+
+    resp = service.executeSQLQuery( sql )
+    return resp[ 'return' ][ 'row' ] if resp[ 'return' ] else [ ]
+
+# Columns returned by the endpoint query, in CSV output order
+COLUMNS = [ 'domainname', 'name', 'slot', 'subunit', 'port', 'dnorpattern', 'partition' ]
+
+def inventory_batch( gateway_pkids ):
+    """Retrieve all endpoints/DNs for a batch of gateways with a single query"""
+
+    # pkids come straight from the database, but quote them regardless
+    pkid_list = ','.join( "'" + pkid.replace( "'", "''" ) + "'" for pkid in gateway_pkids )
+
+    sql = f'''SELECT g.domainname, d.name, m.slot, m.subunit, m.port,
+                n.dnorpattern, rp.name AS partition
+                FROM mgcp AS g
+                JOIN mgcpdevicemember AS m ON m.fkmgcp = g.pkid
+                JOIN device AS d ON m.fkdevice = d.pkid
+                LEFT OUTER JOIN devicenumplanmap AS dnm ON dnm.fkdevice = d.pkid
+                LEFT OUTER JOIN numplan AS n ON dnm.fknumplan = n.pkid
+                LEFT OUTER JOIN routepartition AS rp ON n.fkroutepartition = rp.pkid
+                WHERE g.pkid IN ({ pkid_list })
+                ORDER BY g.domainname, m.slot, m.subunit, m.port, dnm.numplanindex'''
+
+    return [ [ get_column( column, row ) for column in COLUMNS ] for row in sql_rows( sql ) ]
+
+start = time.perf_counter()
+
+# Retrieve the pkids of all MGCP gateways
+try:
+    gateways = [ get_column( 'pkid', row ) for row in sql_rows( 'SELECT pkid FROM mgcp' ) ]
+except Fault as err:
+    print( f'Zeep error: executeSQLQuery (mgcp): { err }' )
+    sys.exit( 1 )
+
+print( f'\nMGCP gateways found: { len( gateways ) }' )
+
+batches = [ gateways[ x:x + GATEWAYS_PER_QUERY ] for x in range( 0, len( gateways ), GATEWAYS_PER_QUERY ) ]
+
+endpoint_count = 0
+
+# Query the batches concurrently, writing each batch as soon as it completes
+with open( OUTPUT_FILE, 'w', newline = '' ) as output, \
+        ThreadPoolExecutor( max_workers = MAX_WORKERS ) as executor:
+
+    writer = csv.writer( output )
+    writer.writerow( [ 'Gateway', 'End-Point Name', 'Slot', 'Subunit', 'Port', 'DN', 'Partition' ] )
+
+    futures = [ executor.submit( inventory_batch, batch ) for batch in batches ]
+
+    for future in as_completed( futures ):
+        try:
+            rows = future.result()
+        except Fault as err:
+            print( f'Zeep error: executeSQLQuery (endpoints): { err }' )
+            continue
+        writer.writerows( rows )
+        endpoint_count += len( rows )
+        print( f'    Batch complete: { len( rows ) } endpoint lines' )
+
+print( f'\nInventoried { endpoint_count } endpoint lines on { len( gateways ) } gateways '
+    f'in { len( batches ) + 1 } requests ({ time.perf_counter() - start:.1f} sec)' )
+print( f'Report written to: { OUTPUT_FILE }' )
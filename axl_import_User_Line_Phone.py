@@ -0,0 +1,376 @@
+"""AXL streaming user/line/phone import sample script, using the Zeep SOAP library
+
+Imports End Users, Lines and Phones from a CSV or JSONL file of any size.
+Records are streamed from the file into a bounded queue, which keeps memory
+use flat, and consumed by a pool of worker threads which execute the
+<addLine>/<addPhone>/<addUser> requests for each record.
+
+The outcome of every record is appended to a results log (JSONL).  If the
+import is interrupted, running it again resumes after the records already
+committed successfully.  Failed records are retried, skipping the objects
+created by the earlier attempt.  Finally the imported objects can be removed.
+
+Usage: python axl_import_User_Line_Phone.py [input.csv | input.jsonl]
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+import csv
+import json
+import queue
+import sys
+import threading
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Input file, with columns: userid, firstName, lastName, password, pin,
+# pattern, routePartitionName (optional), phoneName
+INPUT_FILE = sys.argv[ 1 ] if len( sys.argv ) > 1 else 'import_User_Line_Phone.csv'
+
+# Per-record results log, used to resume an interrupted import
+RESULTS_FILE = f'{ INPUT_FILE }.results.jsonl'
+
+# Number of worker threads executing AXL requests
+MAX_WORKERS = 8
+
+# Maximum number of records read ahead of the workers
+QUEUE_SIZE = 100
+
+# Requests executed for each record, in order
+STEPS = [ 'addLine', 'addPhone', 'addUser' ]
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+
+def read_records( filename ):
+    """Yield ( record number, record dict ) from a CSV or JSONL file, one at a time"""
+
+    with open( filename, newline = '' ) as input_file:
+
+        if filename.lower().endswith( '.jsonl' ):
+            records = ( json.loads( line ) for line in input_file if line.strip() )
+        else:
+            records = csv.DictReader( input_file )
+
+        for number, record in enumerate( records, start = 1 ):
+            yield number, record
+
+def read_committed( filename ):
+    """Return ( watermark, committed set, progress dict ) of imported records
+
+    Records complete out of order, so the results log is summarized as the
+    highest record number for which every earlier record was committed, plus
+    the (small) set of committed record numbers above it.  Progress maps each
+    failed record number to the steps its last attempt completed.
+    """
+
+    committed = set( )
+    progress = { }
+    if os.path.exists( filename ):
+        with open( filename ) as results_file:
+            for line in results_file:
+                result = json.loads( line )
+                if result[ 'status' ] == 'ok':
+                    committed.add( result[ 'record' ] )
+                    progress.pop( result[ 'record' ], None )
+                else:
+                    progress[ result[ 'record' ] ] = result[ 'completed' ]
+
+    watermark = 0
+    while watermark + 1 in committed:
+        watermark += 1
+        committed.discard( watermark )
+
+    return watermark, committed, progress
+
+def build_payloads( record ):
+    """Convert an input record to the <addLine>/<addPhone>/<addUser> payloads"""
+
+    partition = record.get( 'routePartitionName' ) or None
+
+    line = {
+        'pattern': record[ 'pattern' ],
+        'description': f'{ record[ "firstName" ] } { record[ "lastName" ] }',
+        'usage': 'Device',
+        'routePartitionName': partition
+    }
+
+    phone = {
+        'name': record[ 'phoneName' ],
+        'description': f'{ record[ "firstName" ] } { record[ "lastName" ] }',
+        'product': 'Cisco Unified Client Services Framework',
+        'class': 'Phone',
+        'protocol': 'SIP',
+        'protocolSide': 'User',
+        'devicePoolName': 'Default',
+        'commonPhoneConfigName': 'Standard Common Phone Profile',
+        'locationName': 'Hub_None',
+        'useTrustedRelayPoint': 'Default',
+        'builtInBridgeStatus': 'Default',
+        'sipProfileName': 'Standard SIP Profile',
+        'packetCaptureMode': 'None',
+        'certificateOperation': 'No Pending Operation',
+        'deviceMobilityMode': 'Default',
+        'lines': {
+            'line': [
+                {
+                    'index': 1,
+                    'dirn': {
+                        'pattern': record[ 'pattern' ],
+                        'routePartitionName': partition
+                    }
+                }
+            ]
+        }
+    }
+
+    end_user = {
+        'firstName': record[ 'firstName' ],
+        'lastName': record[ 'lastName' ],
+        'userid': record[ 'userid' ],
+        'password': record[ 'password' ],
+        'pin': record[ 'pin' ],
+        'userLocale': 'English United States',
+        'associatedGroups': {
+            'userGroup': [
+                {
+                    'name': 'Standard CCM End Users'
+                }
+            ]
+        },
+        'associatedDevices': {
+            'device': [
+                record[ 'phoneName' ]
+            ]
+        },
+        'presenceGroupName': 'Standard Presence group'
+    }
+
+    return line, phone, end_user
+
+def import_record( number, record, completed = ( ) ):
+    """Execute the requests for one record, returning its result log entry
+
+    Steps completed by an earlier attempt are skipped, so a retried record
+    doesn't fault on the objects it already created.
+    """
+
+    completed = list( completed )
+
+    result = {
+        'record': number,
+        'userid': record.get( 'userid' ),
+        'pattern': record.get( 'pattern' ),
+        'routePartitionName': record.get( 'routePartitionName' ) or None,
+        'phoneName': record.get( 'phoneName' ),
+        'completed': completed
+    }
+
+    step = 'parse'
+    try:
+        payloads = build_payloads( record )
+        for step, payload in zip( STEPS, payloads ):
+            if step in completed:
+                continue
+            getattr( service, step )( payload )
+            completed.append( step )
+    # Any error (Fault, bad record, connection error or timeout) fails just
+    # this record, so the worker always returns a result
+    except Exception as err:
+        result.update( status = 'failed', step = step, error = str( err ) )
+    else:
+        result.update( status = 'ok' )
+
+    return result
+
+def worker( work_queue, result_queue ):
+
+    while True:
+        item = work_queue.get()
+        if item is None:
+            break
+        result_queue.put( import_record( *item ) )
+
+def writer( result_queue, counts ):
+
+    # A single writer thread appends to the log, flushing every result so it
+    # is committed even if the import is interrupted
+    with open( RESULTS_FILE, 'a' ) as results_file:
+        while True:
+            result = result_queue.get()
+            if result is None:
+                break
+            results_file.write( json.dumps( result ) + '\n' )
+            results_file.flush()
+            counts[ result[ 'status' ] ] = counts.get( result[ 'status' ], 0 ) + 1
+            if result[ 'status' ] != 'ok':
+                print( f'    Record { result[ "record" ] }: { result[ "step" ] }: { result[ "error" ] }' )
+
+watermark, committed, progress = read_committed( RESULTS_FILE )
+
+if watermark or committed or progress:
+    print( f'\nResuming import: records 1-{ watermark } (and { len( committed ) } more) already committed, '
+        f'{ len( progress ) } failed record(s) to retry' )
+
+work_queue = queue.Queue( maxsize = QUEUE_SIZE )
+result_queue = queue.Queue()
+counts = { }
+
+workers = [ threading.Thread( target = worker, args = ( work_queue, result_queue ) )
+    for x in range( MAX_WORKERS ) ]
+writer_thread = threading.Thread( target = writer, args = ( result_queue, counts ) )
+
+for thread in workers + [ writer_thread ]:
+    thread.start()
+
+print( f'\nImporting records from: { INPUT_FILE }\n' )
+
+# put() blocks while the queue is full, so only QUEUE_SIZE records are ever
+# held in memory ahead of the workers
+try:
+    for number, record in read_records( INPUT_FILE ):
+        if number <= watermark or number in committed:
+            continue
+        work_queue.put( ( number, record, progress.pop( number, ( ) ) ) )
+finally:
+    for thread in workers:
+        work_queue.put( None )
+    for thread in workers:
+        thread.join()
+    result_queue.put( None )
+    writer_thread.join()
+
+print( '\nImport complete: ' + ', '.join( f'{ status }: { count }' for status, count in counts.items() ) )
+print( f'Results log: { RESULTS_FILE }' )
+
+input( '\nPress Enter to remove the imported objects (Ctrl+C to keep them)...' )
+
+# Cleanup the objects we just created, based on the results log.  Retried
+# records appear more than once, and only their last entry counts
+imported = { }
+with open( RESULTS_FILE ) as results_file:
+    for line in results_file:
+        result = json.loads( line )
+        imported[ result[ 'record' ] ] = result
+
+for result in imported.values():
+
+    # Partially imported records are cleaned up too
+    if not result[ 'completed' ]:
+        continue
+
+    # Remove objects in reverse order of creation, updating the completed
+    # steps as we go so the log stays accurate if a removal fails
+    completed = result[ 'completed' ]
+    try:
+        if 'addUser' in completed:
+            service.removeUser( userid = result[ 'userid' ] )
+            completed.remove( 'addUser' )
+        if 'addPhone' in completed:
+            service.removePhone( name = result[ 'phoneName' ] )
+            completed.remove( 'addPhone' )
+        if 'addLine' in completed:
+            service.removeLine( pattern = result[ 'pattern' ], routePartitionName = result[ 'routePartitionName' ] )
+            completed.remove( 'addLine' )
+    except Fault as err:
+        print( f'Zeep error: record { result[ "record" ] } cleanup: { err }' )
+        # Some objects are gone, so the record must be re-imported on the next run
+        if completed != STEPS:
+            result.update( status = 'failed', step = 'cleanup', error = str( err ) )
+        continue
+
+    print( f'Removed record { result[ "record" ] }: { result[ "userid" ] }' )
+
+# Keep the log entries of records with objects still on the cluster, so they
+# can be removed (or the import resumed) on a later run
+remaining = [ result for result in imported.values() if result[ 'completed' ] ]
+
+if remaining:
+    with open( RESULTS_FILE, 'w' ) as results_file:
+        for result in remaining:
+            results_file.write( json.dumps( result ) + '\n' )
+    print( f'\n{ len( remaining ) } record(s) not fully removed, see: { RESULTS_FILE }' )
+else:
+    os.remove( RESULTS_FILE )
@@ -0,0 +1,222 @@
+"""AXL auto-paginating list* iterator sample script, using the Zeep SOAP library
+
+Most AXL list* requests accept <skip> and <first> elements, but the list
+samples retrieve all results with a single request - for large tables
+(<listPhone>, <listUser>, <listLine>...) the response can exceed AXL
+response limits, and holds every row in memory at once.
+
+This sample provides a generic iter_list() generator which:
+
+* Requests the results page by page using <skip>/<first>
+* Sizes each page adaptively from the measured response bytes per row,
+  aiming at TARGET_PAGE_BYTES, and halves the page size if AXL rejects a
+  request as too large
+* Optionally prefetches the next page concurrently while the caller
+  processes the current one
+
+Memory use stays flat at (at most) two pages, whatever the table size.
+
+The demo iterates over all phones via <listPhone>, printing the page sizes.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import threading
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Target response size for each page
+TARGET_PAGE_BYTES = 2 * 1024 * 1024
+
+# Page size bounds (rows); the first page uses INITIAL_PAGE_SIZE
+MIN_PAGE_SIZE = 10
+INITIAL_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 10000
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+# Record the response body size of the last request made by each thread,
+# via a requests response hook
+last_response = threading.local()
+
+def record_bytes( response, *args, **kwargs ):
+    last_response.bytes = len( response.content )
+
+session.hooks[ 'response' ].append( record_bytes )
+
+def fetch_page( operation, searchCriteria, returnedTags, skip, first ):
+    """Returns ( rows, response bytes ) for one page, halving the page
+    size while AXL rejects the request as too large"""
+
+    while True:
+        try:
+            resp = getattr( service, operation )( searchCriteria = searchCriteria,
+                returnedTags = returnedTags, skip = skip, first = first )
+            break
+        except Fault as err:
+            if 'too large' not in str( err ).lower() or first <= MIN_PAGE_SIZE:
+                raise
+            first = max( first // 2, MIN_PAGE_SIZE )
+
+    # The return element holds a single list of objects, e.g. return.phone[]
+    rows = next( iter( resp[ 'return' ].__values__.values() ) ) if resp[ 'return' ] else [ ]
+
+    return rows, first, last_response.bytes
+
+def iter_list( operation, searchCriteria, returnedTags, page_size = INITIAL_PAGE_SIZE,
+        prefetch = False, on_page = None ):
+    """Yields every object returned by a list* request, page by page.
+
+    Each following page is sized from the previous page's bytes per row to
+    approach TARGET_PAGE_BYTES.  With prefetch, the next page is requested
+    in a background thread while the current page is consumed.  on_page, if
+    given, is called with ( skip, first, rows, bytes ) for each page.
+    """
+
+    executor = ThreadPoolExecutor( max_workers = 1 ) if prefetch else None
+
+    def request( skip, first ):
+        if executor:
+            return executor.submit( fetch_page, operation, searchCriteria, returnedTags, skip, first ).result
+        result = fetch_page( operation, searchCriteria, returnedTags, skip, first )
+        return lambda: result
+
+    try:
+        skip = 0
+        ceiling = MAX_PAGE_SIZE
+        pending = request( skip, page_size )
+
+        while pending:
+            rows, first, size = pending()
+            pending = None
+
+            # If AXL rejected the requested page size, don't exceed the size accepted
+            if first < page_size:
+                ceiling = first
+
+            if on_page:
+                on_page( skip, first, len( rows ), size )
+
+            # A short page is the last one
+            if len( rows ) == first:
+                skip += first
+                if rows:
+                    page_size = min( max( int( TARGET_PAGE_BYTES * len( rows ) / size ),
+                        MIN_PAGE_SIZE ), ceiling )
+                pending = request( skip, page_size )
+
+            yield from rows
+            del rows
+
+    finally:
+        if executor:
+            executor.shutdown( cancel_futures = True )
+
+def show_page( skip, first, rows, size ):
+    print( f'    skip={ skip:<8} first={ first:<6} rows={ rows:<6} bytes={ size }' )
+
+print( '\nIterating listPhone (with prefetch):\n' )
+
+start = time.perf_counter()
+count = 0
+models = { }
+
+try:
+    for phone in iter_list( 'listPhone', { 'name': '%' }, { 'name': '', 'model': '' },
+            prefetch = True, on_page = show_page ):
+        count += 1
+        models[ phone.model ] = models.get( phone.model, 0 ) + 1
+
+except Fault as err:
+    print( f'Zeep error: listPhone: { err }' )
+    sys.exit( 1 )
+
+print( f'\nRetrieved { count } phones in { time.perf_counter() - start:.2f} sec\n' )
+
+for model, total in sorted( models.items(), key = lambda item: -item[ 1 ] ):
+    print( f'    { total:>6}  { model }' )
@@ -1,6 +1,8 @@
 """AXL <listSipTrunk> and <getSipTrunk> sample script, using the Zeep SOAP library
 
 Creates two SIP Trunks, then retrieves SIP Trunk names/details and prints a simple report.
+The names/destinations of all SIP trunks are retrieved with a single <executeSQLQuery>,
+falling back to <listSipTrunk> and concurrent <getSipTrunk> requests if SQL is not allowed.
 Demonstrates setting an element value to nil via xsd:nil
 
 Copyright (c) 2022 Cisco and/or its affiliates.
@@ -26,6 +28,7 @@ from requests import Session
 from requests.auth import HTTPBasicAuth
 import sys
 import urllib3
+from concurrent.futures import ThreadPoolExecutor
 
 from zeep import Client, Settings, Plugin, xsd
 from zeep import xsd
@@ -131,31 +134,91 @@ else:
 
 input( 'Press Enter to continue...\n' )
 
-# Execute listSipTrunk request
-try:
+# Retrieving destinations via <getSipTrunk> for each trunk returned by
+# <listSipTrunk> takes one request per trunk.  Instead, fetch all SIP trunk
+# names and destinations with a single <executeSQLQuery> joining the device
+# and siptrunkdestination tables.  If the AXL user is not permitted to run
+# SQL queries, fall back to concurrent <getSipTrunk> requests.
+
+# Maximum number of concurrent <getSipTrunk> requests for the fallback
+MAX_WORKERS = 8
+
+sql = '''SELECT d.name, s.address, s.addressipv6, s.port, s.sortorder
+            FROM device AS d
+            JOIN typeclass AS tc ON d.tkclass = tc.enum
+            JOIN typedeviceprotocol AS tp ON d.tkdeviceprotocol = tp.enum
+            LEFT OUTER JOIN siptrunkdestination AS s ON s.fkdevice = d.pkid
+            WHERE tc.name = "Trunk" AND tp.name = "SIP"
+            ORDER BY d.name, s.sortorder'''
+
+# <executeSQLQuery> return is an "xsd:any" type, which Zeep models
+# as a array of rows, with database column name as the tag property.
+def get_column( tag, row ):
+    element = list( filter( lambda x: x.tag == tag, row ) )
+    return element[ 0 ].text if len( element ) > 0 else None
+
+def sql_report( rows ):
+    """Yield ( name, destinations ) per trunk from the ordered SQL rows"""
+
+    name, destinations = None, [ ]
+    for row in rows:
+        if get_column( 'name', row ) != name:
+            if name is not None:
+                yield name, destinations
+            name, destinations = get_column( 'name', row ), [ ]
+        # Trunks with no destinations return a single row of empty columns
+        if get_column( 'sortorder', row ) is not None:
+            destinations.append( {
+                'addressIpv4': get_column( 'address', row ),
+                'addressIpv6': get_column( 'addressipv6', row ),
+                'port': get_column( 'port', row ),
+                'sortOrder': get_column( 'sortorder', row ) } )
+    if name is not None:
+        yield name, destinations
+
+def get_destinations( trunk_name ):
+    """Retrieve the destinations for a single trunk via <getSipTrunk>"""
+
+    this_trunk = service.getSipTrunk(
+        name = trunk_name,
+        returnedTags = { 'destinations': { 'destination': { 'addressIpv4': '', 'addressIpv6': '', 'port': '', 'sortOrder': '' } } } )
+    destinations = this_trunk[ 'return' ][ 'sipTrunk' ][ 'destinations' ]
+    return trunk_name, destinations[ 'destination' ] if destinations else [ ]
+
+def fan_out_report():
+    """Yield ( name, destinations ) per trunk via <listSipTrunk> plus concurrent <getSipTrunk>"""
+
+    # Execute listSipTrunk request
     resp = service.listSipTrunk( searchCriteria = { 'name': '%' }, returnedTags = { 'name': xsd.Nil } )
-except Exception as err:
-    print( f'\nZeep error: listSipTrunk: { err }' )
-    sys.exit( 1 )
+    names = [ trunk[ 'name' ] for trunk in resp[ 'return' ][ 'sipTrunk' ] ] if resp[ 'return' ] else [ ]
 
-print( '\nlistSipTrunk response:\n' )
-print( resp )
+    # map() yields results in order as soon as each one is available
+    with ThreadPoolExecutor( max_workers = MAX_WORKERS ) as executor:
+        yield from executor.map( get_destinations, names )
 
-input( '\nPress Enter to continue...\n' )
+# Execute the executeSQLQuery request
+try:
+    resp = service.executeSQLQuery( sql )
+except Fault as err:
+    print( f'\nZeep error: executeSQLQuery: { err }' )
+    print( 'Falling back to <listSipTrunk>/<getSipTrunk>...' )
+    report = fan_out_report()
+else:
+    report = sql_report( resp[ 'return' ][ 'row' ] if resp[ 'return' ] else [ ] )
 
-# Loop through the dictionary of SIP Trunks and retrieve/print individual trunk details
-for trunk in resp[ 'return' ][ 'sipTrunk' ]:
-    trunk_name = trunk['name']
-    print( f'Name: { trunk_name } ' )
-    print( '\tDestinations:')
-    this_trunk = service.getSipTrunk(
-        name = trunk_name, 
-        returnedTags = { 'destinations': { 'destination': { 'addressIpv4': '', 'addressIpv6': '', 'port': '', 'sortOrder': '' } } } )
-    for trunk_destination in this_trunk[ 'return' ][ 'sipTrunk' ][ 'destinations' ][ 'destination' ]:
-        trunk_ip = trunk_destination[ 'addressIpv4' ]
-        trunk_port = trunk_destination[ 'port' ]
-        trunk_order = trunk_destination[ 'sortOrder' ]
-        print( f'\t\tIP: { trunk_ip }\n\t\tPort: { trunk_port }\n\t\tOrder: { trunk_order }' )
+# Print each trunk as soon as its details are available
+try:
+    for trunk_name, destinations in report:
+        print( f'Name: { trunk_name } ' )
+        print( '\tDestinations:')
+        for trunk_destination in destinations:
+            trunk_ip = trunk_destination[ 'addressIpv4' ]
+            trunk_port = trunk_destination[ 'port' ]
+            trunk_order = trunk_destination[ 'sortOrder' ]
+            print( f'\t\tIP: { trunk_ip }\n\t\tPort: { trunk_port }\n\t\tOrder: { trunk_order }' )
+except Fault as err:
+    print( f'\nZeep error: listSipTrunk/getSipTrunk: { err }' )
+    sys.exit( 1 )
 
 input( '\nPress Enter to continue...' )
 
@@ -0,0 +1,427 @@
+"""AXL precompiled payload template sample script, using the Zeep SOAP library
+
+An <addPhone> payload contains dozens of fields which are constant for a given
+phone product and site (see the Cisco 8821 defaults in axlZeep.py), with only
+a few values (name, description, DN, owner) varying per phone.
+
+This sample merges per-product and per-site defaults into a template, then
+validates and serializes it only once: an example record is validated against
+schema/AXLSoap.xsd (with enumerations from AXLEnums.xsd), and the envelope is
+pre-serialized with placeholders for the per-record fields.  Each phone is
+then rendered by patching its values into the pre-serialized envelope,
+without Zeep re-walking the type tree for the constant fields.
+
+Creates a test End User and Lines, adds Phones rendered from the template,
+compares rendering time with Zeep, then removes the created objects.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+import copy
+import re
+import sys
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault, Error
+from zeep.wsdl.utils import etree_to_string
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL and XSD files are local files in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+SOAP_XSD_FILE = 'schema/AXLSoap.xsd'
+ENUMS_XSD_FILE = 'schema/AXLEnums.xsd'
+
+# Number of envelopes to render for the benchmark
+BENCHMARK_COUNT = 2000
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+
+XSD = '{http://www.w3.org/2001/XMLSchema}'
+SOAP_ENV = '{http://schemas.xmlsoap.org/soap/envelope/}'
+
+def load_strict_schema():
+    """Load AXLSoap.xsd as an lxml XMLSchema, with strict enumerations
+
+    Enumerated AXLSoap.xsd types are defined as a union of the enumeration and
+    any string, so any value validates.  Replace each such union with the
+    enumeration from AXLEnums.xsd (or AXLSoap.xsd if not found there).
+    """
+
+    parser = etree.XMLParser( huge_tree = True )
+    soap = etree.parse( SOAP_XSD_FILE, parser )
+    enums = etree.parse( ENUMS_XSD_FILE, parser )
+
+    enum_restrictions = { simple.get( 'name' ): simple.find( f'{ XSD }restriction' )
+        for simple in enums.getroot().iterfind( f'{ XSD }simpleType' ) }
+
+    for simple in soap.getroot().iterfind( f'{ XSD }simpleType' ):
+        union = simple.find( f'{ XSD }union' )
+        if union is None or union.get( 'memberTypes' ):
+            continue
+        members = [ member.find( f'{ XSD }restriction' ) for member in union ]
+        # Only unions with an unrestricted xsd:string member are relaxed
+        if not any( member is not None and len( member ) == 0 for member in members ):
+            continue
+        restriction = enum_restrictions.get( simple.get( 'name' ) )
+        if restriction is None:
+            restriction = next( ( member for member in members if member is not None and len( member ) ), None )
+        if restriction is not None:
+            simple.replace( union, copy.deepcopy( restriction ) )
+
+    return etree.XMLSchema( soap )
+
+# Text and attribute value escaping, matching lxml's serialization
+TEXT_ESCAPES = str.maketrans( { '&': '&amp;', '<': '&lt;', '>': '&gt;', '\r': '&#13;' } )
+ATTR_ESCAPES = str.maketrans( { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;',
+    '\n': '&#10;', '\t': '&#9;', '\r': '&#13;' } )
+
+PLACEHOLDER = re.compile( rb'@@TEMPLATE:(\w+)@@' )
+
+def set_path( payload, path, value ):
+    """Set the value at a dotted path (list indexes allowed) in a nested payload"""
+
+    keys = path.split( '.' )
+    for key in keys[ :-1 ]:
+        payload = payload[ int( key ) ] if isinstance( payload, list ) else payload[ key ]
+    if isinstance( payload, list ):
+        payload[ int( keys[ -1 ] ) ] = value
+    else:
+        payload[ keys[ -1 ] ] = value
+
+class PayloadTemplate:
+    """A validated, pre-serialized request template for one AXL operation
+
+    payload holds the constant fields, fields maps per-record field names to
+    dotted paths in the payload, and example holds representative values for
+    each field, used for validation.
+    """
+
+    def __init__( self, client, service, operation, payload, fields, example, schema ):
+
+        self.client = client
+        self.service = service
+        self.binding = service._binding
+        self.operation = self.binding.get( operation )
+        self.address = service._binding_options[ 'address' ]
+        self.payload = payload
+        self.fields = fields
+
+        # Validate once, using the example record: Zeep checks the structure
+        # as it serializes, the XSD checks values/enumerations
+        try:
+            message = client.create_message( service, operation, **self.fill( example ) )
+        except ( Error, TypeError ) as err:
+            # Zeep's TypeError message ends with the (very long) full type signature
+            message = str( err ).split( '. Signature:' )[ 0 ]
+            raise ValueError( f'{ operation } template: { message }' ) from err
+
+        body = message.find( f'{ SOAP_ENV }Body' )[ 0 ]
+        if not schema.validate( body ):
+            raise ValueError( f'{ operation } template: { schema.error_log.last_error.message }' )
+
+        # Serialize once with placeholders, and split into constant fragments
+        placeholders = { name: f'@@TEMPLATE:{ name }@@' for name in fields }
+        envelope = etree_to_string( client.create_message( service, operation, **self.fill( placeholders ) ) )
+
+        self.fragments = [ ]
+        self.slots = [ ]
+        position = 0
+        for match in PLACEHOLDER.finditer( envelope ):
+            fragment = envelope[ position:match.start() ]
+            self.fragments.append( fragment )
+            escapes = ATTR_ESCAPES if fragment.endswith( b'="' ) else TEXT_ESCAPES
+            self.slots.append( ( match.group( 1 ).decode(), escapes ) )
+            position = match.end()
+        self.fragments.append( envelope[ position: ] )
+
+        self.headers = self.operation.create( **self.fill( example ) ).headers
+        self.headers[ 'Content-Type' ] = 'text/xml; charset=utf-8'
+
+        # Make sure patching produces exactly what Zeep would have serialized
+        if self.render( **example ) != etree_to_string( client.create_message( service, operation, **self.fill( example ) ) ):
+            raise ValueError( f'{ operation } template: rendered output does not match Zeep' )
+
+    def fill( self, values ):
+        """Return a full payload with the per-record values set, via Zeep"""
+
+        payload = copy.deepcopy( self.payload )
+        for name, path in self.fields.items():
+            set_path( payload, path, values[ name ] )
+        return payload
+
+    def render( self, **values ):
+        """Render the envelope bytes for one record"""
+
+        parts = [ self.fragments[ 0 ] ]
+        for ( name, escapes ), fragment in zip( self.slots, self.fragments[ 1: ] ):
+            parts.append( values[ name ].translate( escapes ).encode( 'utf-8' ) )
+            parts.append( fragment )
+        return b''.join( parts )
+
+    def __call__( self, **values ):
+        """Send the rendered request, letting Zeep parse the reply"""
+
+        response = self.client.transport.post( self.address, self.render( **values ), self.headers )
+        return self.binding.process_reply( self.client, self.operation, response )
+
+def merge( base, overrides ):
+    """Return a deep copy of base with overrides applied (nested dicts merged)"""
+
+    merged = copy.deepcopy( base )
+    for key, value in overrides.items():
+        if isinstance( value, dict ) and isinstance( merged.get( key ), dict ):
+            merged[ key ] = merge( merged[ key ], value )
+        else:
+            merged[ key ] = copy.deepcopy( value )
+    return merged
+
+# Per-product defaults, e.g. the Cisco 8821 settings used in axlZeep.py
+PRODUCT_DEFAULTS = {
+    'Cisco 8821': {
+        'product': 'Cisco 8821',
+        'class': 'Phone',
+        'protocol': 'SIP',
+        'commonPhoneConfigName': 'Standard Common Phone Profile',
+        'networkLocation': 'Use System Default',
+        'mlppIndicationStatus': 'Default',
+        'preemption': 'Default',
+        'useTrustedRelayPoint': 'Default',
+        'retryVideoCallAsAudio': 'true',
+        'securityProfileName': 'Cisco 8821 - Standard SIP Non-Secure Profile',
+        'sipProfileName': 'Standard SIP Profile',
+        'lines': {
+            'line': [
+                {
+                    'index': 1,
+                    'dirn': {
+                        'pattern': None,
+                        'routePartitionName': None
+                    },
+                    'ringSetting': 'Use System Default',
+                    'consecutiveRingSetting': 'Use System Default',
+                    'ringSettingIdlePickupAlert': 'Use System Default',
+                    'ringSettingActivePickupAlert': 'Use System Default',
+                    'missedCallLogging': 'true',
+                    'recordingMediaSource': 'Gateway Preferred'
+                }
+            ]
+        },
+        'phoneTemplateName': 'Standard 8821 SIP',
+        'ringSettingIdleBlfAudibleAlert': 'Default',
+        'ringSettingBusyBlfAudibleAlert': 'Default',
+        'enableExtensionMobility': 'false',
+        'singleButtonBarge': 'Off',
+        'joinAcrossLines': 'Off',
+        'builtInBridgeStatus': 'Default',
+        'callInfoPrivacyStatus': 'Default',
+        'hlogStatus': 'On',
+        'ignorePresentationIndicators': 'false',
+        'allowCtiControlFlag': 'true',
+        'presenceGroupName': 'Standard Presence group',
+        'unattendedPort': 'false',
+        'requireDtmfReception': 'false',
+        'rfc2833Disabled': 'false',
+        'certificateOperation': 'No Pending Operation',
+        'dndOption': 'Use Common Phone Profile Setting',
+        'dndStatus': 'false',
+        'isActive': 'true',
+        'isDualMode': 'false',
+        'phoneSuite': 'Default',
+        'phoneServiceDisplay': 'Default',
+        'isProtected': 'false',
+        'mtpRequired': 'false',
+        'mtpPreferedCodec': '711ulaw',
+        'outboundCallRollover': 'No Rollover',
+        'hotlineDevice': 'false',
+        'alwaysUsePrimeLine': 'Default',
+        'alwaysUsePrimeLineForVoiceMessage': 'Default',
+        'deviceTrustMode': 'Not Trusted',
+        'earlyOfferSupportForVoiceCall': 'false'
+    }
+}
+
+# Per-site settings, overriding the product defaults
+SITE_DEFAULTS = {
+    'HQ': {
+        'devicePoolName': 'Default',
+        'locationName': 'Hub_None'
+    }
+}
+
+# Per-record fields, and where they go in the <addPhone> payload
+PHONE_FIELDS = {
+    'name': 'phone.name',
+    'description': 'phone.description',
+    'pattern': 'phone.lines.line.0.dirn.pattern',
+    'owner': 'phone.ownerUserName'
+}
+
+print( '\nLoading schema for validation...' )
+
+schema = load_strict_schema()
+
+phone_payload = { 'phone': merge( PRODUCT_DEFAULTS[ 'Cisco 8821' ], SITE_DEFAULTS[ 'HQ' ] ) }
+
+example = { 'name': 'SEP000000000000', 'description': 'Template example', 'pattern': '1000', 'owner': 'example' }
+
+try:
+    phone_template = PayloadTemplate( client, service, 'addPhone', phone_payload, PHONE_FIELDS, example, schema )
+except ValueError as err:
+    print( f'Template error: { err }' )
+    sys.exit( 1 )
+
+print( f'\nCompiled addPhone template for Cisco 8821 / HQ: '
+    f'{ sum( len( fragment ) for fragment in phone_template.fragments ) } constant bytes, '
+    f'{ len( phone_template.slots ) } per-record fields' )
+
+# Compare the cost of rendering many addPhone envelopes each way
+records = [ { 'name': f'SEP{ x:012X}', 'description': f'Phone { x }', 'pattern': str( 100000 + x ),
+    'owner': 'example' } for x in range( BENCHMARK_COUNT ) ]
+
+start = time.perf_counter()
+for record in records:
+    etree_to_string( client.create_message( service, 'addPhone', **phone_template.fill( record ) ) )
+zeep_time = time.perf_counter() - start
+
+start = time.perf_counter()
+for record in records:
+    phone_template.render( **record )
+template_time = time.perf_counter() - start
+
+print( f'\nRendered { BENCHMARK_COUNT } addPhone envelopes:' )
+print( f'    Zeep:     { zeep_time:.2f} sec' )
+print( f'    Template: { template_time:.2f} sec ({ zeep_time / template_time:.0f}x)' )
+
+input( '\nPress Enter to continue...' )
+
+# Create a test End User to own the phones
+try:
+    resp = service.addUser( user = { 'userid': 'testTemplateUser', 'lastName': 'testTemplateUser',
+        'presenceGroupName': 'Standard Presence group' } )
+except Fault as err:
+    print( f'Zeep error: addUser: { err }' )
+    sys.exit( 1 )
+
+print( '\naddUser response:' )
+print( resp )
+
+phones = [
+    { 'name': 'SEP0011AABB0001', 'description': 'Template phone 1', 'pattern': '9876543311', 'owner': 'testTemplateUser' },
+    { 'name': 'SEP0011AABB0002', 'description': 'Template phone 2', 'pattern': '9876543312', 'owner': 'testTemplateUser' },
+    { 'name': 'SEP0011AABB0003', 'description': 'Template phone 3', 'pattern': '9876543313', 'owner': 'testTemplateUser' }
+]
+
+for phone in phones:
+
+    try:
+        service.addLine( line = { 'pattern': phone[ 'pattern' ], 'usage': 'Device', 'routePartitionName': None } )
+        resp = phone_template( **phone )
+    except Fault as err:
+        print( f'Zeep error: addLine/addPhone: { err }' )
+        sys.exit( 1 )
+
+    print( f'\naddPhone (template) response for { phone[ "name" ] }:' )
+    print( resp )
+
+input( '\nPress Enter to continue...' )
+
+# Cleanup the objects we just created
+
+for phone in phones:
+
+    try:
+        service.removePhone( name = phone[ 'name' ] )
+        service.removeLine( pattern = phone[ 'pattern' ], routePartitionName = None )
+    except Fault as err:
+        print( f'Zeep error: removePhone/removeLine: { err }' )
+        sys.exit( 1 )
+
+    print( f'\nRemoved { phone[ "name" ] } / { phone[ "pattern" ] }' )
+
+try:
+    resp = service.removeUser( userid = 'testTemplateUser' )
+except Fault as err:
+    print( f'Zeep error: removeUser: { err }' )
+    sys.exit( 1 )
+
+print( '\nremoveUser response:' )
+print( resp )
@@ -0,0 +1,274 @@
+"""AXL raw response sample script, using the Zeep SOAP library
+
+Many consumers need only a few fields from a response, e.g. the uuid from
+<addLine>, or firstName/lastName from <getUser>.  Using Zeep's raw_response
+setting, this sample skips building the full Zeep object tree and instead
+returns a lightweight, lazy proxy over the lxml response element, which
+resolves child elements by name only when they are accessed.
+
+Creates a test line, retrieves its uuid and details in raw mode, compares
+parse time/size against regular Zeep processing, then removes the line.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+import sys
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault, TransportError
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Number of times to parse the same response when comparing parse time
+PARSE_COUNT = 200
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+
+# Parser for raw responses, allowing very large responses like Zeep's xml_huge_tree
+RAW_PARSER = etree.XMLParser( huge_tree = True, resolve_entities = False )
+
+SOAP_ENV = '{http://schemas.xmlsoap.org/soap/envelope/}'
+
+class LazyElement:
+    """Read-only proxy over an lxml response element
+
+    Child elements are looked up by (local) name on access, via either
+    element[ 'name' ] or element.name, mirroring access to Zeep objects.
+    Elements with no children are returned as their text, elements with
+    children as another LazyElement.  Nothing is converted until accessed.
+    """
+
+    __slots__ = ( '_element', )
+
+    def __init__( self, element ):
+
+        self._element = element
+
+    def _wrap( self, child ):
+
+        return LazyElement( child ) if len( child ) else child.text
+
+    def __getitem__( self, name ):
+
+        child = self._element.find( name )
+        if child is None:
+            raise KeyError( name )
+        return self._wrap( child )
+
+    def __getattr__( self, name ):
+
+        try:
+            return self[ name ]
+        except KeyError:
+            raise AttributeError( name ) from None
+
+    def all( self, name ):
+        """Return all child elements with the given name, e.g. repeated <line> entries"""
+
+        return [ self._wrap( child ) for child in self._element.iterfind( name ) ]
+
+    def attribute( self, name, attr ):
+        """Return an attribute of a child element, e.g. the uuid of <devicePoolName>"""
+
+        child = self._element.find( name )
+        return child.get( attr ) if child is not None else None
+
+    def __repr__( self ):
+
+        return f'<LazyElement { etree.QName( self._element ).localname }>'
+
+def parse_raw( response ):
+    """Parse a raw requests response, returning the operation response element"""
+
+    # raw_response bypasses Zeep's HTTP error handling too: errors like a 401
+    # or 503 come back as an HTML (or empty) body, so raise the TransportError
+    # Zeep would have
+    content_type = response.headers.get( 'Content-Type', 'text/xml' )
+
+    if not response.content:
+        raise TransportError( f'Server returned HTTP status { response.status_code } (no content available)',
+            status_code = response.status_code, content = response.content )
+
+    if 'xml' not in content_type:
+        raise TransportError( f'Server returned HTTP status { response.status_code } ({ content_type })',
+            status_code = response.status_code, content = response.content )
+
+    try:
+        envelope = etree.fromstring( response.content, parser = RAW_PARSER )
+    except etree.XMLSyntaxError as err:
+        raise TransportError( f'Server returned HTTP status { response.status_code } with invalid XML: { err }',
+            status_code = response.status_code, content = response.content ) from err
+
+    body = envelope.find( f'{ SOAP_ENV }Body' )
+
+    if body is None or len( body ) == 0:
+        raise TransportError( f'Server returned HTTP status { response.status_code } without a SOAP Body',
+            status_code = response.status_code, content = response.content )
+
+    fault = body.find( f'{ SOAP_ENV }Fault' )
+
+    # raw_response also bypasses Zeep's SOAP fault handling, so raise the
+    # same Fault exception Zeep would have
+    if fault is not None:
+        raise Fault( fault.findtext( 'faultstring' ), code = fault.findtext( 'faultcode' ),
+            detail = fault.find( 'detail' ) )
+
+    return LazyElement( body[ 0 ] )
+
+def raw_call( operation, *args, **kwargs ):
+    """Execute an AXL request, returning a LazyElement instead of Zeep objects"""
+
+    with client.settings( raw_response = True ):
+        response = getattr( service, operation )( *args, **kwargs )
+
+    return parse_raw( response )
+
+# Create a test line
+line = {
+    'pattern': '9876543230',
+    'description': 'Raw response test line',
+    'usage': 'Device',
+    'routePartitionName': None
+}
+
+# Execute the addLine request in raw mode, accessing just the uuid
+try:
+    resp = raw_call( 'addLine', line )
+except Fault as err:
+    print( f'Zeep error: addLine: { err }' )
+    sys.exit( 1 )
+
+print( f'\naddLine uuid: { resp[ "return" ] }' )
+
+input( '\nPress Enter to continue...' )
+
+# Execute the getLine request in raw mode, accessing just a few fields
+try:
+    resp = raw_call( 'getLine', pattern = '9876543230', routePartitionName = None )
+except Fault as err:
+    print( f'Zeep error: getLine: { err }' )
+    sys.exit( 1 )
+
+line_info = resp[ 'return' ][ 'line' ]
+
+print( '\ngetLine (raw) parsed fields:\n' )
+print( f'Pattern:     { line_info.pattern }' )
+print( f'Description: { line_info.description }' )
+print( f'Usage:       { line_info.usage }' )
+print( f'Partition:   { line_info.attribute( "routePartitionName", "uuid" ) }' )
+
+input( '\nPress Enter to continue...' )
+
+# Compare parsing the same getLine response in raw mode vs. via Zeep
+with client.settings( raw_response = True ):
+    response = service.getLine( pattern = '9876543230', routePartitionName = None )
+
+binding = service._binding
+operation = binding.get( 'getLine' )
+
+start = time.perf_counter()
+for x in range( PARSE_COUNT ):
+    binding.process_reply( client, operation, response )[ 'return' ][ 'line' ][ 'description' ]
+zeep_time = time.perf_counter() - start
+
+start = time.perf_counter()
+for x in range( PARSE_COUNT ):
+    parse_raw( response )[ 'return' ][ 'line' ][ 'description' ]
+raw_time = time.perf_counter() - start
+
+print( f'\nParsed getLine response ({ len( response.content ) } bytes) { PARSE_COUNT } times:' )
+print( f'    Zeep: { zeep_time:.3f} sec' )
+print( f'    Raw:  { raw_time:.3f} sec' )
+
+input( '\nPress Enter to continue...' )
+
+# Cleanup the objects we just created
+try:
+    resp = service.removeLine( pattern = '9876543230', routePartitionName = None )
+except Fault as err:
+    print( f'Zeep error: removeLine: { err }' )
+    sys.exit( 1 )
+
+print( '\nremoveLine response:' )
+print( resp )
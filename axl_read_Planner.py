@@ -0,0 +1,395 @@
+"""AXL cost-based read planner sample script, using the Zeep SOAP library
+
+Reading a few fields for many objects is often far cheaper with a single
+<executeSQLQuery> than with N <getPhone> requests - but some fields (e.g.
+a phone's lines) only exist in the "thick" AXL API.  This sample provides a
+ReadPlanner which, for a requested object type, field set and list of
+object keys (names/userids), chooses the cheapest available strategy:
+
+* sql - one <executeSQLQuery> per SQL_CHUNK_SIZE keys, if every field maps
+  to an Informix column (see OBJECT_TYPES)
+* list - one list* request returning all objects of the type, filtered
+  locally, if every field is a list* returnedTags field
+* get - concurrent get* requests, one per object (always available)
+
+The cost model estimates each strategy as a fixed per-request latency plus
+a per-row cost.  calibrate() measures the per-request latency of each
+strategy with a small probe, and every executed read refines the
+estimates (exponentially weighted moving averages).
+
+The demo plans and executes some typical phone and user reads.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from concurrent.futures import ThreadPoolExecutor
+import math
+import sys
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+from zeep.helpers import serialize_object
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Per object type: the AXL API name (getPhone/listPhone, etc.), key field,
+# SQL FROM clause and filter, and AXL field -> SQL column expression map
+OBJECT_TYPES = {
+    'phone': {
+        'api': 'Phone',
+        'key': 'name',
+        'from': '''device AS d
+            INNER JOIN typeproduct AS tp ON tp.enum = d.tkproduct
+            INNER JOIN typemodel AS tm ON tm.enum = d.tkmodel
+            INNER JOIN typedeviceprotocol AS tdp ON tdp.enum = d.tkdeviceprotocol
+            INNER JOIN devicepool AS dp ON dp.pkid = d.fkdevicepool
+            LEFT OUTER JOIN location AS loc ON loc.pkid = d.fklocation
+            LEFT OUTER JOIN callingsearchspace AS css ON css.pkid = d.fkcallingsearchspace
+            LEFT OUTER JOIN enduser AS eu ON eu.pkid = d.fkenduser''',
+        'where': 'd.tkclass = 1',
+        'columns': {
+            'name': 'd.name',
+            'description': 'd.description',
+            'product': 'tp.name',
+            'model': 'tm.name',
+            'protocol': 'tdp.name',
+            'devicePoolName': 'dp.name',
+            'locationName': 'loc.name',
+            'callingSearchSpaceName': 'css.name',
+            'ownerUserName': 'eu.userid'
+        }
+    },
+    'user': {
+        'api': 'User',
+        'key': 'userid',
+        'from': 'enduser AS eu',
+        'where': '1 = 1',
+        'columns': {
+            'userid': 'eu.userid',
+            'firstName': 'eu.firstname',
+            'lastName': 'eu.lastname',
+            'mailid': 'eu.mailid',
+            'department': 'eu.department',
+            'telephoneNumber': 'eu.telephonenumber',
+            'title': 'eu.title'
+        }
+    }
+}
+
+# Number of keys per <executeSQLQuery> IN list
+SQL_CHUNK_SIZE = 500
+
+# Maximum number of concurrent get* requests
+MAX_WORKERS = 8
+
+# Initial cost estimates (seconds) per strategy, refined by measurement
+DEFAULT_COSTS = {
+    'sql': { 'request': 0.15, 'row': 0.0002 },
+    'list': { 'request': 0.20, 'row': 0.0005 },
+    'get': { 'request': 0.10, 'row': 0.0 }
+}
+
+# Weight of each new measurement in the moving averages
+EWMA_WEIGHT = 0.3
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+def quote( value ):
+    """Encodes a string as an Informix SQL literal"""
+    return "'" + value.replace( "'", "''" ) + "'"
+
+def plain( value ):
+    """Zeep returns foreign key fields as { '_value_1': name, 'uuid': ... }"""
+
+    if hasattr( value, '_value_1' ):
+        return value._value_1
+    return serialize_object( value, dict )
+
+class ReadPlanner:
+    """Chooses and executes the cheapest read strategy, see module docstring"""
+
+    def __init__( self, client, service, object_types = OBJECT_TYPES ):
+        self.service = service
+        self.object_types = object_types
+        self.costs = { strategy: dict( costs ) for strategy, costs in DEFAULT_COSTS.items() }
+        self._totals = { }
+        self._list_fields = { }
+
+        for name, object_type in object_types.items():
+            self._list_fields[ name ] = { element for element, _ in
+                client.get_type( f'ns0:L{ object_type[ "api" ] }' ).elements }
+
+    def total( self, type_name ):
+        """Number of objects of a type (cached), as a list* request returns them all"""
+
+        if type_name not in self._totals:
+            object_type = self.object_types[ type_name ]
+            resp = self.service.executeSQLQuery(
+                f'SELECT COUNT(*) FROM { object_type[ "from" ] } WHERE { object_type[ "where" ] }' )
+            self._totals[ type_name ] = int( resp[ 'return' ][ 'row' ][ 0 ][ 0 ].text )
+
+        return self._totals[ type_name ]
+
+    def strategies( self, type_name, fields ):
+        """Returns the strategies able to return all of the fields"""
+
+        available = [ ]
+        if set( fields ) <= set( self.object_types[ type_name ][ 'columns' ] ):
+            available.append( 'sql' )
+        if set( fields ) <= self._list_fields[ type_name ]:
+            available.append( 'list' )
+        available.append( 'get' )
+
+        return available
+
+    def estimate( self, strategy, type_name, count ):
+        """Estimated seconds to read count objects with a strategy"""
+
+        costs = self.costs[ strategy ]
+
+        if strategy == 'sql':
+            return math.ceil( count / SQL_CHUNK_SIZE ) * costs[ 'request' ] + count * costs[ 'row' ]
+        if strategy == 'list':
+            return costs[ 'request' ] + self.total( type_name ) * costs[ 'row' ]
+
+        return math.ceil( count / MAX_WORKERS ) * costs[ 'request' ]
+
+    def plan( self, type_name, fields, keys ):
+        """Returns ( strategy, { strategy: estimated seconds } )"""
+
+        estimates = { strategy: self.estimate( strategy, type_name, len( keys ) )
+            for strategy in self.strategies( type_name, fields ) }
+
+        return min( estimates, key = estimates.get ), estimates
+
+    def observe( self, strategy, requests, rows, seconds ):
+        """Refines the cost estimates from a measured read"""
+
+        costs = self.costs[ strategy ]
+        per_request = seconds / requests
+
+        if strategy == 'get' or rows <= requests:
+            # Small reads measure the per-request latency
+            costs[ 'request' ] += EWMA_WEIGHT * ( per_request - costs[ 'request' ] )
+        else:
+            per_row = max( seconds - requests * costs[ 'request' ], 0 ) / rows
+            costs[ 'row' ] += EWMA_WEIGHT * ( per_row - costs[ 'row' ] )
+
+    def calibrate( self, type_name, key ):
+        """Measures the per-request latency of each strategy with a one-object read"""
+
+        for strategy in self.strategies( type_name, [ self.object_types[ type_name ][ 'key' ] ] ):
+            self.read( type_name, [ self.object_types[ type_name ][ 'key' ] ], [ key ],
+                strategy = strategy, first = 1 )
+
+    def read( self, type_name, fields, keys, strategy = None, first = None ):
+        """Reads fields for the objects with the given keys.
+
+        Returns ( strategy, { key: { field: value } } ).
+        """
+
+        if strategy is None:
+            strategy = self.plan( type_name, fields, keys )[ 0 ]
+
+        object_type = self.object_types[ type_name ]
+        fields = list( dict.fromkeys( [ object_type[ 'key' ] ] + list( fields ) ) )
+        start = time.perf_counter()
+
+        result, requests, rows = getattr( self, f'_read_{ strategy }' )( object_type, fields, keys, first )
+
+        self.observe( strategy, requests, rows, time.perf_counter() - start )
+
+        return strategy, result
+
+    def _read_sql( self, object_type, fields, keys, first ):
+
+        columns = ', '.join( f'{ object_type[ "columns" ][ field ] } AS { field.lower() }' for field in fields )
+        result, requests, rows = { }, 0, 0
+
+        for x in range( 0, len( keys ), SQL_CHUNK_SIZE ):
+            chunk = ', '.join( quote( key ) for key in keys[ x:x + SQL_CHUNK_SIZE ] )
+            resp = self.service.executeSQLQuery( f'''SELECT { columns } FROM { object_type[ "from" ] }
+                WHERE { object_type[ "where" ] }
+                AND { object_type[ "columns" ][ object_type[ "key" ] ] } IN ( { chunk } )''' )
+            requests += 1
+            for row in resp[ 'return' ][ 'row' ] if resp[ 'return' ] else [ ]:
+                # Each column element is named by its alias, the lower case field name
+                values = { column.tag: column.text for column in row }
+                record = { field: plain( values.get( field.lower() ) ) for field in fields }
+                result[ record[ object_type[ 'key' ] ] ] = record
+                rows += 1
+
+        return result, requests, rows
+
+    def _read_list( self, object_type, fields, keys, first ):
+
+        kwargs = { 'first': first } if first else { }
+        resp = getattr( self.service, f'list{ object_type[ "api" ] }' )(
+            searchCriteria = { object_type[ 'key' ]: '%' },
+            returnedTags = { field: '' for field in fields }, **kwargs )
+
+        objects = next( iter( resp[ 'return' ].__values__.values() ) ) if resp[ 'return' ] else [ ]
+        wanted = set( keys )
+        result = { }
+
+        for item in objects:
+            record = { field: plain( item[ field ] ) for field in fields }
+            if first or record[ object_type[ 'key' ] ] in wanted:
+                result[ record[ object_type[ 'key' ] ] ] = record
+
+        return result, 1, len( objects )
+
+    def _read_get( self, object_type, fields, keys, first ):
+
+        operation = getattr( self.service, f'get{ object_type[ "api" ] }' )
+        returned_tags = { field: '' for field in fields }
+
+        def get( key ):
+            resp = operation( **{ object_type[ 'key' ]: key }, returnedTags = returned_tags )
+            item = next( iter( resp[ 'return' ].__values__.values() ) )
+            return { field: plain( item[ field ] ) for field in fields }
+
+        with ThreadPoolExecutor( max_workers = MAX_WORKERS ) as executor:
+            records = list( executor.map( get, keys ) )
+
+        return { record[ object_type[ 'key' ] ]: record for record in records }, len( keys ), len( keys )
+
+planner = ReadPlanner( client, service )
+
+# Find some phone names and userids to read
+
+try:
+    resp = service.executeSQLQuery( 'SELECT FIRST 200 name FROM device WHERE tkclass = 1 ORDER BY name' )
+    phone_names = [ row[ 0 ].text for row in resp[ 'return' ][ 'row' ] ] if resp[ 'return' ] else [ ]
+    resp = service.executeSQLQuery( 'SELECT FIRST 50 userid FROM enduser ORDER BY userid' )
+    userids = [ row[ 0 ].text for row in resp[ 'return' ][ 'row' ] ] if resp[ 'return' ] else [ ]
+except Fault as err:
+    print( f'Zeep error: executeSQLQuery: { err }' )
+    sys.exit( 1 )
+
+if not phone_names or not userids:
+    print( 'This sample needs at least one phone and one end user' )
+    sys.exit( 1 )
+
+print( '\nCalibrating...' )
+
+try:
+    planner.calibrate( 'phone', phone_names[ 0 ] )
+    planner.calibrate( 'user', userids[ 0 ] )
+except Fault as err:
+    print( f'Zeep error: calibrate: { err }' )
+    sys.exit( 1 )
+
+for strategy, costs in planner.costs.items():
+    print( f'    { strategy:6} { costs[ "request" ] * 1000:8.1f} ms/request  { costs[ "row" ] * 1000:8.3f} ms/row' )
+
+reads = [
+    ( 'phone', [ 'description', 'devicePoolName', 'locationName' ], phone_names ),
+    ( 'phone', [ 'description', 'numberOfButtons' ], phone_names[ :20 ] ),
+    ( 'phone', [ 'lines' ], phone_names[ :5 ] ),
+    ( 'user', [ 'firstName', 'lastName', 'mailid' ], userids )
+]
+
+for type_name, fields, keys in reads:
+
+    input( '\nPress Enter to continue...' )
+
+    strategy, estimates = planner.plan( type_name, fields, keys )
+
+    print( f'\nRead { type_name } { fields } for { len( keys ) } object(s):' )
+    print( '    Estimates: ' + ', '.join( f'{ name }={ seconds * 1000:.0f} ms'
+        for name, seconds in estimates.items() ) )
+
+    start = time.perf_counter()
+
+    try:
+        strategy, result = planner.read( type_name, fields, keys, strategy = strategy )
+    except Fault as err:
+        print( f'Zeep error: { strategy } read: { err }' )
+        sys.exit( 1 )
+
+    print( f'    Executed "{ strategy }": { len( result ) } object(s) in '
+        f'{ ( time.perf_counter() - start ) * 1000:.0f} ms' )
+
+    for key, record in list( result.items() )[ :3 ]:
+        print( f'        { str( record )[ :120 ] }' )
@@ -0,0 +1,367 @@
+"""AXL name/uuid reference cache sample script, using the Zeep SOAP library
+
+AXL requests refer to reference objects - device pools, locations,
+partitions, SIP profiles, security profiles, etc. - by name, and tools often
+need the matching uuid (or the name for a uuid) with an extra get* request or
+<executeSQLQuery> for each lookup.  This sample implements a resolution
+cache which bulk-loads the full name <-> pkid map of a reference table with
+a single <executeSQLQuery>, on first use.
+
+Tables are kept in an LRU structure bounded by total name count, and expire
+after a TTL.  Entries are also kept current between loads from the AXL
+'Data Change Notification' feed (<listChange>, see axl_listChange.py):
+removals and renames are applied in place, and adds invalidate the table.
+
+The demo resolves some default reference objects, then adds a route
+partition, renames and removes it, showing the cache following the changes.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from collections import OrderedDict
+import sys
+import threading
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Reference kind (as used in <kind>Name payload fields): database table, and
+# the <listChange> object type(s) stored in that table
+REFERENCE_TABLES = {
+    'devicePool': ( 'devicepool', [ 'DevicePool' ] ),
+    'location': ( 'location', [ 'Location' ] ),
+    'routePartition': ( 'routepartition', [ 'RoutePartition' ] ),
+    'callingSearchSpace': ( 'callingsearchspace', [ 'Css' ] ),
+    'sipProfile': ( 'sipprofile', [ 'SipProfile' ] ),
+    'securityProfile': ( 'securityprofile', [ 'PhoneSecurityProfile', 'SipTrunkSecurityProfile' ] ),
+    'commonPhoneConfig': ( 'commonphoneconfig', [ 'CommonPhoneConfig' ] ),
+    'mediaResourceList': ( 'mediaresourcelist', [ 'MediaResourceList' ] )
+}
+
+# Seconds before a loaded table is considered stale and reloaded
+TTL_SECONDS = 600
+
+# Maximum total names held; least recently used tables are evicted beyond this
+MAX_CACHED_NAMES = 50000
+
+# Name of the test route partition added by the demo
+TEST_PARTITION = 'testReferenceCachePartition'
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+# <executeSQLQuery> return is an "xsd:any" type, which Zeep models
+# as a array of rows, with database column name as the tag property.
+def get_column( tag, row ):
+    element = list( filter( lambda x: x.tag == tag, row ) )
+    return element[ 0 ].text if len( element ) > 0 else None
+
+def normalize_uuid( uuid ):
+    """AXL returns uuids as '{UPPERCASE}', the database stores lowercase pkids"""
+    return uuid.strip( '{}' ).lower()
+
+class ReferenceTable:
+    """name <-> pkid maps for one reference table"""
+
+    __slots__ = ( 'loaded', 'by_name', 'by_pkid' )
+
+    def __init__( self, rows ):
+        self.loaded = time.monotonic()
+        self.by_name = { }
+        self.by_pkid = { }
+        for row in rows:
+            self.set( get_column( 'pkid', row ), get_column( 'name', row ) )
+
+    def set( self, pkid, name ):
+        old_name = self.by_pkid.get( pkid )
+        if old_name is not None:
+            del self.by_name[ old_name ]
+        self.by_pkid[ pkid ] = name
+        self.by_name[ name ] = pkid
+
+    def discard( self, pkid ):
+        name = self.by_pkid.pop( pkid, None )
+        if name is not None:
+            del self.by_name[ name ]
+
+class ReferenceCache:
+    """Resolves reference object names to uuids and back, loading each
+    table with a single <executeSQLQuery> on first use.
+
+    Tables are held in LRU order (bounded by MAX_CACHED_NAMES) and expire
+    after TTL_SECONDS.  Call poll_changes() periodically to apply changes
+    from the <listChange> feed.
+    """
+
+    def __init__( self, service, tables = REFERENCE_TABLES, ttl = TTL_SECONDS,
+            max_names = MAX_CACHED_NAMES ):
+        self.service = service
+        self.tables = tables
+        self.ttl = ttl
+        self.max_names = max_names
+        self.stats = { 'hits': 0, 'misses': 0, 'loads': 0, 'changes': 0 }
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._kinds_by_type = { change_type: kind
+            for kind, ( table, change_types ) in tables.items() for change_type in change_types }
+
+        # Establish the change queue baseline before loading any table,
+        # so no change made after a load can be missed
+        resp = service.listChange( objectList = self._object_list() )
+        self._queue_id = resp.queueInfo.queueId
+        self._next_change_id = resp.queueInfo.nextStartChangeId
+
+    def _object_list( self ):
+        return { 'object': list( self._kinds_by_type ) }
+
+    def _table( self, kind ):
+        """Returns the ReferenceTable for kind, (re)loading it if absent or expired"""
+
+        with self._lock:
+            table = self._cache.get( kind )
+            if table is not None and time.monotonic() - table.loaded < self.ttl:
+                self._cache.move_to_end( kind )
+                return table
+
+        resp = self.service.executeSQLQuery( f'SELECT pkid, name FROM { self.tables[ kind ][ 0 ] }' )
+        table = ReferenceTable( resp[ 'return' ][ 'row' ] if resp[ 'return' ] else [ ] )
+
+        with self._lock:
+            self.stats[ 'loads' ] += 1
+            self._cache[ kind ] = table
+            self._cache.move_to_end( kind )
+            self._evict()
+
+        return table
+
+    def _evict( self ):
+        total = sum( len( table.by_pkid ) for table in self._cache.values() )
+        # Always keep the most recently used table, however large
+        while total > self.max_names and len( self._cache ) > 1:
+            kind, table = self._cache.popitem( last = False )
+            total -= len( table.by_pkid )
+
+    def uuid( self, kind, name ):
+        """Returns the AXL-format uuid for the named object, or None if not found"""
+
+        pkid = self._table( kind ).by_name.get( name )
+        self.stats[ 'hits' if pkid else 'misses' ] += 1
+        return f'{{{ pkid.upper() }}}' if pkid else None
+
+    def name( self, kind, uuid ):
+        """Returns the name of the object with the uuid, or None if not found"""
+
+        name = self._table( kind ).by_pkid.get( normalize_uuid( uuid ) )
+        self.stats[ 'hits' if name else 'misses' ] += 1
+        return name
+
+    def invalidate( self, kind = None ):
+        """Drops the table for kind, or all tables"""
+
+        with self._lock:
+            if kind is None:
+                self._cache.clear()
+            else:
+                self._cache.pop( kind, None )
+
+    def poll_changes( self ):
+        """Applies changes from the <listChange> feed to the loaded tables"""
+
+        resp = self.service.listChange(
+            startChangeId = { 'queueId': self._queue_id, '_value_1': self._next_change_id },
+            objectList = self._object_list() )
+
+        self._next_change_id = resp.queueInfo.nextStartChangeId
+
+        if not resp.changes:
+            return
+
+        with self._lock:
+            for change in resp.changes.change:
+
+                kind = self._kinds_by_type.get( change.type )
+                table = self._cache.get( kind )
+                if table is None:
+                    continue
+
+                self.stats[ 'changes' ] += 1
+                pkid = normalize_uuid( change.uuid )
+                tags = change.changedTags.changedTag if change.changedTags else [ ]
+                new_name = next( ( tag._value_1 for tag in tags if tag.name == 'name' ), None )
+
+                if change.action == 'r':
+                    table.discard( pkid )
+                elif new_name is not None:
+                    table.set( pkid, new_name )
+                elif change.action == 'a':
+                    # Added without the name reported: reload on next use
+                    del self._cache[ kind ]
+
+cache = ReferenceCache( service )
+
+# Resolve some default reference objects; the first lookup per kind loads the table
+
+lookups = [
+    ( 'devicePool', 'Default' ),
+    ( 'location', 'Hub_None' ),
+    ( 'sipProfile', 'Standard SIP Profile' ),
+    ( 'commonPhoneConfig', 'Standard Common Phone Profile' ),
+    ( 'devicePool', 'Default' ),
+    ( 'location', 'Hub_None' )
+]
+
+print( f'\n{ "Kind":20}{ "Name":32}{ "uuid":40}{ "Time (ms)":>10}' )
+print( f'{ "-" * 19 } { "-" * 31 } { "-" * 39 } { "-" * 9:>10}' )
+
+for kind, name in lookups:
+
+    start = time.perf_counter()
+
+    try:
+        uuid = cache.uuid( kind, name )
+    except Fault as err:
+        print( f'Zeep error: executeSQLQuery: { err }' )
+        sys.exit( 1 )
+
+    print( f'{ kind:20}{ name:32}{ str( uuid ):40}{ ( time.perf_counter() - start ) * 1000:10.3f}' )
+
+print( f'\nReverse lookup: { cache.name( "devicePool", cache.uuid( "devicePool", "Default" ) ) }' )
+print( f'\nCache stats: { cache.stats }' )
+
+input( '\nPress Enter to continue...' )
+
+partition_uuid = None
+
+def show_partition( step ):
+    try:
+        cache.poll_changes()
+        print( f'\n{ step }:' )
+        print( f'    uuid of "{ TEST_PARTITION }": { cache.uuid( "routePartition", TEST_PARTITION ) }' )
+        if partition_uuid:
+            print( f'    name of { partition_uuid }: { cache.name( "routePartition", partition_uuid ) }' )
+    except Fault as err:
+        print( f'Zeep error: listChange/executeSQLQuery: { err }' )
+        sys.exit( 1 )
+
+# Load the route partition table, then add a partition; the cache applies the
+# change from listChange
+
+show_partition( 'Before addRoutePartition' )
+
+try:
+    resp = service.addRoutePartition( routePartition = { 'name': TEST_PARTITION } )
+except Fault as err:
+    print( f'Zeep error: addRoutePartition: { err }' )
+    sys.exit( 1 )
+
+partition_uuid = resp[ 'return' ]
+
+show_partition( 'After addRoutePartition' )
+
+input( '\nPress Enter to continue...' )
+
+# Rename the partition; the cache is updated in place from listChange
+
+try:
+    resp = service.updateRoutePartition( uuid = partition_uuid, newName = f'{ TEST_PARTITION }2' )
+except Fault as err:
+    print( f'Zeep error: updateRoutePartition: { err }' )
+    sys.exit( 1 )
+
+show_partition( 'After updateRoutePartition (renamed)' )
+
+input( '\nPress Enter to continue...' )
+
+# Cleanup
+# Remove the partition; the cache entry is dropped from listChange
+
+try:
+    resp = service.removeRoutePartition( uuid = partition_uuid )
+except Fault as err:
+    print( f'Zeep error: removeRoutePartition: { err }' )
+    sys.exit( 1 )
+
+show_partition( 'After removeRoutePartition' )
+
+print( f'\nCache stats: { cache.stats }' )
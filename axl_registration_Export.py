@@ -0,0 +1,252 @@
+"""AXL streaming registration export sample script, using the Zeep SOAP library
+
+axl_listRegistrationDynamic.py retrieves every registrationDynamic entry with
+a single <listRegistrationDynamic> request, builds Zeep objects for all of
+them, then prints the report.  This sample streams the same data to a file
+instead, holding only one page of devices in memory at a time:
+
+* Pages through <listRegistrationDynamic> using <skip>/<first>
+* Parses each raw response page with lxml (bypassing Zeep object creation),
+  producing compact __slots__ Registration records
+* Writes each page to CSV, JSONL or - if the pyarrow package is installed -
+  Parquet, based on the output file extension
+
+Usage: python axl_registration_Export.py [registrations.csv|.jsonl|.parquet]
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+import csv
+import json
+import sys
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+
+# pyarrow is optional, and only needed for Parquet output
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Output file; the extension selects the format
+OUTPUT_FILE = sys.argv[ 1 ] if len( sys.argv ) > 1 else 'registrations.csv'
+
+# Number of devices requested per <listRegistrationDynamic> page
+PAGE_SIZE = 5000
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+SOAP_ENV = '{http://schemas.xmlsoap.org/soap/envelope/}'
+
+# Parser for raw responses, allowing very large responses like Zeep's xml_huge_tree
+RAW_PARSER = etree.XMLParser( huge_tree = True, resolve_entities = False )
+
+class Registration:
+    """Compact registration record for one device"""
+
+    __slots__ = ( 'device', 'lastKnownIpAddress', 'lastKnownUcm', 'lastSeen', 'risStatus' )
+
+    def __init__( self, element ):
+        for field in self.__slots__:
+            setattr( self, field, element.findtext( field ) or '' )
+
+    def values( self ):
+        return [ getattr( self, field ) for field in self.__slots__ ]
+
+def iter_registrations():
+    """Yields pages (lists) of Registration records"""
+
+    returnedTags = { field: '' for field in Registration.__slots__ }
+    skip = 0
+
+    while True:
+
+        # Request the raw response, bypassing Zeep object creation
+        with client.settings( raw_response = True ):
+            response = service.listRegistrationDynamic( searchCriteria = { 'device': '%' },
+                returnedTags = returnedTags, skip = skip, first = PAGE_SIZE )
+
+        body = etree.fromstring( response.content, parser = RAW_PARSER ).find( f'{ SOAP_ENV }Body' )
+        fault = body.find( f'{ SOAP_ENV }Fault' )
+
+        if fault is not None:
+            raise Fault( fault.findtext( 'faultstring' ), code = fault.findtext( 'faultcode' ) )
+
+        page = [ Registration( element ) for element in body.iter( 'registrationDynamic' ) ]
+        del body
+
+        if page:
+            yield page
+
+        # A short page is the last one
+        if len( page ) < PAGE_SIZE:
+            return
+
+        skip += PAGE_SIZE
+
+class CsvWriter:
+
+    def __init__( self, filename ):
+        self.file = open( filename, 'w', newline = '' )
+        self.writer = csv.writer( self.file )
+        self.writer.writerow( Registration.__slots__ )
+
+    def write( self, page ):
+        self.writer.writerows( record.values() for record in page )
+
+    def close( self ):
+        self.file.close()
+
+class JsonlWriter:
+
+    def __init__( self, filename ):
+        self.file = open( filename, 'w' )
+
+    def write( self, page ):
+        self.file.writelines( json.dumps( dict( zip( Registration.__slots__, record.values() ) ) ) + '\n'
+            for record in page )
+
+    def close( self ):
+        self.file.close()
+
+class ParquetWriter:
+    """Writes each page as a Parquet row group"""
+
+    def __init__( self, filename ):
+        self.schema = pyarrow.schema( [ ( field, pyarrow.string() ) for field in Registration.__slots__ ] )
+        self.writer = pyarrow.parquet.ParquetWriter( filename, self.schema )
+
+    def write( self, page ):
+        columns = [ [ getattr( record, field ) for record in page ] for field in Registration.__slots__ ]
+        self.writer.write_table( pyarrow.Table.from_arrays( columns, schema = self.schema ) )
+
+    def close( self ):
+        self.writer.close()
+
+WRITERS = {
+    '.csv': CsvWriter,
+    '.jsonl': JsonlWriter,
+    '.parquet': ParquetWriter
+}
+
+extension = os.path.splitext( OUTPUT_FILE )[ 1 ].lower()
+
+if extension not in WRITERS:
+    print( f'Unsupported output format: { OUTPUT_FILE } (use .csv, .jsonl or .parquet)' )
+    sys.exit( 1 )
+
+if extension == '.parquet' and pyarrow is None:
+    print( 'Parquet output requires the pyarrow package: pip install pyarrow' )
+    sys.exit( 1 )
+
+writer = WRITERS[ extension ]( OUTPUT_FILE )
+
+print( f'\nExporting registrations to { OUTPUT_FILE }...\n' )
+
+start = time.perf_counter()
+count = 0
+statuses = { }
+
+try:
+    for page in iter_registrations():
+        writer.write( page )
+        count += len( page )
+        for record in page:
+            statuses[ record.risStatus ] = statuses.get( record.risStatus, 0 ) + 1
+        print( f'    { count } devices...' )
+
+except Fault as err:
+    print( f'Zeep error: listRegistrationDynamic: { err }' )
+    sys.exit( 1 )
+
+finally:
+    writer.close()
+
+print( f'\nExported { count } devices in { time.perf_counter() - start:.2f} sec\n' )
+
+for status, total in sorted( statuses.items() ):
+    print( f'    { status or "(none)":20}{ total:>8}' )
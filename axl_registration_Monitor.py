@@ -0,0 +1,295 @@
+"""AXL registration delta monitor sample script, using the Zeep SOAP library
+
+Polls device registration state via <listRegistrationDynamic> every
+POLL_INTERVAL seconds, and prints only what changed since the previous
+poll:
+
+* REGISTERED / UNREGISTERED - risStatus changed to/from "Registered"
+* MOVED - lastKnownUcm changed (e.g. failover to another node)
+* IP_CHANGED - lastKnownIpAddress changed
+* NEW / GONE - device appeared in/disappeared from the results
+
+If more than STORM_THRESHOLD devices unregister in one cycle, a
+registration storm alert is printed.
+
+Each snapshot is held in a compact index: a sorted list of device names,
+plus parallel array.array columns of interned status/UCM/IP value codes.
+The delta is computed with a single pass over the columns (when the device
+set is unchanged, the common case) or a merge-join of the sorted names.
+
+(Press Ctrl+C to exit)
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from array import array
+import sys
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Seconds between polls
+POLL_INTERVAL = 60
+
+# Number of devices requested per <listRegistrationDynamic> page
+PAGE_SIZE = 5000
+
+# Number of devices unregistering in one cycle which triggers a storm alert
+STORM_THRESHOLD = 50
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+SOAP_ENV = '{http://schemas.xmlsoap.org/soap/envelope/}'
+
+# Parser for raw responses, allowing very large responses like Zeep's xml_huge_tree
+RAW_PARSER = etree.XMLParser( huge_tree = True, resolve_entities = False )
+
+def iter_registrations():
+    """Yields ( device, risStatus, lastKnownUcm, lastKnownIpAddress ) for all devices"""
+
+    returnedTags = { 'device': '', 'risStatus': '', 'lastKnownUcm': '', 'lastKnownIpAddress': '' }
+    skip = 0
+
+    while True:
+
+        # Request the raw response, bypassing Zeep object creation
+        with client.settings( raw_response = True ):
+            response = service.listRegistrationDynamic( searchCriteria = { 'device': '%' },
+                returnedTags = returnedTags, skip = skip, first = PAGE_SIZE )
+
+        body = etree.fromstring( response.content, parser = RAW_PARSER ).find( f'{ SOAP_ENV }Body' )
+        fault = body.find( f'{ SOAP_ENV }Fault' )
+
+        if fault is not None:
+            raise Fault( fault.findtext( 'faultstring' ), code = fault.findtext( 'faultcode' ) )
+
+        count = 0
+        for element in body.iter( 'registrationDynamic' ):
+            count += 1
+            yield ( element.findtext( 'device' ), element.findtext( 'risStatus' ) or '',
+                element.findtext( 'lastKnownUcm' ) or '', element.findtext( 'lastKnownIpAddress' ) or '' )
+
+        # A short page is the last one
+        if count < PAGE_SIZE:
+            return
+
+        skip += PAGE_SIZE
+
+class Interner:
+    """Maps repeated string values (statuses, UCM names, IPs) to small integer codes"""
+
+    def __init__( self ):
+        self.codes = { }
+        self.values = [ ]
+
+    def code( self, value ):
+        code = self.codes.get( value )
+        if code is None:
+            code = self.codes[ value ] = len( self.values )
+            self.values.append( value )
+        return code
+
+class Snapshot:
+    """Registration state for all devices: sorted names plus parallel code columns"""
+
+    __slots__ = ( 'names', 'status', 'ucm', 'ip' )
+
+    def __init__( self, rows, interner ):
+        rows = sorted( rows )
+        code = interner.code
+        self.names = [ row[ 0 ] for row in rows ]
+        self.status = array( 'I', [ code( row[ 1 ] ) for row in rows ] )
+        self.ucm = array( 'I', [ code( row[ 2 ] ) for row in rows ] )
+        self.ip = array( 'I', [ code( row[ 3 ] ) for row in rows ] )
+
+def pairs( old, new ):
+    """Yields ( old row, new row ) index pairs for the same device (either may be None).
+
+    Rows known to be unchanged may be omitted.
+    """
+
+    # Same device set: rows line up one to one, so compare whole columns first
+    # and walk rows only for the columns that differ
+    if old.names == new.names:
+        changed = set( )
+        for old_column, new_column in ( ( old.status, new.status ), ( old.ucm, new.ucm ), ( old.ip, new.ip ) ):
+            if old_column != new_column:
+                changed.update( i for i, ( a, b ) in enumerate( zip( old_column, new_column ) ) if a != b )
+        yield from ( ( i, i ) for i in sorted( changed ) )
+        return
+
+    i = j = 0
+    while i < len( old.names ) or j < len( new.names ):
+        if j == len( new.names ) or ( i < len( old.names ) and old.names[ i ] < new.names[ j ] ):
+            yield i, None
+            i += 1
+        elif i == len( old.names ) or new.names[ j ] < old.names[ i ]:
+            yield None, j
+            j += 1
+        else:
+            yield i, j
+            i += 1
+            j += 1
+
+def delta( old, new, interner ):
+    """Returns a list of ( event, device, old value, new value ) tuples"""
+
+    registered = interner.code( 'Registered' )
+    values = interner.values
+    events = [ ]
+
+    for i, j in pairs( old, new ):
+
+        if j is None:
+            events.append( ( 'GONE', old.names[ i ], values[ old.status[ i ] ], '' ) )
+            continue
+
+        if i is None:
+            events.append( ( 'NEW', new.names[ j ], '', values[ new.status[ j ] ] ) )
+            continue
+
+        # Unchanged device: three integer comparisons
+        if old.status[ i ] == new.status[ j ] and old.ucm[ i ] == new.ucm[ j ] and old.ip[ i ] == new.ip[ j ]:
+            continue
+
+        name = new.names[ j ]
+
+        if old.status[ i ] != new.status[ j ]:
+            if new.status[ j ] == registered:
+                events.append( ( 'REGISTERED', name, values[ old.status[ i ] ], values[ new.status[ j ] ] ) )
+            elif old.status[ i ] == registered:
+                events.append( ( 'UNREGISTERED', name, values[ old.status[ i ] ], values[ new.status[ j ] ] ) )
+
+        if old.ucm[ i ] != new.ucm[ j ]:
+            events.append( ( 'MOVED', name, values[ old.ucm[ i ] ], values[ new.ucm[ j ] ] ) )
+
+        if old.ip[ i ] != new.ip[ j ]:
+            events.append( ( 'IP_CHANGED', name, values[ old.ip[ i ] ], values[ new.ip[ j ] ] ) )
+
+    return events
+
+interner = Interner()
+
+def poll():
+    try:
+        return Snapshot( iter_registrations(), interner )
+    except Fault as err:
+        print( f'Zeep error: listRegistrationDynamic: { err }' )
+        sys.exit( 1 )
+
+previous = poll()
+
+print( f'\nBaseline: { len( previous.names ) } devices, '
+    f'{ sum( 1 for code in previous.status if interner.values[ code ] == "Registered" ) } registered' )
+
+print( '\nStarting loop to monitor registration changes...' )
+print( '(Press Ctrl+C to exit)\n' )
+print( f'Time{ 5 * " " } Event{ 8 * " " } Device{ 26 * " " } Old{ 18 * " " } New' )
+print( f'{ 8 * "-" } { 12 * "-" } { 31 * "-" } { 20 * "-" } { 20 * "-" }' )
+
+while True:
+
+    time.sleep( POLL_INTERVAL )
+
+    current = poll()
+    start = time.perf_counter()
+    events = delta( previous, current, interner )
+    elapsed = time.perf_counter() - start
+    previous = current
+
+    now = time.strftime( '%H:%M:%S' )
+
+    for event, device, old, new in events:
+        print( f'{ now } { event:12} { device:31} { old:20} { new }' )
+
+    unregistered = sum( 1 for event in events if event[ 0 ] == 'UNREGISTERED' )
+
+    if unregistered > STORM_THRESHOLD:
+        print( f'\n{ now } *** REGISTRATION STORM: { unregistered } devices unregistered '
+            f'since the last poll ***\n' )
+
+    if events:
+        print( f'{ now } { len( events ) } event(s), { len( current.names ) } devices compared '
+            f'in { elapsed * 1000:.1f} ms' )
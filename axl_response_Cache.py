@@ -0,0 +1,436 @@
+"""AXL read-through response cache sample script, using the Zeep SOAP library
+
+Tools often repeat the same get*/list* requests (<getPhone>, <getUser>,
+<listProcessNode>, <listSipTrunk>...) for the same objects within minutes.
+This sample wraps the Zeep service proxy with an opt-in read-through cache:
+
+* get*/list* responses are cached, keyed on the operation name plus the
+  normalized request arguments
+* Two tiers: an in-memory LRU and an on-disk SQLite LRU, each bounded by
+  total (pickled) response size; disk hits are promoted to memory
+* Consistency is kept via the AXL 'Data Change Notification' feed
+  (<listChange>, see axl_listChange.py), polled at most every
+  POLL_INTERVAL seconds before serving a hit: a change invalidates cached
+  get* responses for that object uuid, and all cached list* responses for
+  that object type.  The change queue position is stored with the disk tier,
+  so the cache stays valid across runs (and is cleared if the queue expired)
+* Other requests pass through; add*/update*/remove* requests made via the
+  proxy also invalidate their object type immediately
+
+Note: only the changed object's own type is invalidated, e.g. a <getPhone>
+response embedding line details is not invalidated by a Line change.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from collections import OrderedDict
+import json
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+from zeep.helpers import serialize_object
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# SQLite file for the disk tier
+CACHE_FILE = 'axl_response_cache.sqlite'
+
+# Size bounds for the memory and disk tiers, in bytes of pickled responses
+MEMORY_MAX_BYTES = 16 * 1024 * 1024
+DISK_MAX_BYTES = 256 * 1024 * 1024
+
+# Maximum age (seconds) of the last <listChange> poll when serving a hit
+POLL_INTERVAL = 5
+
+# User ID of the test user created by the demo
+TEST_USERID = 'testResponseCache'
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+def object_type( operation ):
+    """'getSipTrunk' -> 'SipTrunk', 'listProcessNode' -> 'ProcessNode'
+
+    Matches the <listChange> object type names for most objects.
+    """
+
+    for prefix in ( 'get', 'list', 'add', 'update', 'remove' ):
+        if operation.startswith( prefix ):
+            return operation[ len( prefix ): ]
+
+    return None
+
+class CachedService:
+    """Read-through cache proxy for a Zeep AXL service, see module docstring"""
+
+    def __init__( self, client, service, cache_file = CACHE_FILE,
+            memory_max_bytes = MEMORY_MAX_BYTES, disk_max_bytes = DISK_MAX_BYTES,
+            poll_interval = POLL_INTERVAL ):
+        self.client = client
+        self.service = service
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.poll_interval = poll_interval
+        self.stats = { 'memory': 0, 'disk': 0, 'misses': 0, 'invalidated': 0 }
+
+        self._lock = threading.RLock()
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._parameters = { }
+
+        self._db = sqlite3.connect( cache_file, check_same_thread = False )
+        self._db.executescript( '''
+            CREATE TABLE IF NOT EXISTS responses ( key TEXT PRIMARY KEY, type TEXT,
+                uuid TEXT, value BLOB, size INTEGER, accessed REAL );
+            CREATE INDEX IF NOT EXISTS responses_type ON responses ( type, uuid );
+            CREATE INDEX IF NOT EXISTS responses_accessed ON responses ( accessed );
+            CREATE TABLE IF NOT EXISTS queue ( id INTEGER PRIMARY KEY CHECK ( id = 0 ),
+                queueId TEXT, nextStartChangeId INTEGER );''' )
+        self._disk_bytes = self._db.execute( 'SELECT TOTAL( size ) FROM responses' ).fetchone()[ 0 ]
+
+        # Resume the change queue saved with the disk tier, if still valid
+        saved = self._db.execute( 'SELECT queueId, nextStartChangeId FROM queue' ).fetchone()
+        self._queue_id, self._next_change_id = saved if saved else ( None, None )
+        self._last_poll = 0
+
+        try:
+            self.poll_changes()
+        except Fault:
+            self._queue_id = None
+
+        if self._queue_id is None:
+            self._reset_queue()
+
+    def __getattr__( self, operation ):
+
+        if operation.startswith( ( 'get', 'list' ) ) and operation != 'listChange':
+            return lambda *args, **kwargs: self._read( operation, args, kwargs )
+
+        method = getattr( self.service, operation )
+
+        if not operation.startswith( ( 'add', 'update', 'remove' ) ):
+            return method
+
+        def write( *args, **kwargs ):
+            try:
+                return method( *args, **kwargs )
+            finally:
+                self.invalidate( object_type( operation ) )
+
+        return write
+
+    def _reset_queue( self ):
+        """Start a new change queue; anything cached so far can no longer be trusted"""
+
+        resp = self.service.listChange()
+
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._db.execute( 'DELETE FROM responses' )
+            self._disk_bytes = 0
+            self._save_queue( resp.queueInfo.queueId, resp.queueInfo.nextStartChangeId )
+
+        self._last_poll = time.monotonic()
+
+    def _save_queue( self, queue_id, next_change_id ):
+        self._queue_id, self._next_change_id = queue_id, next_change_id
+        self._db.execute( 'INSERT OR REPLACE INTO queue VALUES ( 0, ?, ? )', ( queue_id, next_change_id ) )
+        self._db.commit()
+
+    def _key( self, operation, args, kwargs ):
+        """Normalized cache key: positional args bound to the request element names"""
+
+        if operation not in self._parameters:
+            element = self.client.get_element( f'ns0:{ operation }' )
+            self._parameters[ operation ] = [ name for name, _ in element.type.elements ]
+
+        arguments = dict( zip( self._parameters[ operation ], args ) )
+        arguments.update( kwargs )
+
+        return operation + json.dumps( serialize_object( arguments, dict ), sort_keys = True,
+            separators = ( ',', ':' ), default = str )
+
+    def _read( self, operation, args, kwargs ):
+
+        key = self._key( operation, args, kwargs )
+
+        if time.monotonic() - self._last_poll > self.poll_interval:
+            self.poll_changes()
+
+        with self._lock:
+            entry = self._memory.get( key )
+            if entry is not None:
+                self._memory.move_to_end( key )
+                self.stats[ 'memory' ] += 1
+                return pickle.loads( entry[ 0 ] )
+
+            row = self._db.execute( 'SELECT value, type, uuid FROM responses WHERE key = ?', ( key, ) ).fetchone()
+            if row is not None:
+                self._db.execute( 'UPDATE responses SET accessed = ? WHERE key = ?', ( time.time(), key ) )
+                self._db.commit()
+                self._remember( key, *row )
+                self.stats[ 'disk' ] += 1
+                return pickle.loads( row[ 0 ] )
+
+            self.stats[ 'misses' ] += 1
+
+        resp = getattr( self.service, operation )( *args, **kwargs )
+
+        # list* responses are invalidated by type; get* responses by object uuid
+        uuid = None
+        if operation.startswith( 'get' ):
+            try:
+                returned = next( iter( resp[ 'return' ].__values__.values() ) )
+                uuid = returned.uuid.strip( '{}' ).lower()
+            except ( AttributeError, KeyError, StopIteration, TypeError ):
+                pass
+
+        value = pickle.dumps( resp, pickle.HIGHEST_PROTOCOL )
+
+        with self._lock:
+            self._remember( key, value, object_type( operation ), uuid )
+            self._store( key, value, object_type( operation ), uuid )
+
+        return resp
+
+    def _remember( self, key, value, type, uuid ):
+        """Adds an entry to the memory tier, evicting least recently used entries"""
+
+        if key in self._memory:
+            self._memory_bytes -= len( self._memory.pop( key )[ 0 ] )
+
+        self._memory[ key ] = ( value, type, uuid )
+        self._memory_bytes += len( value )
+
+        while self._memory_bytes > self.memory_max_bytes and len( self._memory ) > 1:
+            old_key, ( old_value, _, _ ) = self._memory.popitem( last = False )
+            self._memory_bytes -= len( old_value )
+
+    def _store( self, key, value, type, uuid ):
+        """Adds an entry to the disk tier, evicting least recently used entries"""
+
+        old = self._db.execute( 'SELECT size FROM responses WHERE key = ?', ( key, ) ).fetchone()
+        self._disk_bytes += len( value ) - ( old[ 0 ] if old else 0 )
+        self._db.execute( 'INSERT OR REPLACE INTO responses VALUES ( ?, ?, ?, ?, ?, ? )',
+            ( key, type, uuid, value, len( value ), time.time() ) )
+
+        while self._disk_bytes > self.disk_max_bytes:
+            oldest = self._db.execute( '''SELECT key, size FROM responses WHERE key != ?
+                ORDER BY accessed LIMIT 100''', ( key, ) ).fetchall()
+            if not oldest:
+                break
+            self._db.executemany( 'DELETE FROM responses WHERE key = ?', [ ( k, ) for k, _ in oldest ] )
+            self._disk_bytes -= sum( size for _, size in oldest )
+
+        self._db.commit()
+
+    def invalidate( self, type, uuid = None ):
+        """Drops cached list* responses for type, plus get* responses for the
+        uuid (or for all objects of type, if no uuid is given)"""
+
+        with self._lock:
+            for key, ( value, entry_type, entry_uuid ) in list( self._memory.items() ):
+                if entry_type == type and ( uuid is None or entry_uuid in ( None, uuid ) ):
+                    self._memory_bytes -= len( self._memory.pop( key )[ 0 ] )
+                    self.stats[ 'invalidated' ] += 1
+
+            if uuid is None:
+                where, parameters = 'type = ?', ( type, )
+            else:
+                where, parameters = 'type = ? AND ( uuid IS NULL OR uuid = ? )', ( type, uuid )
+
+            self._disk_bytes -= self._db.execute(
+                f'SELECT TOTAL( size ) FROM responses WHERE { where }', parameters ).fetchone()[ 0 ]
+            self._db.execute( f'DELETE FROM responses WHERE { where }', parameters )
+            self._db.commit()
+
+    def poll_changes( self ):
+        """Applies changes from the <listChange> feed to the cache"""
+
+        if self._queue_id is None:
+            return
+
+        resp = self.service.listChange(
+            startChangeId = { 'queueId': self._queue_id, '_value_1': self._next_change_id } )
+
+        if resp.changes:
+            for change in resp.changes.change:
+                self.invalidate( change.type, change.uuid.strip( '{}' ).lower() )
+
+        with self._lock:
+            self._save_queue( self._queue_id, resp.queueInfo.nextStartChangeId )
+
+        self._last_poll = time.monotonic()
+
+try:
+    cached = CachedService( client, service )
+except Fault as err:
+    print( f'Zeep error: listChange: { err }' )
+    sys.exit( 1 )
+
+def timed( step, operation, *args, **kwargs ):
+    """Executes a request via the cache, printing the elapsed time"""
+
+    start = time.perf_counter()
+
+    try:
+        resp = getattr( cached, operation )( *args, **kwargs )
+    except Fault as err:
+        print( f'Zeep error: { operation }: { err }' )
+        sys.exit( 1 )
+
+    print( f'    { step:44}{ ( time.perf_counter() - start ) * 1000:8.1f} ms' )
+    return resp
+
+# Repeat some reads: after the first request, responses come from the cache
+
+print( '\nRepeated reads:\n' )
+
+for x in range( 3 ):
+    timed( f'listProcessNode (#{ x + 1 })', 'listProcessNode',
+        { 'name': '%', 'processNodeRole': 'CUCM Voice/Video' }, { 'name': '' } )
+
+print( f'\nCache stats: { cached.stats }' )
+
+input( '\nPress Enter to continue...' )
+
+# Create a test user directly (not via the cache), then read it twice
+
+try:
+    resp = service.addUser( user = { 'userid': TEST_USERID, 'lastName': 'Cache',
+        'presenceGroupName': 'Standard Presence group' } )
+except Fault as err:
+    print( f'Zeep error: addUser: { err }' )
+    sys.exit( 1 )
+
+print( '\nTest user reads:\n' )
+
+for x in range( 2 ):
+    resp = timed( f'getUser (#{ x + 1 })', 'getUser', userid = TEST_USERID,
+        returnedTags = { 'lastName': '' } )
+
+print( f'\n    lastName: { resp[ "return" ][ "user" ][ "lastName" ] }' )
+
+input( '\nPress Enter to continue...' )
+
+# Update the user directly; once the change is seen via listChange, the cached
+# response is invalidated
+
+try:
+    resp = service.updateUser( userid = TEST_USERID, lastName = 'Cache Updated' )
+except Fault as err:
+    print( f'Zeep error: updateUser: { err }' )
+    sys.exit( 1 )
+
+print( '\nTest user reads after updateUser:\n' )
+
+try:
+    cached.poll_changes()
+except Fault as err:
+    print( f'Zeep error: listChange: { err }' )
+    sys.exit( 1 )
+
+for x in range( 2 ):
+    resp = timed( f'getUser (#{ x + 1 })', 'getUser', userid = TEST_USERID,
+        returnedTags = { 'lastName': '' } )
+
+print( f'\n    lastName: { resp[ "return" ][ "user" ][ "lastName" ] }' )
+
+print( f'\nCache stats: { cached.stats }' )
+
+input( '\nPress Enter to continue...' )
+
+# Cleanup
+# Remove the test user via the cache proxy, which invalidates cached User reads
+
+try:
+    resp = cached.removeUser( userid = TEST_USERID )
+except Fault as err:
+    print( f'Zeep error: removeUser: { err }' )
+    sys.exit( 1 )
+
+print( '\nCleanup: SUCCESS' )
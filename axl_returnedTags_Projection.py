@@ -0,0 +1,260 @@
+"""AXL returnedTags projection sample script, using the Zeep SOAP library
+
+For get* requests, AXL returns only the fields listed in <returnedTags>, but
+building that structure by hand is error-prone, and Zeep's response objects
+still contain every field of the type (set to None), which makes it hard to
+see what was actually returned.
+
+This sample builds <returnedTags> from a list of dotted field paths (e.g.
+'lines.line.dirn.pattern'), validating each path against the schema before
+any request is sent, so only the requested elements are serialized and the
+server returns a small payload.  Responses are projected back into plain
+dicts containing only the requested fields.
+
+Retrieves the first few phones via <listPhone>, then audits each via
+<getPhone> and <getLine> using projections, and reports request/response sizes.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+import sys
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+from zeep.helpers import serialize_object
+from zeep.xsd import ComplexType
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Maximum number of phones to audit
+AUDIT_LIMIT = 10
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+
+# Keep track of request/response body sizes via a requests response hook
+sizes = { 'request': 0, 'response': 0 }
+
+def count_bytes( response, *args, **kwargs ):
+
+    sizes[ 'request' ] += len( response.request.body or b'' )
+    sizes[ 'response' ] += len( response.content )
+
+session.hooks[ 'response' ].append( count_bytes )
+
+class Projection:
+    """returnedTags builder/response projector for a get* operation
+
+    paths is a list of dotted field paths relative to the returned object,
+    e.g. [ 'name', 'devicePoolName', 'lines.line.dirn.pattern' ].  Each path
+    is checked against the operation's returnedTags type, raising ValueError
+    for unknown fields.
+    """
+
+    def __init__( self, client, operation, paths ):
+
+        self.operation = operation
+
+        request = client.get_element( f'ns0:{ operation }' )
+        returned = dict( request.type.elements ).get( 'returnedTags' )
+
+        if returned is None:
+            raise ValueError( f'{ operation } does not support returnedTags' )
+
+        # Build a tree of requested names, e.g. { 'lines': { 'line': { 'dirn': { 'pattern': { } } } } }
+        self.tree = { }
+        for path in paths:
+            node, xsd_type = self.tree, returned.type
+            for name in path.split( '.' ):
+                children = { }
+                if isinstance( xsd_type, ComplexType ):
+                    children.update( xsd_type.elements )
+                    children.update( xsd_type.attributes )
+                if name not in children:
+                    raise ValueError( f'{ operation }: "{ path }" is not a valid returnedTags path' )
+                xsd_type = children[ name ].type
+                node = node.setdefault( name, { } )
+
+        self.returnedTags = self._tags( self.tree )
+
+    def _tags( self, tree ):
+
+        # Leaf elements are sent empty, e.g. <name/>
+        return { name: self._tags( subtree ) if subtree else '' for name, subtree in tree.items() }
+
+    def _project( self, value, tree ):
+
+        if value is None:
+            return None
+
+        if isinstance( value, list ):
+            return [ self._project( item, tree ) for item in value ]
+
+        if not tree:
+            value = serialize_object( value )
+            # Unwrap elements with attributes (like devicePoolName) to their text value
+            if isinstance( value, dict ) and '_value_1' in value:
+                return value[ '_value_1' ]
+            return value
+
+        return { name: self._project( value[ name ], subtree ) for name, subtree in tree.items() }
+
+    def __call__( self, service, **kwargs ):
+        """Execute the get* request, returning a dict of just the requested fields"""
+
+        resp = getattr( service, self.operation )( returnedTags = self.returnedTags, **kwargs )
+
+        # The return element contains a single object, e.g. <phone> for getPhone
+        returned = resp[ 'return' ]
+        return self._project( returned[ list( returned )[ 0 ] ], self.tree )
+
+# Projections for the audit, built/validated once up front
+
+phone_projection = Projection( client, 'getPhone', [
+    'name',
+    'description',
+    'devicePoolName',
+    'ownerUserName',
+    'lines.line.index',
+    'lines.line.dirn.pattern',
+    'lines.line.dirn.routePartitionName'
+] )
+
+line_projection = Projection( client, 'getLine', [
+    'pattern',
+    'description',
+    'callForwardAll.destination'
+] )
+
+# Other supported operations work the same way, e.g.
+user_projection = Projection( client, 'getUser', [ 'firstName', 'lastName', 'associatedGroups.userGroup.name' ] )
+trunk_projection = Projection( client, 'getSipTrunk', [ 'name', 'destinations.destination.addressIpv4' ] )
+
+# Invalid paths are caught before anything is sent to CUCM
+try:
+    Projection( client, 'getPhone', [ 'lines.line.dirn.patern' ] )
+except ValueError as err:
+    print( f'\nProjection error (expected): { err }' )
+
+for projection in [ phone_projection, line_projection, user_projection, trunk_projection ]:
+    print( f'\n{ projection.operation } returnedTags:' )
+    print( projection.returnedTags )
+
+input( '\nPress Enter to continue...' )
+
+# Retrieve the names of the phones to audit
+try:
+    resp = service.listPhone( searchCriteria = { 'name': '%' }, returnedTags = { 'name': '' },
+        first = AUDIT_LIMIT )
+except Fault as err:
+    print( f'Zeep error: listPhone: { err }' )
+    sys.exit( 1 )
+
+phones = resp[ 'return' ][ 'phone' ] if resp[ 'return' ] else [ ]
+
+sizes[ 'request' ] = sizes[ 'response' ] = 0
+
+for phone in phones:
+
+    try:
+        phone_info = phone_projection( service, name = phone[ 'name' ] )
+    except Fault as err:
+        print( f'Zeep error: getPhone: { err }' )
+        sys.exit( 1 )
+
+    print( f'\n{ phone_info }' )
+
+    lines = phone_info[ 'lines' ][ 'line' ] if phone_info[ 'lines' ] else [ ]
+
+    for line in lines:
+
+        try:
+            line_info = line_projection( service, pattern = line[ 'dirn' ][ 'pattern' ],
+                routePartitionName = line[ 'dirn' ][ 'routePartitionName' ] )
+        except Fault as err:
+            print( f'Zeep error: getLine: { err }' )
+            continue
+
+        print( f'    { line_info }' )
+
+print( f'\nAudited { len( phones ) } phones: { sizes[ "request" ] } request bytes, '
+    f'{ sizes[ "response" ] } response bytes' )
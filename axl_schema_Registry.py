@@ -0,0 +1,300 @@
+"""AXL multi-version schema registry sample script, using the Zeep SOAP library
+
+This project ships a single set of AXL schema files (schema/), but a fleet
+may mix CUCM versions (11.5, 12.5, 14, 15...).  Sending a request built
+from the wrong schema version can fail, or silently mis-serialize fields
+which differ between versions.
+
+This sample provides a SchemaRegistry which:
+
+* Discovers the available schema versions: schema/ itself plus any
+  schema/<version>/ directories holding the AXL toolkit files for other
+  versions (AXLAPI.wsdl, AXLSoap.xsd, AXLEnums.xsd), reading each version
+  from the AXLSoap.xsd target namespace
+* Parses each version's WSDL at most once per process (optionally
+  preloading in the background), sharing the parsed document between all
+  clients of that version
+* Detects a cluster's version with a single <getCCMVersion> request, cached
+  per address in VERSION_CACHE_FILE for VERSION_CACHE_TTL seconds, and
+  selects the highest registered schema not newer than the cluster
+* Adds a plugin which sets the SOAPAction header version ("CUCM:DB ver=14.0
+  getPhone") to match the namespace of the serialized request
+
+Note: Zeep's parsed WSDL documents include dynamically created classes and
+cannot be pickled, so the documents are cached in memory rather than on disk.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from concurrent.futures import ThreadPoolExecutor
+import json
+import re
+import sys
+import threading
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The base schema directory; other versions go in schema/<version>/
+SCHEMA_DIR = 'schema'
+
+# Cache of detected cluster versions, and how long (seconds) entries are trusted
+VERSION_CACHE_FILE = 'axl_versions.json'
+VERSION_CACHE_TTL = 24 * 60 * 60
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+AXL_NAMESPACE = re.compile( r'http://www\.cisco\.com/AXL/API/(\d+\.\d+)' )
+
+def version_key( version ):
+    """'12.5' -> ( 12, 5 ), for ordering versions numerically"""
+    return tuple( int( part ) for part in version.split( '.' ) )
+
+class SoapActionVersionPlugin( Plugin ):
+    """Sets the SOAPAction header version to the request's AXL namespace version"""
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        body = envelope.find( '{http://schemas.xmlsoap.org/soap/envelope/}Body' )
+        match = AXL_NAMESPACE.match( etree.QName( body[ 0 ] ).namespace or '' )
+
+        if match:
+            http_headers[ 'SOAPAction' ] = re.sub( r'ver=[\d.]+', f'ver={ match.group( 1 ) }',
+                http_headers[ 'SOAPAction' ] )
+
+        return envelope, http_headers
+
+class SchemaRegistry:
+    """Registry of AXL schema versions, see the module docstring"""
+
+    def __init__( self, schema_dir = SCHEMA_DIR, cache_file = VERSION_CACHE_FILE,
+            cache_ttl = VERSION_CACHE_TTL ):
+        self.settings = Settings( strict = False, xml_huge_tree = True )
+        self.cache_file = cache_file
+        self.cache_ttl = cache_ttl
+        self.directories = { }
+        self._documents = { }
+        self._locks = { }
+        self._lock = threading.Lock()
+
+        for directory in [ schema_dir ] + [ os.path.join( schema_dir, entry )
+                for entry in sorted( os.listdir( schema_dir ) ) ]:
+            version = self._schema_version( directory )
+            # A version directory takes precedence over the base schema/ files
+            if version and ( version not in self.directories or directory != schema_dir ):
+                self.directories[ version ] = directory
+
+        try:
+            with open( cache_file ) as file:
+                self._versions = json.load( file )
+        except ( FileNotFoundError, ValueError ):
+            self._versions = { }
+
+    @staticmethod
+    def _schema_version( directory ):
+        """Reads the AXL version from the AXLSoap.xsd target namespace, without parsing the file"""
+
+        path = os.path.join( directory, 'AXLSoap.xsd' )
+        if not os.path.isfile( path ) or not os.path.isfile( os.path.join( directory, 'AXLAPI.wsdl' ) ):
+            return None
+
+        for event, element in etree.iterparse( path, events = ( 'start', ) ):
+            match = AXL_NAMESPACE.match( element.get( 'targetNamespace', '' ) )
+            return match.group( 1 ) if match else None
+
+    @property
+    def versions( self ):
+        return sorted( self.directories, key = version_key )
+
+    def document( self, version ):
+        """Returns the parsed WSDL document for a version, parsing it once"""
+
+        with self._lock:
+            if version in self._documents:
+                return self._documents[ version ]
+            lock = self._locks.setdefault( version, threading.Lock() )
+
+        # Parse outside the registry lock, so different versions parse concurrently
+        with lock:
+            if version not in self._documents:
+                wsdl = os.path.join( self.directories[ version ], 'AXLAPI.wsdl' )
+                self._documents[ version ] = Client( wsdl, settings = self.settings ).wsdl
+
+        return self._documents[ version ]
+
+    def preload( self, versions = None ):
+        """Starts parsing the given (default all) versions in the background"""
+
+        executor = ThreadPoolExecutor( max_workers = 1 )
+        for version in versions or self.versions:
+            executor.submit( self.document, version )
+        executor.shutdown( wait = False )
+
+    def select( self, cucm_version ):
+        """Returns the highest registered schema version not newer than the CUCM version.
+
+        Raises ValueError if every registered schema is newer than the cluster.
+        """
+
+        cluster = version_key( '.'.join( cucm_version.split( '.' )[ :2 ] ) )
+        candidates = [ version for version in self.versions if version_key( version ) <= cluster ]
+
+        if not candidates:
+            raise ValueError( f'CUCM version { cucm_version } is older than every registered '
+                f'schema ({ ", ".join( self.versions ) })' )
+
+        return candidates[ -1 ]
+
+    def create_client( self, version, transport, plugins = None ):
+        return Client( self.document( version ), settings = self.settings, transport = transport,
+            plugins = [ SoapActionVersionPlugin() ] + ( plugins or [ ] ) )
+
+    def detect_version( self, address, transport ):
+        """Returns the CUCM version of the cluster at address, via a cached <getCCMVersion>"""
+
+        cached = self._versions.get( address )
+        if cached and time.time() - cached[ 'checked' ] < self.cache_ttl:
+            return cached[ 'version' ]
+
+        # Use the oldest schema, which newer clusters also accept
+        service = self.create_client( self.versions[ 0 ], transport ).create_service(
+            '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding', f'https://{ address }:8443/axl/' )
+
+        version = service.getCCMVersion()[ 'return' ][ 'componentVersion' ][ 'version' ]
+
+        with self._lock:
+            self._versions[ address ] = { 'version': version, 'checked': time.time() }
+            with open( self.cache_file, 'w' ) as file:
+                json.dump( self._versions, file, indent = 4 )
+
+        return version
+
+    def create_service( self, address, transport, plugins = None ):
+        """Returns ( service, schema version ) for the cluster at address"""
+
+        version = self.select( self.detect_version( address, transport ) )
+        client = self.create_client( version, transport, plugins )
+
+        return client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+            f'https://{ address }:8443/axl/' ), version
+
+# Record the SOAPAction header of the last request, for display
+class HeaderPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+        self.soap_action = http_headers[ 'SOAPAction' ]
+        return envelope, http_headers
+
+registry = SchemaRegistry()
+
+print( f'\nRegistered schema versions: { ", ".join( registry.versions ) }' )
+
+# Start parsing all schema versions while the cluster version is detected
+registry.preload()
+
+address = os.getenv( 'CUCM_ADDRESS' )
+
+for x in range( 2 ):
+
+    start = time.perf_counter()
+
+    try:
+        cucm_version = registry.detect_version( address, transport )
+    except Fault as err:
+        print( f'Zeep error: getCCMVersion: { err }' )
+        sys.exit( 1 )
+
+    print( f'\nCUCM version: { cucm_version } (detected in { time.perf_counter() - start:.3f} sec)' )
+
+input( '\nPress Enter to continue...' )
+
+header_plugin = HeaderPlugin()
+plugins = [ header_plugin ] + ( [ MyLoggingPlugin() ] if DEBUG else [ ] )
+
+start = time.perf_counter()
+
+try:
+    service, version = registry.create_service( address, transport, plugins )
+except Fault as err:
+    print( f'Zeep error: getCCMVersion: { err }' )
+    sys.exit( 1 )
+except ValueError as err:
+    print( f'Error: { err }' )
+    sys.exit( 1 )
+
+print( f'\nSelected schema version { version } from { registry.directories[ version ] }/ '
+    f'(client created in { time.perf_counter() - start:.3f} sec)' )
+
+try:
+    resp = service.listProcessNode( searchCriteria = { 'name': '%' }, returnedTags = { 'name': '' } )
+except Fault as err:
+    print( f'Zeep error: listProcessNode: { err }' )
+    sys.exit( 1 )
+
+print( f'\nSOAPAction: { header_plugin.soap_action }' )
+print( f'Process nodes: { ", ".join( node.name for node in resp[ "return" ][ "processNode" ] ) }' )
@@ -0,0 +1,244 @@
+"""AXL service parameter rollout sample script, using the Zeep SOAP library
+
+axl_update_Service_Parameter.py updates a single service parameter on each
+CUCM Voice/Video process node, one request at a time.  This sample rolls out
+a set of service parameters to all nodes concurrently:
+
+1. Lists all Process Nodes with "CUCM Voice/Video" role (<listProcessNode>)
+2. Reads the current value of every parameter on every node, concurrently
+   (<getServiceParameter>), and plans only the updates which change a value
+3. Applies the planned updates concurrently (<updateServiceParameter>) and
+   reports the results per node
+4. Restores the previous values, using the same rollout mechanism
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# The service parameters to roll out: ( service, parameter name, value )
+PARAMETERS = [
+    ( 'Cisco CallManager', 'CdrEnabled', 'T' ),
+    ( 'Cisco CallManager', 'CdrLogCallsWithZeroDurationFlag', 'T' ),
+    ( 'Cisco CallManager', 'CallDiagnosticsEnabled', '1' )
+]
+
+# Maximum number of concurrent requests
+MAX_WORKERS = 8
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+def read_parameter( node, service_name, name ):
+    """Returns the current value of a service parameter on a node"""
+
+    resp = service.getServiceParameter( processNodeName = node, name = name,
+        service = service_name, returnedTags = { 'value': '' } )
+
+    return resp[ 'return' ][ 'serviceParameter' ][ 'value' ]
+
+def plan( targets ):
+    """Reads the current values of ( node, service, name, value ) targets concurrently.
+
+    Returns ( changes, unchanged, failed ) - changes is a list of
+    ( node, service, name, old value, new value ) tuples.
+    """
+
+    def read( target ):
+        node, service_name, name, value = target
+        try:
+            return target, read_parameter( node, service_name, name ), None
+        except Fault as err:
+            return target, None, err
+
+    changes, unchanged, failed = [ ], [ ], [ ]
+
+    with ThreadPoolExecutor( max_workers = MAX_WORKERS ) as executor:
+        for ( node, service_name, name, value ), current, err in executor.map( read, targets ):
+            if err:
+                failed.append( ( node, service_name, name, f'getServiceParameter: { err }' ) )
+            elif current == value:
+                unchanged.append( ( node, service_name, name, value ) )
+            else:
+                changes.append( ( node, service_name, name, current, value ) )
+
+    return changes, unchanged, failed
+
+def apply( changes ):
+    """Applies planned changes concurrently.
+
+    Returns ( applied, failed ) lists of change tuples; failed tuples have the
+    error message appended.
+    """
+
+    def update( change ):
+        node, service_name, name, old, new = change
+        try:
+            service.updateServiceParameter( processNodeName = node, name = name,
+                service = service_name, value = new )
+            return change, None
+        except Fault as err:
+            return change, err
+
+    applied, failed = [ ], [ ]
+
+    with ThreadPoolExecutor( max_workers = MAX_WORKERS ) as executor:
+        for change, err in executor.map( update, changes ):
+            if err:
+                failed.append( change + ( f'updateServiceParameter: { err }', ) )
+            else:
+                applied.append( change )
+
+    return applied, failed
+
+def report( nodes, unchanged, applied, failed ):
+
+    print( f'\n{ "Process Node":32}{ "Changed":>10}{ "Unchanged":>11}{ "Failed":>8}' )
+    print( f'{ "-" * 31 } { "-" * 9:>10}{ "-" * 10:>11}{ "-" * 7:>8}' )
+
+    for node in nodes:
+        print( f'{ node:32}'
+            f'{ sum( 1 for change in applied if change[ 0 ] == node ):>10}'
+            f'{ sum( 1 for item in unchanged if item[ 0 ] == node ):>11}'
+            f'{ sum( 1 for item in failed if item[ 0 ] == node ):>8}' )
+
+    for item in failed:
+        print( f'\n    { item[ 0 ] }: { item[ 2 ] }: { item[ -1 ] }' )
+
+def rollout( nodes, targets ):
+    """Plans and applies ( node, service, name, value ) targets; returns the applied changes"""
+
+    changes, unchanged, read_failed = plan( targets )
+
+    print( f'\nPlanned { len( changes ) } change(s), skipping { len( unchanged ) } unchanged value(s):\n' )
+
+    for node, service_name, name, old, new in changes:
+        print( f'    { node }: { service_name }/{ name }: "{ old }" -> "{ new }"' )
+
+    applied, update_failed = apply( changes )
+
+    report( nodes, unchanged, applied, read_failed + update_failed )
+
+    return applied
+
+# Execute listProcessNode, filtering for "CUCM Voice/Video" role
+try:
+    resp = service.listProcessNode(
+        searchCriteria = { 'name': '%', 'processNodeRole': 'CUCM Voice/Video' },
+        returnedTags = { 'name': '' } )
+
+except Fault as err:
+    print( f'Zeep error: listProcessNode: { err }' )
+    sys.exit( 1 )
+
+# Skip the 'virtual' node reserved for Enterprise Parameters
+nodes = [ node[ 'name' ] for node in resp[ 'return' ][ 'processNode' ]
+    if node[ 'name' ] != 'EnterpriseWideData' ]
+
+print( f'\nFound { len( nodes ) } CUCM Voice/Video process node(s)' )
+
+input( '\nPress Enter to roll out the service parameters...' )
+
+applied = rollout( nodes, [ ( node, service_name, name, value )
+    for node in nodes for service_name, name, value in PARAMETERS ] )
+
+input( '\nPress Enter to continue...' )
+
+# Cleanup
+# Restore each changed parameter to its previous value
+
+# A parameter with no previous value cannot be restored via updateServiceParameter
+# (the empty <value> element is rejected), so it is reported and left as is
+
+print( '\nRestoring previous values...' )
+
+for node, service_name, name, old, new in applied:
+    if old is None:
+        print( f'\n    { node }: { service_name }/{ name }: no previous value, leaving "{ new }"' )
+
+rollout( nodes, [ ( node, service_name, name, old )
+    for node, service_name, name, old, new in applied if old is not None ] )
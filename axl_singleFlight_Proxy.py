@@ -0,0 +1,234 @@
+"""AXL single-flight request coalescing sample script, using the Zeep SOAP library
+
+When many worker threads of a bulk job request the same object at the same
+time (e.g. <getDevicePool> for the device pool every phone refers to), each
+sends its own identical request to the CUCM publisher.
+
+This sample wraps the Zeep service proxy with a SingleFlightService: while
+a read request (get*, list*, <executeSQLQuery>) is in flight, identical
+concurrent calls - same operation and normalized arguments - wait for it
+and share its response (or exception) instead of sending their own.
+Nothing is cached: a call made after the request completes sends a new one.
+
+Note: coalesced callers receive the same response object, so treat
+responses as read-only.
+
+The demo runs a burst of concurrent reads of a few shared objects, first
+directly and then via the SingleFlightService, counting the HTTP requests
+sent.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from concurrent.futures import Future, ThreadPoolExecutor
+import json
+import sys
+import threading
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+from zeep.helpers import serialize_object
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Number of concurrent worker threads in the demo burst
+MAX_WORKERS = 16
+
+# Number of reads in the demo burst
+READ_COUNT = 400
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+class SingleFlightService:
+    """Coalesces identical concurrent read requests, see module docstring"""
+
+    def __init__( self, client, service ):
+        self.client = client
+        self.service = service
+        self.stats = { 'calls': 0, 'requests': 0, 'coalesced': 0 }
+        self._lock = threading.Lock()
+        self._in_flight = { }
+        self._parameters = { }
+
+    def __getattr__( self, operation ):
+
+        method = getattr( self.service, operation )
+
+        if operation == 'listChange' or not (
+                operation.startswith( ( 'get', 'list' ) ) or operation == 'executeSQLQuery' ):
+            return method
+
+        return lambda *args, **kwargs: self._call( operation, method, args, kwargs )
+
+    def _key( self, operation, args, kwargs ):
+        """Normalized key: positional args bound to the request element names"""
+
+        if operation not in self._parameters:
+            element = self.client.get_element( f'ns0:{ operation }' )
+            self._parameters[ operation ] = [ name for name, _ in element.type.elements ]
+
+        arguments = dict( zip( self._parameters[ operation ], args ) )
+        arguments.update( kwargs )
+
+        return operation + json.dumps( serialize_object( arguments, dict ), sort_keys = True,
+            separators = ( ',', ':' ), default = str )
+
+    def _call( self, operation, method, args, kwargs ):
+
+        key = self._key( operation, args, kwargs )
+
+        with self._lock:
+            self.stats[ 'calls' ] += 1
+            future = self._in_flight.get( key )
+            leader = future is None
+            if leader:
+                future = self._in_flight[ key ] = Future()
+                self.stats[ 'requests' ] += 1
+            else:
+                self.stats[ 'coalesced' ] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result( method( *args, **kwargs ) )
+        except BaseException as err:
+            future.set_exception( err )
+        finally:
+            # Later calls send a new request
+            with self._lock:
+                del self._in_flight[ key ]
+
+        return future.result()
+
+# Count the HTTP requests sent, via a requests response hook
+http_requests = 0
+http_requests_lock = threading.Lock()
+
+def count_request( response, *args, **kwargs ):
+    global http_requests
+    with http_requests_lock:
+        http_requests += 1
+
+session.hooks[ 'response' ].append( count_request )
+
+# A burst of reads of a few shared objects, as in a bulk job where every
+# phone refers to the same device pool, location and owner
+reads = [
+    ( 'getDevicePool', { 'name': 'Default' } ),
+    ( 'getLocation', { 'name': 'Hub_None' } ),
+    ( 'getSipProfile', { 'name': 'Standard SIP Profile' } ),
+    ( 'getCommonPhoneConfig', { 'name': 'Standard Common Phone Profile' } )
+]
+
+def burst( target ):
+    """Runs READ_COUNT concurrent reads; returns ( seconds, HTTP requests sent )"""
+
+    global http_requests
+    http_requests = 0
+    start = time.perf_counter()
+
+    def read( x ):
+        operation, kwargs = reads[ x % len( reads ) ]
+        return getattr( target, operation )( **kwargs )
+
+    with ThreadPoolExecutor( max_workers = MAX_WORKERS ) as executor:
+        list( executor.map( read, range( READ_COUNT ) ) )
+
+    return time.perf_counter() - start, http_requests
+
+print( f'\nRunning { READ_COUNT } reads of { len( reads ) } objects with { MAX_WORKERS } workers...\n' )
+
+try:
+    seconds, requests = burst( service )
+    print( f'    Direct:         { requests:5} HTTP requests, { seconds:.2f} sec' )
+
+    single_flight = SingleFlightService( client, service )
+    seconds, requests = burst( single_flight )
+    print( f'    Single-flight:  { requests:5} HTTP requests, { seconds:.2f} sec' )
+
+except Fault as err:
+    print( f'Zeep error: { err }' )
+    sys.exit( 1 )
+
+print( f'\nSingle-flight stats: { single_flight.stats }' )
@@ -0,0 +1,394 @@
+"""AXL <executeSQLQuery> result cache sample script, using the Zeep SOAP library
+
+Dashboards often re-run the same <executeSQLQuery> joins (like the call
+pickup group query in axl_executeSQLQuery.py) every few seconds, although
+the underlying data rarely changes.  This sample provides a SqlQueryCache:
+
+* Results are keyed by normalized SQL text (whitespace collapsed and case
+  folded outside of quoted literals), and held in an LRU bounded by the
+  approximate size in bytes of the cached rows
+* The tables read by each query are extracted from its FROM/JOIN clauses,
+  and indexed for invalidation
+* The AXL 'Data Change Notification' feed (<listChange>, see
+  axl_listChange.py) is polled at most every POLL_INTERVAL seconds before
+  serving a hit; each change invalidates the cached results of every query
+  reading a table mapped to the changed object type (CHANGE_TABLES).  Many
+  tables are written by several object types (e.g. device by Phone, but
+  also by CtiRoutePoint, DeviceProfile, H323Gateway...), so a change of a
+  type not in CHANGE_TABLES conservatively invalidates the whole cache
+* Queries reading any table not covered by CHANGE_TABLES (other than the
+  static type* enumeration tables) are only cached for UNMONITORED_TTL
+  seconds, as changes to them may not be reported
+* <executeSQLUpdate> statements sent via the cache invalidate the updated
+  table immediately
+
+Cached rows are returned as lists of (tag, text) named tuples, so code
+written for Zeep's lxml row elements (row[ 0 ].text, column.tag) works
+unchanged.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from collections import OrderedDict, namedtuple
+import re
+import sys
+import threading
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# <listChange> object types, and the Informix tables holding their data
+CHANGE_TABLES = {
+    'Phone': [ 'device', 'devicenumplanmap', 'speeddial', 'telecasterserviceuser' ],
+    'Line': [ 'numplan', 'devicenumplanmap', 'pickupgrouplinemap', 'callforwarddynamic' ],
+    'User': [ 'enduser', 'enduserdevicemap', 'enduserlicense', 'endusernumplanmap' ],
+    'CallPickupGroup': [ 'pickupgroup', 'pickupgrouplinemap', 'numplan' ],
+    'DevicePool': [ 'devicepool' ],
+    'Location': [ 'location' ],
+    'RoutePartition': [ 'routepartition' ],
+    'Css': [ 'callingsearchspace', 'callingsearchspacemember' ],
+    'SipTrunk': [ 'device', 'siptrunkdestination' ],
+    'Gateway': [ 'mgcp', 'mgcpdevicemember', 'device' ],
+    'ProcessNode': [ 'processnode' ]
+}
+
+# Maximum approximate size of the cached rows
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+# Maximum age (seconds) of the last <listChange> poll when serving a hit
+POLL_INTERVAL = 5
+
+# Seconds to cache queries reading tables not covered by CHANGE_TABLES
+UNMONITORED_TTL = 30
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+# A cached column, compatible with the lxml elements in Zeep's row lists
+Column = namedtuple( 'Column', [ 'tag', 'text' ] )
+
+# Quoted literals, matched so they are left unchanged by normalization
+LITERAL = re.compile( r"""('(?:[^']|'')*'|"(?:[^"]|"")*")""" )
+
+TABLES = re.compile( r'\b(?:from|join)\s+(.*?)(?=\bwhere\b|\bgroup\b|\border\b|\bhaving\b|\bunion\b'
+    r'|\binner\b|\bleft\b|\bright\b|\bfull\b|\bcross\b|\bjoin\b|\bon\b|\)|$)' )
+
+UPDATED_TABLE = re.compile( r'^\s*(?:update|insert\s+into|delete\s+from)\s+([a-z_]\w*)' )
+
+def normalize( sql ):
+    """Collapses whitespace and folds case, outside of quoted literals"""
+
+    parts = LITERAL.split( sql )
+    # split() with a capturing group puts the literals at odd indexes
+    for x in range( 0, len( parts ), 2 ):
+        parts[ x ] = ' '.join( parts[ x ].lower().split() )
+
+    return ' '.join( part for part in parts if part ).strip()
+
+def query_tables( sql ):
+    """Returns the set of tables named in the FROM/JOIN clauses of a normalized query"""
+
+    # Blank out literals, so their contents can't look like SQL
+    text = LITERAL.sub( "''", sql )
+    tables = set()
+
+    for clause in TABLES.findall( text ):
+        for item in clause.split( ',' ):
+            words = item.split()
+            if words and re.match( r'^[a-z_]\w*$', words[ 0 ] ):
+                tables.add( words[ 0 ] )
+
+    return tables
+
+class SqlQueryCache:
+    """Caches <executeSQLQuery> results, see module docstring"""
+
+    def __init__( self, service, change_tables = CHANGE_TABLES, max_bytes = MAX_CACHE_BYTES,
+            poll_interval = POLL_INTERVAL, unmonitored_ttl = UNMONITORED_TTL ):
+        self.service = service
+        self.change_tables = change_tables
+        self.monitored = { table for tables in change_tables.values() for table in tables }
+        self.max_bytes = max_bytes
+        self.poll_interval = poll_interval
+        self.unmonitored_ttl = unmonitored_ttl
+        self.stats = { 'hits': 0, 'misses': 0, 'invalidated': 0 }
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._by_table = { }
+        self._bytes = 0
+
+        # Establish the change queue baseline before anything is cached
+        resp = service.listChange()
+        self._queue_id = resp.queueInfo.queueId
+        self._next_change_id = resp.queueInfo.nextStartChangeId
+        self._last_poll = time.monotonic()
+
+    def query( self, sql ):
+        """Executes (or serves from the cache) an <executeSQLQuery>; returns the rows"""
+
+        key = normalize( sql )
+
+        if time.monotonic() - self._last_poll > self.poll_interval:
+            self.poll_changes()
+
+        with self._lock:
+            entry = self._entries.get( key )
+            if entry is not None and ( entry[ 2 ] is None or time.monotonic() < entry[ 2 ] ):
+                self._entries.move_to_end( key )
+                self.stats[ 'hits' ] += 1
+                return list( entry[ 0 ] )
+            self.stats[ 'misses' ] += 1
+
+        resp = self.service.executeSQLQuery( sql )
+
+        rows = [ [ Column( column.tag, column.text ) for column in row ]
+            for row in resp[ 'return' ][ 'row' ] ] if resp[ 'return' ] else [ ]
+
+        tables = query_tables( key )
+
+        # Without recognizable tables, the result can't be invalidated
+        if tables:
+            # type* tables hold static enumerations, which never change
+            monitored = all( table in self.monitored or table.startswith( 'type' ) for table in tables )
+            expires = None if monitored else time.monotonic() + self.unmonitored_ttl
+            size = sum( 64 + sum( 64 + len( column.tag ) + len( column.text or '' ) for column in row )
+                for row in rows )
+            self._store( key, rows, tables, expires, size )
+
+        return list( rows )
+
+    def update( self, sql ):
+        """Executes an <executeSQLUpdate>, invalidating the updated table"""
+
+        try:
+            return self.service.executeSQLUpdate( sql )
+        finally:
+            match = UPDATED_TABLE.match( normalize( sql ) )
+            if match:
+                self.invalidate_tables( [ match.group( 1 ) ] )
+
+    def _store( self, key, rows, tables, expires, size ):
+
+        with self._lock:
+            self._discard( key )
+            self._entries[ key ] = ( rows, tables, expires, size )
+            self._bytes += size
+            for table in tables:
+                self._by_table.setdefault( table, set() ).add( key )
+
+            while self._bytes > self.max_bytes and len( self._entries ) > 1:
+                self._discard( next( iter( self._entries ) ) )
+
+    def _discard( self, key ):
+        entry = self._entries.pop( key, None )
+        if entry is None:
+            return False
+        self._bytes -= entry[ 3 ]
+        for table in entry[ 1 ]:
+            self._by_table[ table ].discard( key )
+        return True
+
+    def invalidate_tables( self, tables ):
+        with self._lock:
+            for table in tables:
+                for key in list( self._by_table.get( table, ( ) ) ):
+                    if self._discard( key ):
+                        self.stats[ 'invalidated' ] += 1
+
+    def invalidate_all( self ):
+        with self._lock:
+            self.stats[ 'invalidated' ] += len( self._entries )
+            self._entries.clear()
+            self._by_table.clear()
+            self._bytes = 0
+
+    def poll_changes( self ):
+        """Invalidates cached results for tables changed according to <listChange>"""
+
+        resp = self.service.listChange(
+            startChangeId = { 'queueId': self._queue_id, '_value_1': self._next_change_id } )
+
+        self._next_change_id = resp.queueInfo.nextStartChangeId
+        self._last_poll = time.monotonic()
+
+        if resp.changes:
+            changed = { change.type for change in resp.changes.change }
+
+            # An unmapped type may write any monitored table, so drop everything
+            if not changed <= self.change_tables.keys():
+                self.invalidate_all()
+                return
+
+            self.invalidate_tables( { table for change_type in changed
+                for table in self.change_tables[ change_type ] } )
+
+try:
+    cache = SqlQueryCache( service )
+except Fault as err:
+    print( f'Zeep error: listChange: { err }' )
+    sys.exit( 1 )
+
+# Create a test Call Pickup Group and two lines in it, as in axl_executeSQLQuery.py
+
+try:
+    resp = service.addCallPickupGroup( callPickupGroup = {
+        'pattern': '9876543210',
+        'routePartitionName': None,
+        'pickupNotification': 'Visual Alert',
+        'pickupNotificationTimer': 6,
+        'name': 'testCallPickupGroup' } )
+except Fault as err:
+    print( f'Zeep error: addCallPickupGroup: { err }' )
+    sys.exit( 1 )
+
+def add_line( pattern ):
+    try:
+        service.addLine( line = { 'pattern': pattern, 'usage': 'Device', 'routePartitionName': None,
+            'callPickupGroupName': 'testCallPickupGroup' } )
+    except Fault as err:
+        print( f'Zeep error: addLine: { err }' )
+        sys.exit( 1 )
+
+add_line( '9876543211' )
+add_line( '9876543212' )
+
+sql = '''select numplan.dnorpattern from numplan, pickupgrouplinemap, pickupgroup
+            where numplan.pkid = pickupgrouplinemap.fknumplan_line and
+            pickupgrouplinemap.fkpickupgroup = pickupgroup.pkid and
+            pickupgroup.name = "testCallPickupGroup"'''
+
+print( f'\nTables read by the query: { ", ".join( sorted( query_tables( normalize( sql ) ) ) ) }' )
+
+def run_query( step ):
+
+    start = time.perf_counter()
+
+    try:
+        rows = cache.query( sql )
+    except Fault as err:
+        print( f'Zeep error: executeSQLQuery: { err }' )
+        sys.exit( 1 )
+
+    print( f'    { step:32}{ ( time.perf_counter() - start ) * 1000:8.1f} ms  '
+        f'{ ", ".join( sorted( row[ 0 ].text for row in rows ) ) }' )
+
+print( '\nRepeated queries:\n' )
+
+for x in range( 3 ):
+    run_query( f'Query #{ x + 1 }' )
+
+input( '\nPress Enter to continue...' )
+
+# Add a third line to the group; once listChange reports it, the cached
+# result is invalidated
+
+add_line( '9876543213' )
+
+print( '\nQueries after adding a line:\n' )
+
+try:
+    cache.poll_changes()
+except Fault as err:
+    print( f'Zeep error: listChange: { err }' )
+    sys.exit( 1 )
+
+for x in range( 2 ):
+    run_query( f'Query #{ x + 1 }' )
+
+print( f'\nCache stats: { cache.stats }' )
+
+input( '\nPress Enter to continue...' )
+
+# Cleanup the objects we just created
+
+try:
+    for pattern in [ '9876543211', '9876543212', '9876543213' ]:
+        service.removeLine( pattern = pattern, routePartitionName = None )
+    service.removeCallPickupGroup( name = 'testCallPickupGroup' )
+except Fault as err:
+    print( f'Zeep error: cleanup: { err }' )
+    sys.exit( 1 )
+
+print( '\nCleanup: SUCCESS' )
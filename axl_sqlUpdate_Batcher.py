@@ -0,0 +1,281 @@
+"""AXL set-based <executeSQLUpdate> batching sample script, using the Zeep SOAP library
+
+axl_executeSQLUpdate_DnD.py sets Do-not-Disturb on a phone with a row-level
+update, e.g.:
+
+    UPDATE dnddynamic SET dndstatus = 't' WHERE fkdevice = '<pkid>'
+
+Repeated for thousands of devices, this means thousands of AXL requests.
+This sample provides an SqlUpdateBatcher which collects row-level updates,
+groups those with the same shape (table, SET assignments and key column),
+and rewrites each group into set-based statements:
+
+    UPDATE dnddynamic SET dndstatus = 't' WHERE fkdevice IN ( '<pkid1>', '<pkid2>', ... )
+
+Each statement is kept under MAX_STATEMENT_LENGTH characters and
+MAX_IN_LIST values, and the statements are executed with bounded
+concurrency.
+
+The demo creates TEST_PHONE_COUNT test phones, sets DND on all of them with
+a few requests, resets DND, then removes the phones.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from concurrent.futures import ThreadPoolExecutor
+import math
+import sys
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Statement size limits for each set-based UPDATE
+MAX_STATEMENT_LENGTH = 32000
+MAX_IN_LIST = 1000
+
+# Maximum number of concurrent requests
+MAX_WORKERS = 4
+
+# Number of test phones created by the demo
+TEST_PHONE_COUNT = 50
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+def quote( value ):
+    """Encodes a Python value as an Informix SQL literal
+
+    Follows the same rules as encode() in axl_sql_Template.py.
+    """
+
+    if value is None:
+        return 'NULL'
+    if isinstance( value, bool ):
+        return "'t'" if value else "'f'"
+    if isinstance( value, ( int, float ) ):
+        # nan/inf would be sent as bare identifiers
+        if isinstance( value, float ) and not math.isfinite( value ):
+            raise ValueError( f'Cannot encode { value } as an SQL literal' )
+        return str( value )
+
+    value = str( value )
+    if '\x00' in value:
+        raise ValueError( 'SQL string literals cannot contain NUL characters' )
+
+    return "'" + value.replace( "'", "''" ) + "'"
+
+class SqlUpdateBatcher:
+    """Collects row-level UPDATEs and executes them as set-based statements"""
+
+    def __init__( self, max_statement_length = MAX_STATEMENT_LENGTH, max_in_list = MAX_IN_LIST ):
+        self.max_statement_length = max_statement_length
+        self.max_in_list = max_in_list
+        self.updates = 0
+        self._groups = { }
+
+    def add( self, table, assignments, column, value ):
+        """Queues: UPDATE table SET assignments WHERE column = value"""
+
+        group = ( table, tuple( sorted( assignments.items() ) ), column )
+        # A dict keeps insertion order and drops duplicate keys
+        self._groups.setdefault( group, { } )[ quote( value ) ] = None
+        self.updates += 1
+
+    def statements( self ):
+        """Returns the set-based statements for all queued updates"""
+
+        statements = [ ]
+
+        for ( table, assignments, column ), values in self._groups.items():
+
+            sets = ', '.join( f'{ name } = { quote( value ) }' for name, value in assignments )
+            prefix = f'UPDATE { table } SET { sets } WHERE { column } IN ( '
+            chunk, length = [ ], len( prefix ) + 2
+
+            for value in values:
+                if chunk and ( length + len( value ) + 2 > self.max_statement_length or
+                        len( chunk ) == self.max_in_list ):
+                    statements.append( prefix + ', '.join( chunk ) + ' )' )
+                    chunk, length = [ ], len( prefix ) + 2
+                chunk.append( value )
+                length += len( value ) + 2
+
+            if chunk:
+                statements.append( prefix + ', '.join( chunk ) + ' )' )
+
+        return statements
+
+    def run( self, service, max_workers = MAX_WORKERS ):
+        """Executes the queued updates; returns ( statements executed, rows updated )"""
+
+        statements = self.statements()
+
+        with ThreadPoolExecutor( max_workers = max_workers ) as executor:
+            rows = sum( int( resp[ 'return' ][ 'rowsUpdated' ] )
+                for resp in executor.map( service.executeSQLUpdate, statements ) )
+
+        self._groups.clear()
+        self.updates = 0
+
+        return len( statements ), rows
+
+def phone( x ):
+    """Minimal test phone payload"""
+
+    return {
+        'name': f'CSFTESTBATCH{ x:03}',
+        'product': 'Cisco Unified Client Services Framework',
+        'class': 'Phone',
+        'protocol': 'SIP',
+        'protocolSide': 'User',
+        'devicePoolName': 'Default',
+        'commonPhoneConfigName': 'Standard Common Phone Profile',
+        'locationName': 'Hub_None',
+        'useTrustedRelayPoint': 'Default',
+        'builtInBridgeStatus': 'Default',
+        'sipProfileName': 'Standard SIP Profile',
+        'packetCaptureMode': 'None',
+        'certificateOperation': 'No Pending Operation',
+        'deviceMobilityMode': 'Default'
+    }
+
+def set_dnd( device_ids, status ):
+
+    batcher = SqlUpdateBatcher()
+
+    for device_id in device_ids:
+        batcher.add( 'dnddynamic', { 'dndstatus': status }, 'fkdevice', device_id )
+
+    updates = batcher.updates
+
+    try:
+        statements, rows = batcher.run( service )
+    except Fault as err:
+        print( f'Zeep error: executeSQLUpdate: { err }' )
+        sys.exit( 1 )
+
+    print( f'\n{ updates } row-level updates executed as { statements } <executeSQLUpdate> '
+        f'request(s): { rows } rows updated' )
+
+# Create the test phones concurrently
+
+print( f'\nAdding { TEST_PHONE_COUNT } test phones...' )
+
+try:
+    with ThreadPoolExecutor( max_workers = MAX_WORKERS ) as executor:
+        device_ids = [ resp[ 'return' ].strip( '{}' ).lower() for resp in
+            executor.map( lambda x: service.addPhone( phone( x ) ), range( TEST_PHONE_COUNT ) ) ]
+except Fault as err:
+    print( f'Zeep error: addPhone: { err }' )
+    sys.exit( 1 )
+
+input( '\nPress Enter to set DND on all test phones...' )
+
+set_dnd( device_ids, True )
+
+try:
+    resp = service.executeSQLQuery( '''SELECT COUNT(*) AS dnd FROM dnddynamic AS d
+        INNER JOIN device ON device.pkid = d.fkdevice
+        WHERE device.name LIKE 'CSFTESTBATCH%' AND d.dndstatus = 't' ''' )
+except Fault as err:
+    print( f'Zeep error: executeSQLQuery: { err }' )
+    sys.exit( 1 )
+
+print( f'Test phones with DND set: { resp[ "return" ][ "row" ][ 0 ][ 0 ].text }' )
+
+input( '\nPress Enter to continue...' )
+
+# Cleanup
+# Reset DND, then remove the test phones
+
+set_dnd( device_ids, False )
+
+try:
+    with ThreadPoolExecutor( max_workers = MAX_WORKERS ) as executor:
+        list( executor.map( lambda x: service.removePhone( name = phone( x )[ 'name' ] ),
+            range( TEST_PHONE_COUNT ) ) )
+except Fault as err:
+    print( f'Zeep error: removePhone: { err }' )
+    sys.exit( 1 )
+
+print( '\nCleanup: SUCCESS' )
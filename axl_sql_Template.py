@@ -0,0 +1,285 @@
+"""AXL parameterized SQL template sample script, using the Zeep SOAP library
+
+Samples like axl_add_Role.py build <executeSQLQuery>/<executeSQLUpdate>
+statements with f-strings, which breaks (or allows SQL injection) when a
+value contains a quote, and re-formats the whole statement for every row.
+
+This sample provides a small SQL template layer:
+
+* Templates use named placeholders, e.g.
+      INSERT INTO functionrole ( pkid, description, name )
+          VALUES ( newid(), :description, :name )
+  Placeholders inside quoted literals, and '::' casts, are left alone
+* Each template is parsed once into literal segments and parameter names;
+  compiled templates are cached (compile_template() is an LRU cache)
+* Values are encoded as Informix literals by type: strings are single
+  quoted with embedded quotes doubled, None becomes NULL, booleans 't'/'f',
+  numbers are checked to be finite, datetimes/dates use Informix literal
+  format, and lists/tuples/sets become a parenthesized IN list
+* render_many() renders batches of parameter dicts with no re-parsing
+
+The demo adds test roles (one with a quote in its name) via templated SQL,
+queries them with an IN list, benchmarks bulk rendering, then removes them.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from functools import lru_cache
+import datetime
+import decimal
+import math
+import re
+import sys
+import time
+import urllib3
+import uuid
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Number of statements rendered by the benchmark
+BENCHMARK_COUNT = 200000
+
+# Names of the test roles created by the demo
+TEST_ROLES = [ 'testTemplateRole1', 'testTemplateRole2', "testTemplateRole3 (O'Brien)" ]
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+def encode_string( value ):
+    if '\x00' in value:
+        raise ValueError( 'SQL string literals cannot contain NUL characters' )
+    return "'" + value.replace( "'", "''" ) + "'"
+
+def encode_number( value ):
+    if isinstance( value, float ) and not math.isfinite( value ):
+        raise ValueError( f'Cannot encode { value } as an SQL literal' )
+    return str( value )
+
+def encode_sequence( values ):
+    if not values:
+        raise ValueError( 'Cannot encode an empty IN list' )
+    return '( ' + ', '.join( encode( value ) for value in values ) + ' )'
+
+# Encoders by exact type, for a fast lookup in the common cases
+ENCODERS = {
+    str: encode_string,
+    int: encode_number,
+    float: encode_number,
+    decimal.Decimal: encode_number,
+    bool: lambda value: "'t'" if value else "'f'",
+    type( None ): lambda value: 'NULL',
+    uuid.UUID: lambda value: f"'{ value }'",
+    datetime.datetime: lambda value: f"'{ value.strftime( '%Y-%m-%d %H:%M:%S' ) }'",
+    datetime.date: lambda value: f"'{ value.isoformat() }'",
+    list: encode_sequence,
+    tuple: encode_sequence,
+    set: lambda values: encode_sequence( sorted( values ) ),
+    frozenset: lambda values: encode_sequence( sorted( values ) )
+}
+
+def encode( value ):
+    """Encodes a Python value as an Informix SQL literal"""
+
+    encoder = ENCODERS.get( type( value ) )
+
+    if encoder is None:
+        # Subclasses of the supported types, e.g. str enums
+        encoder = next( ( encoder for base, encoder in ENCODERS.items()
+            if isinstance( value, base ) and base is not type( None ) ), None )
+        if encoder is None:
+            raise TypeError( f'Cannot encode { type( value ).__name__ } as an SQL literal' )
+
+    return encoder( value )
+
+# Quoted literals and '::' casts are matched (and skipped) before placeholders
+TOKEN = re.compile( r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|::|:([A-Za-z_]\w*)""" )
+
+class SqlTemplate:
+    """A parsed SQL statement with named :placeholders"""
+
+    __slots__ = ( 'sql', 'segments', 'names' )
+
+    def __init__( self, sql ):
+        self.sql = sql
+        segments, names, start = [ ], [ ], 0
+
+        for match in TOKEN.finditer( sql ):
+            if match.group( 1 ):
+                segments.append( sql[ start:match.start() ] )
+                names.append( match.group( 1 ) )
+                start = match.end()
+
+        segments.append( sql[ start: ] )
+        self.segments = tuple( segments )
+        self.names = tuple( names )
+
+    def render( self, params ):
+        """Returns the statement with each placeholder replaced by its encoded value"""
+
+        try:
+            values = [ encode( params[ name ] ) for name in self.names ]
+        except KeyError as err:
+            raise KeyError( f'Missing SQL parameter: { err.args[ 0 ] }' ) from None
+
+        parts = [ self.segments[ 0 ] ]
+        for value, segment in zip( values, self.segments[ 1: ] ):
+            parts.append( value )
+            parts.append( segment )
+
+        return ''.join( parts )
+
+    def render_many( self, batch ):
+        """Yields a rendered statement for each params dict in batch"""
+
+        render = self.render
+        for params in batch:
+            yield render( params )
+
+@lru_cache( maxsize = 256 )
+def compile_template( sql ):
+    """Returns the (cached) compiled SqlTemplate for a statement"""
+    return SqlTemplate( sql )
+
+def sql_update( template, **params ):
+    return service.executeSQLUpdate( compile_template( template ).render( params ) )
+
+def sql_query( template, **params ):
+    resp = service.executeSQLQuery( compile_template( template ).render( params ) )
+    return resp[ 'return' ][ 'row' ] if resp[ 'return' ] else [ ]
+
+INSERT_ROLE = '''INSERT INTO functionrole ( pkid, description, name )
+    VALUES ( newid(), :description, :name )'''
+
+SELECT_ROLES = 'SELECT pkid, name FROM functionrole WHERE name IN :names ORDER BY name'
+
+DELETE_ROLES = 'DELETE FROM functionrole WHERE name IN :names'
+
+# Create the test roles
+
+for name in TEST_ROLES:
+
+    try:
+        sql_update( INSERT_ROLE, name = name, description = f'{ name } description' )
+    except Fault as err:
+        print( f'Zeep error: executeSQLUpdate/insert into functionrole: { err }' )
+        sys.exit( 1 )
+
+try:
+    rows = sql_query( SELECT_ROLES, names = TEST_ROLES )
+except Fault as err:
+    print( f'Zeep error: executeSQLQuery from functionrole: { err }' )
+    sys.exit( 1 )
+
+print( f'\n{ compile_template( SELECT_ROLES ).render( { "names": TEST_ROLES } ) }\n' )
+
+for row in rows:
+    print( f'    { row[ 0 ].text }  { row[ 1 ].text }' )
+
+input( '\nPress Enter to continue...' )
+
+# Benchmark rendering a large batch of statements from one compiled template
+
+batch = [ { 'name': f"testRole{ x } (O'Brien)", 'description': f'Role { x }' }
+    for x in range( BENCHMARK_COUNT ) ]
+
+start = time.perf_counter()
+statements = list( compile_template( INSERT_ROLE ).render_many( batch ) )
+elapsed = time.perf_counter() - start
+
+print( f'\nRendered { len( statements ) } statements in { elapsed:.2f} sec '
+    f'({ len( statements ) / elapsed:,.0f} statements/sec)' )
+print( f'\nLast statement:\n\n{ statements[ -1 ] }' )
+print( f'\nTemplate cache: { compile_template.cache_info() }' )
+
+input( '\nPress Enter to continue...' )
+
+# Cleanup
+# Remove the test roles
+
+try:
+    resp = sql_update( DELETE_ROLES, names = TEST_ROLES )
+except Fault as err:
+    print( f'Zeep error: executeSQLUpdate delete from functionrole: { err }' )
+    sys.exit( 1 )
+
+print( f'\nRemoved { resp[ "return" ][ "rowsUpdated" ] } test roles' )
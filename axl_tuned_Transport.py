@@ -0,0 +1,232 @@
+"""AXL tuned transport sample script, using the Zeep SOAP library
+
+The samples create the Zeep transport with Transport( session = session,
+timeout = 10 ).  Note that timeout only applies to loading the WSDL - AXL
+requests themselves have no timeout - and requests' default connection pool
+keeps at most 10 connections per host, so a bulk job with more concurrent
+workers than that opens (and TLS handshakes) a new connection to port 8443
+for every request that does not find an idle pooled connection.
+
+This sample provides a TunedTransport, exposing:
+
+* pool_connections: number of per-host pools kept (e.g. one per CUCM node)
+* pool_maxsize: maximum connections kept per host - size this to the number
+  of concurrent workers
+* pool_block: if True, workers wait for a free pooled connection instead of
+  opening (and then discarding) extra connections
+* idle_timeout: keep-alive connections idle longer than this are dropped
+  before the next request, rather than failing on a connection already
+  closed by CUCM (Tomcat closes idle keep-alive connections)
+* connect_timeout/read_timeout: separate timeouts for AXL requests
+* Connection reuse statistics (new connections vs. requests), from the
+  urllib3 connection pools
+
+It then runs a batch of concurrent <getCCMVersion> requests and prints
+the connection reuse statistics.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import threading
+import time
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# Number of concurrent requests; the pool keeps one connection per worker
+MAX_WORKERS = 16
+
+# Number of requests in the demo batch
+REQUEST_COUNT = 200
+
+class TunedTransport( Transport ):
+    """Zeep transport with connection pool, keep-alive and timeout settings"""
+
+    def __init__( self, session, pool_connections = 4, pool_maxsize = 16, pool_block = True,
+            idle_timeout = 15, connect_timeout = 5, read_timeout = 60, **kwargs ):
+
+        super().__init__( session = session, operation_timeout = ( connect_timeout, read_timeout ),
+            **kwargs )
+
+        self.adapter = HTTPAdapter( pool_connections = pool_connections,
+            pool_maxsize = pool_maxsize, pool_block = pool_block )
+        session.mount( 'https://', self.adapter )
+
+        self.idle_timeout = idle_timeout
+        self.idle_resets = 0
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._last_activity = time.monotonic()
+        self._retired = { 'connections': 0, 'requests': 0 }
+
+    def post( self, address, message, headers ):
+
+        with self._lock:
+            # Drop idle keep-alive connections, when none are in use
+            if ( self._in_flight == 0 and
+                    time.monotonic() - self._last_activity > self.idle_timeout ):
+                self._retire_pools()
+            self._in_flight += 1
+
+        try:
+            return super().post( address, message, headers )
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._last_activity = time.monotonic()
+
+    def _pools( self ):
+        pools = self.adapter.poolmanager.pools
+        return [ pools[ key ] for key in pools.keys() ]
+
+    def _retire_pools( self ):
+        """Close all pooled connections, keeping their statistics"""
+
+        pools = self._pools()
+        if not pools:
+            return
+
+        for pool in pools:
+            self._retired[ 'connections' ] += pool.num_connections
+            self._retired[ 'requests' ] += pool.num_requests
+
+        self.adapter.poolmanager.clear()
+        self.idle_resets += 1
+
+    def stats( self ):
+        """Returns connection reuse statistics"""
+
+        with self._lock:
+            connections = self._retired[ 'connections' ] + sum( pool.num_connections for pool in self._pools() )
+            requests = self._retired[ 'requests' ] + sum( pool.num_requests for pool in self._pools() )
+
+        return {
+            'requests': requests,
+            'connections': connections,
+            'reused': requests - connections,
+            'reuse_ratio': round( 1 - connections / requests, 3 ) if requests else None,
+            'idle_resets': self.idle_resets
+        }
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create the tuned Zeep transport, with one pooled connection per worker
+transport = TunedTransport( session, pool_maxsize = MAX_WORKERS, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+def get_version( x ):
+    return service.getCCMVersion()[ 'return' ][ 'componentVersion' ][ 'version' ]
+
+print( f'\nSending { REQUEST_COUNT } <getCCMVersion> requests with { MAX_WORKERS } workers...' )
+
+start = time.perf_counter()
+
+try:
+    with ThreadPoolExecutor( max_workers = MAX_WORKERS ) as executor:
+        versions = set( executor.map( get_version, range( REQUEST_COUNT ) ) )
+except Fault as err:
+    print( f'Zeep error: getCCMVersion: { err }' )
+    sys.exit( 1 )
+
+elapsed = time.perf_counter() - start
+
+print( f'\nCUCM version: { ", ".join( versions ) }' )
+print( f'Elapsed: { elapsed:.2f} sec ({ REQUEST_COUNT / elapsed:.0f} requests/sec)' )
+print( f'\nConnection stats: { transport.stats() }' )
+
+input( '\nPress Enter to continue...' )
+
+# Wait until the keep-alive connections are idle, then send one more request:
+# the idle connections are dropped and a single new connection is opened
+
+print( f'\nWaiting { transport.idle_timeout + 1 } sec for pooled connections to go idle...' )
+
+time.sleep( transport.idle_timeout + 1 )
+
+try:
+    get_version( 0 )
+except Fault as err:
+    print( f'Zeep error: getCCMVersion: { err }' )
+    sys.exit( 1 )
+
+print( f'\nConnection stats: { transport.stats() }' )
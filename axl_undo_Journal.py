@@ -0,0 +1,320 @@
+"""AXL transactional undo journal sample script, using the Zeep SOAP library
+
+axlZeepUndo.py reverses axlZeep.py with hard-coded <removeLine>,
+<removePhone> and <removeUser> requests.  This sample generalizes the idea: a
+journaled executor records every successful add*/update* request in a JSONL
+journal, together with what is needed to invert it - the uuid returned by
+add* (every remove* request accepts a uuid), or the prior values of the
+updated fields, retrieved via the matching get* request before an update*.
+
+If a bulk job fails part way, the journal is replayed in reverse dependency
+order, restoring updated fields and removing added objects.  Entries of the
+same kind (e.g. all <addPhone>s) do not depend on each other, so each kind
+is reverted concurrently.  As the journal is flushed after every
+entry, a job can also be rolled back after the script itself was interrupted:
+
+    python axl_undo_Journal.py rollback [journal file]
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+from concurrent.futures import ThreadPoolExecutor
+import json
+import sys
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+from zeep.helpers import serialize_object
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# The journal file for this job
+JOURNAL_FILE = sys.argv[ 2 ] if len( sys.argv ) > 2 else 'axl_undo_journal.jsonl'
+
+# Number of test seats (line + phone + user) provisioned by the job
+SEAT_COUNT = 5
+
+# Maximum number of concurrent requests during rollback
+MAX_WORKERS = 8
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+
+# Fields identifying the object in update*/get* requests
+IDENTITY_FIELDS = [ 'uuid', 'name', 'pattern', 'routePartitionName', 'userid', 'domainName', 'dnOrPattern' ]
+
+def returned_tags( shape ):
+    """Build <returnedTags> for the fields present in an update payload"""
+
+    if isinstance( shape, list ):
+        return returned_tags( shape[ 0 ] ) if shape and isinstance( shape[ 0 ], dict ) else ''
+    if isinstance( shape, dict ):
+        return { key: returned_tags( value ) for key, value in shape.items() }
+    return ''
+
+def restore_value( prior, shape ):
+    """Reduce a prior (get*) value to the fields present in the update payload,
+    in a form suitable for sending back via update*"""
+
+    if isinstance( prior, dict ) and '_value_1' in prior:
+        return prior[ '_value_1' ]
+    if isinstance( prior, list ):
+        item_shape = shape[ 0 ] if isinstance( shape, list ) and shape else shape
+        return [ restore_value( item, item_shape ) for item in prior ]
+    if isinstance( prior, dict ) and isinstance( shape, dict ):
+        restored = { key: restore_value( prior.get( key ), value ) for key, value in shape.items() }
+        return { key: value for key, value in restored.items() if value is not None }
+    return prior
+
+class JournaledExecutor:
+    """Executes add*/update* requests, journaling how to invert each one"""
+
+    def __init__( self, service, journal_file ):
+
+        self.service = service
+        self.journal = open( journal_file, 'a' )
+
+    def _record( self, entry ):
+
+        # Flush every entry, so the journal survives an interrupted job
+        self.journal.write( json.dumps( entry ) + '\n' )
+        self.journal.flush()
+
+    def add( self, object_type, payload ):
+        """Execute add<Type>, journaling remove<Type> by uuid as its inverse"""
+
+        operation = f'add{ object_type[ 0 ].upper() }{ object_type[ 1: ] }'
+        resp = getattr( self.service, operation )( **{ object_type: payload } )
+
+        self._record( { 'kind': f'add:{ object_type }',
+            'inverse': [ f'remove{ operation[ 3: ] }', { 'uuid': resp[ 'return' ] } ] } )
+
+        return resp
+
+    def update( self, object_type, **payload ):
+        """Execute update<Type>, journaling the prior values of the updated fields"""
+
+        suffix = f'{ object_type[ 0 ].upper() }{ object_type[ 1: ] }'
+        identity = { key: value for key, value in payload.items() if key in IDENTITY_FIELDS }
+        changes = { key: value for key, value in payload.items() if key not in IDENTITY_FIELDS }
+
+        if any( key.startswith( 'new' ) for key in changes ):
+            raise ValueError( 'Renaming updates (newName, newPattern...) are not supported by the journal' )
+
+        resp = getattr( self.service, f'get{ suffix }' )( **identity, returnedTags = returned_tags( changes ) )
+        prior = serialize_object( resp[ 'return' ][ object_type ], dict )
+
+        # Fields which were previously empty are restored as empty elements
+        restore = { key: restore_value( prior.get( key ), value ) for key, value in changes.items() }
+        restore = { key: '' if value is None else value for key, value in restore.items() }
+
+        resp = getattr( self.service, f'update{ suffix }' )( **payload )
+
+        self._record( { 'kind': f'update:{ object_type }',
+            'inverse': [ f'update{ suffix }', { **identity, **restore } ] } )
+
+        return resp
+
+    def close( self ):
+
+        self.journal.close()
+
+def rollback( service, journal_file ):
+    """Revert all journaled requests; returns the number of failures"""
+
+    with open( journal_file ) as journal:
+        entries = [ json.loads( line ) for line in journal ]
+
+    failures = 0
+
+    def invert( request ):
+        operation, kwargs = request
+        getattr( service, operation )( **kwargs )
+
+    # An object can only depend on objects of kinds which appeared earlier in
+    # the job (lines before phones, phones before users...), so revert each
+    # kind in the reverse order of first appearance
+    kinds = list( dict.fromkeys( entry[ 'kind' ] for entry in entries ) )
+
+    with ThreadPoolExecutor( max_workers = MAX_WORKERS ) as executor:
+
+        for kind in reversed( kinds ):
+
+            requests = { }
+
+            for number, entry in enumerate( entries ):
+                if entry[ 'kind' ] != kind:
+                    continue
+                operation, kwargs = entry[ 'inverse' ]
+                if not operation.startswith( 'update' ):
+                    requests[ number ] = entry[ 'inverse' ]
+                    continue
+                # For objects updated more than once, the oldest prior value of
+                # each field is the one to restore, in a single request
+                identity = json.dumps( { key: kwargs[ key ] for key in IDENTITY_FIELDS if key in kwargs },
+                    sort_keys = True )
+                merged = requests.setdefault( identity, [ operation, { } ] )
+                for key, value in kwargs.items():
+                    merged[ 1 ].setdefault( key, value )
+
+            # Requests of the same kind are independent, so run them concurrently
+            futures = { executor.submit( invert, request ): request for request in requests.values() }
+
+            for future, request in futures.items():
+                try:
+                    future.result()
+                except Fault as err:
+                    failures += 1
+                    print( f'    Zeep error: { request[ 0 ] }: { err }' )
+
+            print( f'    Reverted { len( requests ) } x { kind }' )
+
+    if not failures:
+        os.remove( journal_file )
+
+    return failures
+
+# Roll back a previously interrupted job
+if len( sys.argv ) > 1 and sys.argv[ 1 ] == 'rollback':
+    print( f'\nRolling back { JOURNAL_FILE }...' )
+    sys.exit( 1 if rollback( service, JOURNAL_FILE ) else 0 )
+
+# The bulk job: lines, phones and users as in axlZeep.py, plus an update
+# associating each user with their phone/line
+executor = JournaledExecutor( service, JOURNAL_FILE )
+
+print( '\nRunning journaled job...' )
+
+try:
+
+    for seat in range( 1, SEAT_COUNT + 1 ):
+
+        pattern = f'987654334{ seat }'
+        phone_name = f'CSFUNDO{ seat }'
+        userid = f'testUndoUser{ seat }'
+
+        executor.add( 'line', { 'pattern': pattern, 'description': f'Undo test line { seat }',
+            'usage': 'Device', 'routePartitionName': None } )
+
+        executor.add( 'phone', {
+            'name': phone_name,
+            'product': 'Cisco Unified Client Services Framework',
+            'class': 'Phone',
+            'protocol': 'SIP',
+            'protocolSide': 'User',
+            'devicePoolName': 'Default',
+            'commonPhoneConfigName': 'Standard Common Phone Profile',
+            'locationName': 'Hub_None',
+            'useTrustedRelayPoint': 'Default',
+            'builtInBridgeStatus': 'Default',
+            'sipProfileName': 'Standard SIP Profile',
+            'packetCaptureMode': 'None',
+            'certificateOperation': 'No Pending Operation',
+            'deviceMobilityMode': 'Default',
+            'lines': { 'line': [ { 'index': 1, 'dirn': { 'pattern': pattern, 'routePartitionName': None } } ] }
+        } )
+
+        executor.add( 'user', { 'userid': userid, 'lastName': userid,
+            'presenceGroupName': 'Standard Presence group',
+            'associatedDevices': { 'device': [ phone_name ] } } )
+
+        executor.update( 'phone', name = phone_name, ownerUserName = userid,
+            description = f'Phone for { userid }' )
+
+        print( f'    Seat { seat }: OK' )
+
+    # Simulate a failure part way through the job: adding a duplicate line
+    executor.add( 'line', { 'pattern': '9876543341', 'usage': 'Device', 'routePartitionName': None } )
+
+except Fault as err:
+    print( f'\nZeep error: job failed: { err }' )
+
+finally:
+    executor.close()
+
+input( '\nPress Enter to roll back the job...' )
+
+print( '\nRolling back...' )
+
+failures = rollback( service, JOURNAL_FILE )
+
+print( f'\nRollback complete: { failures } failures' )
@@ -128,8 +128,6 @@ for node in resp[ 'return' ][ 'processNode' ]:
 
         continue
 
-    serviceParam[ 'processNodeName' ] = name
-
     # Execute updateServiceParameter for this Process Node
     try:
         resp = service.updateServiceParameter( 
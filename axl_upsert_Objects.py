@@ -0,0 +1,264 @@
+"""AXL idempotent upsert sample script, using the Zeep SOAP library
+
+Re-running provisioning jobs typically re-sends full add/update requests even
+when nothing has changed, and add requests fault if the object already
+exists.  This sample implements an 'upsert' over the add/get/update request
+pairs for Lines, End Users and Device Pools: the current state is retrieved
+with <returnedTags> limited to the desired fields, a field-level diff is
+computed, and then either the object is added, an update containing only the
+changed fields is sent, or no request is sent at all.
+
+Upserts a set of test objects three times (initial run, unchanged re-run, and
+a run with changes), then removes the objects.
+
+Copyright (c) 2026 Cisco and/or its affiliates.
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from lxml import etree
+from requests import Session
+from requests.auth import HTTPBasicAuth
+import sys
+import urllib3
+
+from zeep import Client, Settings, Plugin
+from zeep.transports import Transport
+from zeep.exceptions import Fault
+from zeep.helpers import serialize_object
+
+# Edit .env file to specify your CUCM address and AXL user details
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Change to true to enable output of request/response headers and XML
+DEBUG = False
+
+# The WSDL is a local file in the working directory, see README
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+# This class lets you view the incoming and outgoing http headers and XML
+
+class MyLoggingPlugin( Plugin ):
+
+    def egress( self, envelope, http_headers, operation, binding_options ):
+
+        # Format the request body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+    def ingress( self, envelope, http_headers, operation ):
+
+        # Format the response body as pretty printed XML
+        xml = etree.tostring( envelope, pretty_print = True, encoding = 'unicode')
+
+        print( f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}' )
+
+# The first step is to create a SOAP client session
+session = Session()
+
+# We avoid certificate verification by default
+# And disable insecure request warnings to keep the output clear
+session.verify = False
+urllib3.disable_warnings( urllib3.exceptions.InsecureRequestWarning )
+
+# To enable SSL cert checking (recommended for production)
+# place the CUCM Tomcat cert .pem file in the root of the project
+# and uncomment the line below
+
+# session.verify = 'changeme.pem'
+
+# Add Basic Auth credentials
+session.auth = HTTPBasicAuth( os.getenv( 'AXL_USERNAME' ), os.getenv( 'AXL_PASSWORD' ) )
+
+# Create a Zeep transport and set a reasonable timeout value
+transport = Transport( session = session, timeout = 10 )
+
+# strict=False is not always necessary, but it allows Zeep to parse imperfect XML
+settings = Settings( strict = False, xml_huge_tree = True )
+
+# If debug output is requested, add the MyLoggingPlugin callback
+plugin = [ MyLoggingPlugin() ] if DEBUG else [ ]
+
+# Create the Zeep client with the specified settings
+client = Client( WSDL_FILE, settings = settings, transport = transport,
+        plugins = plugin )
+
+# Create the Zeep service binding to AXL at the specified CUCM
+service = client.create_service( '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+                                f'https://{ os.getenv( "CUCM_ADDRESS" ) }:8443/axl/' )
+
+
+# Request names, key fields, and add-only fields (which are write-only, i.e.
+# never returned by get*, or cannot be updated) for each supported object type
+UPSERT_TYPES = {
+    'line': {
+        'add': 'addLine', 'get': 'getLine', 'update': 'updateLine',
+        'keys': [ 'pattern', 'routePartitionName' ],
+        'addOnly': [ 'usage' ]
+    },
+    'user': {
+        'add': 'addUser', 'get': 'getUser', 'update': 'updateUser',
+        'keys': [ 'userid' ],
+        'addOnly': [ 'password', 'pin' ]
+    },
+    'devicePool': {
+        'add': 'addDevicePool', 'get': 'getDevicePool', 'update': 'updateDevicePool',
+        'keys': [ 'name' ],
+        'addOnly': [ ]
+    }
+}
+
+# Equivalent spellings of AXL boolean values
+BOOLEANS = { 't': 'true', '1': 'true', 'f': 'false', '0': 'false' }
+
+def normalize( value ):
+    """Normalize a desired or current value for comparison"""
+
+    if isinstance( value, dict ):
+        # Reference fields (like devicePoolName) are returned with a uuid attribute
+        if '_value_1' in value:
+            return normalize( value[ '_value_1' ] )
+        return { key: normalize( item ) for key, item in value.items() if key != 'uuid' }
+    if isinstance( value, list ):
+        return [ normalize( item ) for item in value ]
+    if value is None or value == '':
+        return None
+    value = str( value ).lower() if isinstance( value, bool ) else str( value )
+    return BOOLEANS.get( value, value )
+
+def project( current, desired ):
+    """Reduce the current value to just the fields present in desired"""
+
+    if isinstance( desired, dict ) and isinstance( current, dict ):
+        return { key: project( current.get( key ), item ) for key, item in desired.items() }
+    if isinstance( desired, list ) and isinstance( current, list ):
+        return [ project( item, desired[ 0 ] ) if desired else item for item in current ]
+    return current
+
+def returned_tags( desired ):
+    """Build <returnedTags> requesting only the fields present in desired"""
+
+    if isinstance( desired, list ):
+        return returned_tags( desired[ 0 ] ) if desired and isinstance( desired[ 0 ], dict ) else ''
+    if isinstance( desired, dict ):
+        return { key: returned_tags( value ) for key, value in desired.items() }
+    return ''
+
+def diff( desired, current ):
+    """Return the top-level desired fields whose values differ from current
+
+    Nested structures are compared as a whole and sent in full when any part
+    differs, as AXL replaces (rather than merges) list elements on update.
+    """
+
+    return { field: value for field, value in desired.items()
+        if normalize( value ) != normalize( project( current.get( field ), value ) ) }
+
+def upsert( object_type, desired ):
+    """Add, update (changed fields only) or skip an object; returns ( action, fields )"""
+
+    spec = UPSERT_TYPES[ object_type ]
+    keys = { key: desired.get( key ) for key in spec[ 'keys' ] }
+    compared = { field: value for field, value in desired.items()
+        if field not in spec[ 'addOnly' ] and field not in spec[ 'keys' ] }
+
+    try:
+        resp = getattr( service, spec[ 'get' ] )( **keys, returnedTags = returned_tags( compared ) )
+    except Fault as err:
+        if 'not found' not in str( err ).lower():
+            raise
+        getattr( service, spec[ 'add' ] )( **{ object_type: desired } )
+        return 'added', list( desired )
+
+    current = serialize_object( resp[ 'return' ][ object_type ], dict )
+    changes = diff( compared, current )
+
+    if not changes:
+        return 'unchanged', [ ]
+
+    getattr( service, spec[ 'update' ] )( **keys, **changes )
+    return 'updated', list( changes )
+
+def converge( desired_state ):
+
+    for object_type, desired in desired_state:
+        try:
+            action, fields = upsert( object_type, desired )
+        except Fault as err:
+            print( f'Zeep error: upsert { object_type }: { err }' )
+            sys.exit( 1 )
+        name = '/'.join( str( desired.get( key ) ) for key in UPSERT_TYPES[ object_type ][ 'keys' ] )
+        print( f'    { object_type.ljust( 10 ) } { name.ljust( 25 ) } { action.ljust( 9 ) } { ", ".join( fields ) }' )
+
+# The desired state of the test objects
+desired_state = [
+    ( 'devicePool', {
+        'name': 'testUpsertDevicePool',
+        'dateTimeSettingName': 'CMLocal',
+        'callManagerGroupName': 'Default',
+        'regionName': 'Default',
+        'srstName': 'Disable'
+    } ),
+    ( 'line', {
+        'pattern': '9876543321',
+        'routePartitionName': None,
+        'description': 'Upsert test line',
+        'alertingName': 'Upsert Test',
+        'usage': 'Device'
+    } ),
+    ( 'user', {
+        'userid': 'testUpsertUser',
+        'firstName': 'Upsert',
+        'lastName': 'Test',
+        'password': 'C1sco12345',
+        'pin': '123456',
+        'presenceGroupName': 'Standard Presence group',
+        'enableCti': 'true'
+    } )
+]
+
+print( '\nInitial run:' )
+converge( desired_state )
+
+input( '\nPress Enter to continue...' )
+
+print( '\nRe-run with no changes (no add/update requests sent):' )
+converge( desired_state )
+
+input( '\nPress Enter to continue...' )
+
+desired_state[ 1 ][ 1 ][ 'description' ] = 'Upsert test line (changed)'
+desired_state[ 2 ][ 1 ][ 'enableCti' ] = 'false'
+
+print( '\nRe-run with changes (only changed fields sent):' )
+converge( desired_state )
+
+input( '\nPress Enter to continue...' )
+
+# Cleanup the objects we just created
+
+try:
+    service.removeUser( userid = 'testUpsertUser' )
+    service.removeLine( pattern = '9876543321', routePartitionName = None )
+    service.removeDevicePool( name = 'testUpsertDevicePool' )
+except Fault as err:
+    print( f'Zeep error: cleanup: { err }' )
+    sys.exit( 1 )
+
+print( '\nCleanup: SUCCESS' )